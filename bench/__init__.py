@@ -0,0 +1,18 @@
+"""Catcher performans ölçüm takımı.
+
+İki katman vardır:
+
+* ``bench.micro``: kayıtlı HTML örnekleri (``bench/fixtures``) üzerinde sayfa başına çıkarım
+  aşamaları (analiz, ürün çıkarımı, hızlı yol, liste linkleri) her kurulu ayrıştırıcı için ölçülür.
+* ``bench.e2e``: ``bench.mockshop`` yerel sahte mağazasına karşı uçtan uca kategori işleri, her
+  motor için ayrı bir alt süreçte koşar (CPU ve tepe bellek o sürece aittir).
+
+Sonuçlar sayfa/sn, sayfa başına CPU ve tepe bellek olarak raporlanır; ``bench/baseline.json`` ile
+karşılaştırılır. Kullanım (depo kökünden)::
+
+    python -m bench                    # hepsi, baseline ile karşılaştır
+    python -m bench micro --quick
+    python -m bench e2e --json out.json
+    python -m bench --update-baseline  # ölçümü yeni baseline yap
+    python -m bench.mockshop --port 8800 --latency 50 --error-rate 0.05
+"""
@@ -0,0 +1,7 @@
+import sys
+
+from bench.runner import main
+
+# e2e alt süreçleri catcher'ı ayrıca başlatır; modül yeniden içe aktarılırsa koşmasın
+if __name__ == "__main__":
+    sys.exit(main())
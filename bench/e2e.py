@@ -0,0 +1,79 @@
+"""Uçtan uca kategori ölçümleri (yerel sahte mağazaya karşı).
+
+Her senaryo `python -m catcher` olarak ayrı bir alt süreçte koşar; CPU (user+sys) ve tepe RSS
+`os.wait4` ile yalnızca o süreçten okunur, sunucunun maliyeti karışmaz. Aşama dökümü için önce
+yalnızca keşif (`--links-only`) koşulur: motor koşusunun CPU'sundan bu düşülünce kalan tarama
+(indirme + ayrıştırma + yazma) aşamasıdır. Hız sınırı ve önbellek kapalıdır; ölçülen motorun
+kendisidir.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Sequence
+
+from bench.mockshop import MockShop, ShopConfig
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENGINES = ("async", "threads")
+
+Result = Dict[str, float]
+
+
+def run_child(args: List[str], stdout_path: str) -> Result:
+    """`python -m catcher args` koşar; duvar süresi, CPU ve tepe RSS döndürür."""
+    with open(stdout_path, "wb") as out:
+        t0 = time.perf_counter()
+        proc = subprocess.Popen([sys.executable, "-m", "catcher", *args], cwd=REPO_ROOT,
+                                stdout=out, stderr=subprocess.DEVNULL)
+        _, status, usage = os.wait4(proc.pid, 0)
+        wall = time.perf_counter() - t0
+    proc.returncode = os.waitstatus_to_exitcode(status)  # Popen bir daha beklemesin
+    return {"wall_s": wall, "cpu_s": usage.ru_utime + usage.ru_stime, "peak_rss_kb": float(usage.ru_maxrss),
+            "exit": float(proc.returncode)}
+
+
+def count_lines(path: str) -> int:
+    if not os.path.exists(path):
+        return 0
+    with open(path, "rb") as fh:
+        return sum(1 for _ in fh)
+
+
+def run(cfg: ShopConfig, engines: Sequence[str] = ENGINES, extra: Sequence[str] = (),
+        log: Callable[[str], None] = print) -> Dict[str, Result]:
+    results: Dict[str, Result] = {}
+    with MockShop(cfg) as shop, tempfile.TemporaryDirectory(prefix="catcher-bench-") as tmp:
+        base = ["-c", shop.category_url, "--max-pages", str(cfg.pages + 2), "--max-products", "1000000",
+                "--cache", "off", "--rate", "0", "-q", *extra]
+
+        shop.reset_stats()
+        links_out = os.path.join(tmp, "links.txt")
+        crawl = run_child([*base, "--links-only"], links_out)
+        pages = shop.stats.get("category_pages", 0)
+        crawl.update(pages_per_sec=pages / crawl["wall_s"], cpu_ms=crawl["cpu_s"] * 1000 / max(1, pages),
+                     products=float(count_lines(links_out)), requests=float(shop.stats.get("requests", 0)))
+        results["e2e/category/links"] = crawl
+        log(f"  e2e/category/links: {crawl['products']:.0f} link, {crawl['pages_per_sec']:.1f} liste sayfası/sn")
+
+        for engine in engines:
+            shop.reset_stats()
+            out = os.path.join(tmp, f"{engine}.jsonl")
+            res = run_child([*base, "--engine", engine, "--format", "jsonl", "-o", out], os.devnull)
+            rows = count_lines(out)
+            res.update(
+                rows=float(rows),
+                requests=float(shop.stats.get("requests", 0)),
+                errors_served=float(shop.stats.get("status_500", 0) + shop.stats.get("status_429", 0)),
+                pages_per_sec=rows / res["wall_s"],
+                cpu_ms=res["cpu_s"] * 1000 / max(1, rows),
+                # aşama dökümü: keşif ayrı koşudan, kalan CPU tarama aşamasına
+                crawl_cpu_s=crawl["cpu_s"],
+                scrape_cpu_s=max(0.0, res["cpu_s"] - crawl["cpu_s"]),
+            )
+            results[f"e2e/category/{engine}"] = res
+            log(f"  e2e/category/{engine}: {rows} satır, {res['pages_per_sec']:.1f} ürün/sn, "
+                f"{res['cpu_ms']:.2f} ms CPU/ürün")
+    return results
@@ -0,0 +1,94 @@
+"""Sayfa başına çıkarım ölçümleri (kayıtlı HTML örnekleri üzerinde).
+
+Her örnek × kurulu ayrıştırıcı × aşama için fonksiyon en az `min_time` saniye tekrar koşulur;
+sayfa/sn duvar saatinden, sayfa başına CPU `process_time`'dan hesaplanır. Tepe bellek ayrı, tek
+bir çağrıda `tracemalloc` ile ölçülür (Python yığını; lxml/lexbor'un C tarafı dahil değildir).
+"""
+
+import glob
+import os
+import time
+import tracemalloc
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
+
+from bench.mockshop import FIXTURE_DIR
+from catcher.analysis import analyze_html
+from catcher.config import FAST_PATH_FIELDS
+from catcher.extract import extract_product, infer_colors, infer_material, infer_sizes
+from catcher.links import domain_from, filter_links, parse_listing
+from catcher.parsing import decode_html, parser_available
+
+PARSERS = ("html.parser", "lxml", "selectolax")
+PRODUCT_URL = "https://shop.example/products/ornek-urun-1001"
+CATEGORY_URL = "https://shop.example/collections/elbise"
+
+Result = Dict[str, float]
+
+
+def installed_parsers(names: Sequence[str] = PARSERS) -> List[str]:
+    return [p for p in names if parser_available(p)]
+
+
+def load_fixtures(prefix: str) -> List[Tuple[str, bytes]]:
+    out = []
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, f"{prefix}_*.html"))):
+        with open(path, "rb") as fh:
+            out.append((os.path.splitext(os.path.basename(path))[0], fh.read()))
+    return out
+
+
+def measure(fn: Callable[[], object], min_time: float = 0.3, max_reps: int = 5000) -> Result:
+    fn()  # ısınma: tembel içe aktarmalar, lru_cache'ler, derlenen regex'ler
+    reps = 0
+    cpu0, wall0 = time.process_time(), time.perf_counter()
+    while True:
+        fn()
+        reps += 1
+        wall = time.perf_counter() - wall0
+        if wall >= min_time or reps >= max_reps:
+            break
+    cpu = time.process_time() - cpu0
+    tracemalloc.start()
+    try:
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"pages_per_sec": reps / wall, "cpu_ms": cpu * 1000 / reps, "peak_kb": peak / 1024, "reps": reps}
+
+
+def product_stages(body: bytes, parser: str) -> Iterator[Tuple[str, Callable[[], object]]]:
+    html = decode_html(body)
+    text = analyze_html(html, parser).text_blob
+    yield "decode", lambda: decode_html(body)
+    yield "analyze", lambda: analyze_html(html, parser)
+    yield "infer", lambda: (infer_colors(text), infer_sizes(text), infer_material(text))
+    yield "extract", lambda: extract_product(PRODUCT_URL, html, parser)
+    yield "extract_fast", lambda: extract_product(PRODUCT_URL, html, parser, FAST_PATH_FIELDS)
+
+
+def category_stages(body: bytes, parser: str) -> Iterator[Tuple[str, Callable[[], object]]]:
+    html = decode_html(body)
+    links = parse_listing(html, CATEGORY_URL, parser).links
+    dom = domain_from(CATEGORY_URL)
+    yield "listing", lambda: parse_listing(html, CATEGORY_URL, parser)
+    yield "filter", lambda: filter_links(links, dom, "", "")
+
+
+def run(parsers: Sequence[str] = PARSERS, min_time: float = 0.3, log: Callable[[str], None] = print) -> Dict[str, Result]:
+    results: Dict[str, Result] = {}
+    suites = (("product", product_stages), ("category", category_stages))
+    for parser in installed_parsers(parsers):
+        for prefix, stages in suites:
+            for name, body in load_fixtures(prefix):
+                for stage, fn in stages(body, parser):
+                    # ayrıştırıcıdan bağımsız aşamalar bir kez ölçülür
+                    if stage in ("decode", "infer", "filter"):
+                        key = f"micro/{name}/{stage}"
+                        if key in results:
+                            continue
+                    else:
+                        key = f"micro/{name}/{parser}/{stage}"
+                    results[key] = measure(fn, min_time)
+                    log(f"  {key}: {results[key]['pages_per_sec']:.1f} sayfa/sn")
+    return results
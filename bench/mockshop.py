@@ -0,0 +1,220 @@
+"""Yerel sahte mağaza: sayfalı kategori, ürün sayfaları, gecikme ve hata benzetimi.
+
+Kategori sayfaları Shopify benzeri bir ızgara olarak üretilir (başlık/menü/altbilgi linkleri,
+rel=next + numaralı sayfalama); ürün sayfaları ``bench/fixtures/product_*.html`` örneklerinden sırayla
+verilir. Gecikme ve hatalar yola göre belirlenimlidir (aynı tohumla her koşuda aynı yollar yavaş
+ya da hatalı): hatalı seçilen bir yolun yalnızca ilk isteği 500 (ya da 429 + Retry-After) döner,
+yeniden deneme başarılı olur. Sayaçlar ``/__stats`` altında JSON olarak okunur.
+"""
+
+import argparse
+import glob
+import json
+import os
+import random
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Set
+from urllib.parse import parse_qs, urlsplit
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+CATEGORY_PATH = "/collections/elbise"
+
+
+@dataclass
+class ShopConfig:
+    pages: int = 8            # kategori sayfası
+    per_page: int = 24        # sayfa başına ürün
+    latency_ms: float = 20.0  # yanıt başına ortalama gecikme
+    jitter_ms: float = 10.0   # gecikmeye eklenen ±sapma
+    error_rate: float = 0.0   # ilk isteği 500 dönen yol oranı
+    throttle_rate: float = 0.0  # ilk isteği 429 (Retry-After: 1) dönen yol oranı
+    seed: int = 17
+
+
+def load_products() -> List[bytes]:
+    out = []
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, "product_*.html"))):
+        with open(path, "rb") as fh:
+            out.append(fh.read())
+    return out
+
+
+def category_page(page: int, cfg: ShopConfig) -> bytes:
+    if page > cfg.pages:
+        return b"<html><body><main id='MainContent'><div class='grid'></div></main></body></html>"
+    items = "".join(
+        f'<div class="grid__item grid-product"><a href="{CATEGORY_PATH}/products/urun-{page}-{i}-midi-elbise" '
+        f'class="grid-product__link"><img src="/cdn/{page}-{i}_360x.jpg" alt=""><div class="grid-product__title">'
+        f'Elbise {page}-{i}</div></a><a href="{CATEGORY_PATH}/products/urun-{page}-{i}-midi-elbise?variant={i}">'
+        f'Hızlı bak</a></div>'
+        for i in range(cfg.per_page)
+    )
+    nums = "".join(f'<a href="{CATEGORY_PATH}?page={k}">{k}</a>' for k in range(1, cfg.pages + 1) if k != page)
+    nxt = f'<a rel="next" href="{CATEGORY_PATH}?page={page + 1}">Sonraki</a>' if page < cfg.pages else ""
+    menu = "".join(f'<li><a href="/collections/kat-{k}">Kategori {k}</a></li>' for k in range(40))
+    html = (
+        "<!doctype html><html lang='tr'><head><meta charset='utf-8'><title>Elbise</title></head><body>"
+        f"<header class='site-header'><a href='/products/kampanya-ust-2024'>Kampanya</a></header><nav><ul>{menu}</ul></nav>"
+        f"<main id='MainContent'><div class='grid grid--uniform'>{items}</div>"
+        f"<div class='pagination'>{nums}{nxt}</div></main>"
+        "<footer><a href='/products/hediye-karti-100'>Hediye kartı</a></footer></body></html>"
+    )
+    return html.encode("utf-8")
+
+
+class MockShop:
+    """Arka plan thread'inde çalışan sunucu; ``with MockShop(cfg) as shop: shop.url``."""
+
+    def __init__(self, cfg: Optional[ShopConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.cfg = cfg or ShopConfig()
+        self.products = load_products()
+        self.stats: Dict[str, int] = {}
+        self._failed: Set[str] = set()
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+        self.server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def category_url(self) -> str:
+        return self.url + CATEGORY_PATH
+
+    def count(self, key: str, n: int = 1) -> None:
+        with self._lock:
+            self.stats[key] = self.stats.get(key, 0) + n
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.stats.clear()
+            self._failed.clear()
+
+    def roll(self, path: str, salt: str) -> float:
+        # yol + tohum -> [0, 1): her koşuda aynı yollar seçilir
+        return zlib.crc32(f"{self.cfg.seed}:{salt}:{path}".encode()) / 2 ** 32
+
+    def first_failure(self, path: str) -> Optional[int]:
+        cfg = self.cfg
+        if cfg.error_rate <= 0 and cfg.throttle_rate <= 0:
+            return None
+        with self._lock:
+            if path in self._failed:
+                return None
+            status = None
+            if self.roll(path, "error") < cfg.error_rate:
+                status = 500
+            elif self.roll(path, "throttle") < cfg.throttle_rate:
+                status = 429
+            if status is not None:
+                self._failed.add(path)
+            return status
+
+    def delay(self, path: str) -> float:
+        cfg = self.cfg
+        if cfg.latency_ms <= 0:
+            return 0.0
+        rnd = random.Random(zlib.crc32(f"{cfg.seed}:delay:{path}".encode()))
+        return max(0.0, cfg.latency_ms + rnd.uniform(-cfg.jitter_ms, cfg.jitter_ms)) / 1000.0
+
+    def _handler(self):
+        shop = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def reply(self, status: int, body: bytes = b"", ctype: str = "text/html; charset=utf-8",
+                      headers: Optional[Dict[str, str]] = None) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Length", str(len(body)))
+                for k, v in (headers or {}).items():
+                    self.send_header(k, v)
+                self.end_headers()
+                self.wfile.write(body)
+                shop.count(f"status_{status}")
+                shop.count("bytes", len(body))
+
+            def do_GET(self) -> None:
+                parts = urlsplit(self.path)
+                path = parts.path
+                if path == "/__stats":
+                    with shop._lock:
+                        body = json.dumps(shop.stats).encode()
+                    self.reply(200, body, "application/json")
+                    return
+                shop.count("requests")
+                if path == "/robots.txt":
+                    self.reply(404)
+                    return
+                time.sleep(shop.delay(self.path))
+                failure = shop.first_failure(self.path)
+                if failure == 500:
+                    self.reply(500, "<html><body>Sunucu hatası</body></html>".encode())
+                    return
+                if failure == 429:
+                    self.reply(429, b"", headers={"Retry-After": "1"})
+                    return
+                if path == CATEGORY_PATH:
+                    page = int((parse_qs(parts.query).get("page") or ["1"])[0] or 1)
+                    shop.count("category_pages")
+                    self.reply(200, category_page(page, shop.cfg))
+                elif "/products/" in path:
+                    shop.count("product_pages")
+                    self.reply(200, shop.products[zlib.crc32(path.encode()) % len(shop.products)])
+                else:
+                    self.reply(404)
+
+        return Handler
+
+    def start(self) -> "MockShop":
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> "MockShop":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(prog="bench.mockshop", description="Yerel sahte mağaza")
+    p.add_argument("--port", type=int, default=8800)
+    p.add_argument("--pages", type=int, default=ShopConfig.pages)
+    p.add_argument("--per-page", type=int, default=ShopConfig.per_page)
+    p.add_argument("--latency", type=float, default=ShopConfig.latency_ms, help="ortalama gecikme (ms)")
+    p.add_argument("--jitter", type=float, default=ShopConfig.jitter_ms, help="gecikme sapması (ms)")
+    p.add_argument("--error-rate", type=float, default=0.0, help="ilk isteği 500 dönen yol oranı")
+    p.add_argument("--throttle-rate", type=float, default=0.0, help="ilk isteği 429 dönen yol oranı")
+    p.add_argument("--seed", type=int, default=ShopConfig.seed)
+    args = p.parse_args(argv)
+    cfg = ShopConfig(args.pages, args.per_page, args.latency, args.jitter, args.error_rate, args.throttle_rate, args.seed)
+    shop = MockShop(cfg, port=args.port)
+    print(f"Kategori: {shop.category_url}  (sayaçlar: {shop.url}/__stats)", flush=True)
+    try:
+        shop.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        shop.server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
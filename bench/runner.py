@@ -0,0 +1,134 @@
+"""Ölçüm takımı komut satırı: koşar, raporlar, baseline ile karşılaştırır."""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from bench import e2e, micro
+from bench.mockshop import ShopConfig
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_THRESHOLD = 0.15
+
+# metrik -> iyi yön (+1: büyük iyi, -1: küçük iyi); diğer alanlar yalnızca bilgi amaçlı
+METRICS = {"pages_per_sec": +1, "cpu_ms": -1, "peak_kb": -1, "peak_rss_kb": -1}
+
+Results = Dict[str, Dict[str, float]]
+
+
+def environment() -> Dict[str, Any]:
+    from catcher.parsing import parser_available
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "parsers": [p for p in micro.PARSERS if parser_available(p)],
+        "date": time.strftime("%Y-%m-%d"),
+    }
+
+
+def compare(current: Results, baseline: Results, threshold: float) -> List[Dict[str, Any]]:
+    """Ortak her ölçüm için değişim oranı; `regressed` iyi yönün tersine eşikten fazla sapmadır."""
+    rows = []
+    for name in sorted(current):
+        base = baseline.get(name)
+        if not base:
+            continue
+        for metric, direction in METRICS.items():
+            new, old = current[name].get(metric), base.get(metric)
+            if new is None or not old:
+                continue
+            change = (new - old) / old
+            rows.append({"name": name, "metric": metric, "old": old, "new": new, "change": change,
+                         "regressed": change * direction < -threshold})
+    return rows
+
+
+def print_results(results: Results) -> None:
+    print(f"\n{'ölçüm':<52} {'sayfa/sn':>10} {'CPU ms':>9} {'tepe':>10}")
+    for name in sorted(results):
+        r = results[name]
+        peak = r.get("peak_rss_kb", r.get("peak_kb", 0.0))
+        unit = "KB RSS" if "peak_rss_kb" in r else "KB"
+        print(f"{name:<52} {r['pages_per_sec']:>10.1f} {r['cpu_ms']:>9.2f} {peak:>7.0f} {unit}")
+        if "scrape_cpu_s" in r:
+            print(f"{'':<52}   aşamalar: keşif {r['crawl_cpu_s']:.2f}s + tarama {r['scrape_cpu_s']:.2f}s CPU")
+
+
+def print_comparison(rows: List[Dict[str, Any]], threshold: float) -> int:
+    regressions = [r for r in rows if r["regressed"]]
+    print(f"\nBaseline karşılaştırması (eşik ±%{threshold * 100:.0f}):")
+    for r in rows:
+        mark = "GERİLEME" if r["regressed"] else ""
+        print(f"  {r['name']:<52} {r['metric']:<14} {r['old']:>10.2f} -> {r['new']:>10.2f} "
+              f"({r['change'] * 100:+6.1f}%) {mark}")
+    print(f"{len(regressions)} gerileme, {len(rows)} karşılaştırma")
+    return len(regressions)
+
+
+def load_baseline(path: str) -> Optional[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def save(path: str, results: Results) -> None:
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump({"env": environment(), "results": results}, fh, indent=1, sort_keys=True)
+        fh.write("\n")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(prog="bench", description="Catcher performans ölçüm takımı")
+    p.add_argument("suite", nargs="?", choices=("all", "micro", "e2e"), default="all")
+    p.add_argument("--quick", action="store_true", help="Kısa koşu (duman testi; sayılar gürültülü)")
+    p.add_argument("--parser", dest="parsers", action="append", choices=micro.PARSERS,
+                   help="micro: yalnızca bu ayrıştırıcı (tekrarlanabilir)")
+    p.add_argument("--engine", dest="engines", action="append", choices=e2e.ENGINES,
+                   help="e2e: yalnızca bu motor (tekrarlanabilir)")
+    p.add_argument("--pages", type=int, help="e2e: kategori sayfası")
+    p.add_argument("--latency", type=float, default=ShopConfig.latency_ms, help="e2e: yanıt gecikmesi (ms)")
+    p.add_argument("--error-rate", type=float, default=0.03, help="e2e: ilk isteği 500 dönen yol oranı")
+    p.add_argument("--json", metavar="YOL", help="Sonuçları JSON olarak yaz")
+    p.add_argument("--baseline", default=BASELINE_PATH, help="Karşılaştırılacak baseline")
+    p.add_argument("--update-baseline", action="store_true", help="Sonuçları baseline olarak kaydet")
+    p.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Gerileme eşiği (oran)")
+    p.add_argument("--strict", action="store_true", help="Gerileme varsa çıkış kodu 1")
+    return p
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    results: Results = {}
+    if args.suite in ("all", "micro"):
+        print("Mikro ölçümler (sayfa başına çıkarım):", flush=True)
+        results.update(micro.run(args.parsers or micro.PARSERS, 0.05 if args.quick else 0.5))
+    if args.suite in ("all", "e2e"):
+        cfg = ShopConfig(pages=args.pages or (2 if args.quick else 8), latency_ms=args.latency,
+                         jitter_ms=args.latency / 2, error_rate=args.error_rate)
+        print(f"Uçtan uca ölçümler ({cfg.pages} sayfa × {cfg.per_page} ürün, {cfg.latency_ms:.0f} ms gecikme):",
+              flush=True)
+        results.update(e2e.run(cfg, args.engines or e2e.ENGINES))
+
+    print_results(results)
+    if args.json:
+        save(args.json, results)
+    if args.update_baseline:
+        save(args.baseline, results)
+        print(f"\nBaseline güncellendi: {args.baseline}")
+        return 0
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print(f"\nBaseline yok ({args.baseline}); --update-baseline ile oluşturun.")
+        return 0
+    regressions = print_comparison(compare(results, baseline["results"], args.threshold), args.threshold)
+    return 1 if regressions and args.strict else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
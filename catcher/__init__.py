@@ -0,0 +1,24 @@
+"""Catcher — ürün sayfalarından başlık/fiyat/renk/ölçü/materyal/görsel toplayıcı.
+
+Motor tkinter'a dokunmaz; GUI için ``catcher.gui``, komut satırı için ``python -m catcher``.
+"""
+
+from catcher.cancel import CancelToken
+from catcher.config import APP_NAME, OUTPUT_DIR
+from catcher.crawl import extract_product_links_from_category
+from catcher.engine import JobResult, collect_links, run_job, scrape_urls
+from catcher.export import export_products
+from catcher.extract import scrape_product
+from catcher.fetch import fetch_html
+from catcher.models import Product
+from catcher.options import JobOptions
+from catcher.scheduler import SiteJob, run_jobs
+from catcher.sitemap import extract_product_links_from_sitemap
+
+__all__ = [
+    "APP_NAME", "OUTPUT_DIR",
+    "CancelToken", "JobOptions", "JobResult", "Product", "SiteJob",
+    "collect_links", "export_products", "extract_product_links_from_category",
+    "extract_product_links_from_sitemap",
+    "fetch_html", "run_job", "run_jobs", "scrape_product", "scrape_urls",
+]
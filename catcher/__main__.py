@@ -0,0 +1,7 @@
+import sys
+
+from catcher.cli import main
+
+# Süreç havuzu (spawn) alt süreçlerde bu modülü yeniden içe aktarır; koruma şart.
+if __name__ == "__main__":
+    sys.exit(main())
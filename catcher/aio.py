@@ -0,0 +1,290 @@
+"""Asyncio tarama motoru (aiohttp).
+
+Tek bir `ClientSession` üzerinde yüzlerce istek aynı anda uçuşta olabilir; bağlantılar
+keep-alive ile host başına havuzlanır, gzip/deflate yanıtlar otomatik açılır. Ayrıştırma
+CPU işi olduğu için event loop'u bloklamasın diye küçük bir thread havuzunda, ya da
+`parse_processes` verilmişse `ProcessParseStage` üzerinden süreçlerde yürür. Satırlar da (`run.emit`)
+aynı havuzda yazılır: görsel kuyruğu dolduğunda bekleyen loop değil havuzdur ve tarama yavaşlar.
+
+İş durunca (`run.stopped`) üretici yeni URL almaz, kuyruktakiler atılır; `url_timeout` her URL'nin
+indirmesini (yeniden denemeler dahil) sınırlar.
+
+aiohttp kurulu değilse `available()` False döner ve motor thread yoluna düşer.
+"""
+
+import asyncio
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from itertools import islice
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from catcher.cache import HttpCache
+from catcher.config import DEFAULT_CONCURRENCY, DEFAULT_PER_HOST, HEADERS, MAX_RETRIES, READ_CHUNK, REQ_TIMEOUT
+from catcher.crawl import CategoryCrawl
+from catcher.extract import error_product, extract_product, failed_product, head_check
+from catcher.fetch import HEAD, LIMIT, BodyReader, HeadCheck, RawPage, get_body_limit, get_cache, get_limiter
+from catcher.metrics import count, record_response, record_retry, timer
+from catcher.models import Product
+from catcher.monitor import monitoring, unchanged_product
+from catcher.options import JobOptions
+from catcher.parsing import decode_html
+from catcher.profiles import learned_fast
+from catcher.procpool import ProcessParseStage
+from catcher.run import JobRun
+from catcher.throttle import FATAL, OK, RateLimiter, backoff_delay, classify, response_retry_after, robots_delay, robots_url
+
+PARSE_THREADS = 4
+PULL_BATCH = 64  # engelleyen kaynaktan (site haritası) tek seferde çekilen URL
+
+
+def available() -> bool:
+    try:
+        import aiohttp  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class AsyncFetcher:
+    def __init__(self, concurrency: int = DEFAULT_CONCURRENCY, per_host: int = DEFAULT_PER_HOST,
+                 cache: Optional[HttpCache] = None, limiter: Optional[RateLimiter] = None):
+        self.concurrency = max(1, concurrency)
+        self.per_host = max(1, per_host)
+        self.cache = cache
+        self.limiter = limiter
+        self.session: Any = None
+
+    async def __aenter__(self) -> "AsyncFetcher":
+        import aiohttp
+        connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.per_host, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(sock_connect=REQ_TIMEOUT[0], sock_read=REQ_TIMEOUT[1])
+        self.session = aiohttp.ClientSession(connector=connector, timeout=timeout, headers=HEADERS, auto_decompress=True)
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.session.close()
+
+    async def _read_body(self, resp: Any, stop: Optional[HeadCheck]) -> Tuple[Optional[RawPage], bool]:
+        reader = BodyReader(get_body_limit(), stop is not None)
+        async for chunk in resp.content.iter_chunked(READ_CHUNK):
+            state = reader.feed(chunk)
+            if state == LIMIT:
+                break
+            # head ayrıştırması kısa ama CPU işi; event loop'u tutmasın
+            if state == HEAD and await asyncio.to_thread(stop, decode_html(bytes(reader.buf), resp.charset)):
+                reader.complete = False
+                break
+        return reader.page(resp.charset), reader.complete
+
+    async def _get(self, url: str, extra_headers: Optional[Dict[str, str]],
+                   stop: Optional[HeadCheck] = None) -> Tuple[int, Optional[RawPage], Any, bool]:
+        limiter = self.limiter
+        if limiter is not None and limiter.claim_robots(url):
+            await self._read_robots(limiter, url)
+        for attempt in range(MAX_RETRIES + 1):
+            if limiter is not None:
+                with timer("wait"):
+                    await limiter.acquire_async(url)
+            status, page, headers, complete, error = None, None, None, True, None
+            t0 = time.perf_counter()
+            try:
+                async with self.session.get(url, headers=extra_headers) as resp:
+                    status, headers = resp.status, resp.headers
+                    if status == 200:
+                        page, complete = await self._read_body(resp, stop)
+            except Exception as e:
+                error = e
+            record_response(url, status, len(page[0]) if page else 0, time.perf_counter() - t0)
+            verdict = classify(status, page is not None, error, bool(extra_headers))
+            retry_after = response_retry_after(headers)
+            if limiter is not None:
+                limiter.feedback(url, verdict, retry_after)
+                retry_after = None
+            if verdict == OK:
+                return status, page, headers, complete
+            # kalıcı hata ya da son deneme: beklemeden dön
+            if verdict == FATAL or attempt == MAX_RETRIES:
+                break
+            record_retry(url, verdict)
+            await asyncio.sleep(max(backoff_delay(attempt), retry_after or 0.0))
+        return 0, None, None, True
+
+    async def _read_robots(self, limiter: RateLimiter, url: str) -> None:
+        try:
+            async with self.session.get(robots_url(url)) as resp:
+                if resp.status == 200:
+                    delay = robots_delay(await resp.text(errors="replace"))
+                    if delay:
+                        limiter.set_crawl_delay(url, delay)
+        except Exception:
+            pass
+        finally:
+            limiter.robots_done(url)
+
+    async def fetch_raw(self, url: str, stop: Optional[HeadCheck] = None) -> Optional[RawPage]:
+        cache = self.cache
+        hit, extra = None, None
+        if cache is not None:
+            hit, page, extra = await asyncio.to_thread(cache.before, url)
+            if page is not None or cache.offline:
+                count("cache_hits" if page is not None else "cache_misses")
+                return page
+        status, page, headers, complete = await self._get(url, extra, stop)
+        if not status:
+            return None
+        if cache is not None and complete:
+            page = await asyncio.to_thread(cache.after, url, hit, status, page, headers)
+        return page
+
+    async def fetch_html(self, url: str, stop: Optional[HeadCheck] = None) -> Optional[str]:
+        raw = await self.fetch_raw(url, stop)
+        if not raw:
+            return None
+        with timer("decode"):
+            return decode_html(*raw)
+
+
+UrlSource = Callable[[AsyncFetcher, Executor], AsyncIterator[str]]
+
+
+async def _within(fetch: Awaitable[Any], seconds: float) -> Any:
+    """URL indirmesi (yeniden denemeler dahil) `seconds` içinde bitmezse kesilir ve None döner; 0 = sınırsız."""
+    try:
+        return await asyncio.wait_for(fetch, seconds or None)
+    except asyncio.TimeoutError:
+        count("url_timeouts")
+        return None
+
+
+async def _pipeline(source: UrlSource, n_workers: int, opts: JobOptions, run: JobRun) -> None:
+    loop = asyncio.get_running_loop()
+    n_workers = max(1, n_workers)
+    parser = opts.parser
+    fast = tuple(opts.fast_fields)
+    # Sınırlı kuyruk: keşif hızlıysa üretici bekler, bellek sabit kalır.
+    q: asyncio.Queue = asyncio.Queue(maxsize=n_workers * 2)
+    def emit(prod: Product) -> None:
+        try:
+            run.emit(prod)
+        except Exception as e:
+            # yazma hatası (günlük / izleme sqlite'ı, ölçüm dosyası) da worker'ı (gather'ı) düşürmesin
+            count("emit_errors", error=type(e).__name__)
+
+    stage = None
+    if opts.parse_processes > 0:
+        stage = ProcessParseStage(opts.parse_processes, emit, opts.parse_batch, parser, fast)
+
+    def parse_emit(url: str, html: str, url_fast: Tuple[str, ...]) -> None:
+        try:
+            prod = extract_product(url, html, parser, url_fast)
+        except Exception as e:
+            # tek bozuk sayfa gather'ı (bütün işi) düşürmesin; hata satıra yazılır
+            prod = error_product(url, e)
+        emit(prod)
+
+    try:
+        with ThreadPoolExecutor(max_workers=PARSE_THREADS) as parse_pool:
+            async with AsyncFetcher(opts.concurrency, opts.per_host, get_cache(), get_limiter()) as fetcher:
+                async def producer() -> None:
+                    try:
+                        async for url in source(fetcher, parse_pool):
+                            if run.stopped:
+                                break
+                            if run.admit(url):
+                                await q.put(url)
+                        run.discovery_done()
+                    finally:
+                        for _ in range(n_workers):
+                            await q.put(None)
+
+                async def worker() -> None:
+                    while (url := await q.get()) is not None:
+                        if run.stopped:
+                            run.drop(url)
+                            continue
+                        try:
+                            if stage is not None:
+                                await to_stage(url)
+                                continue
+                            url_fast = fast or learned_fast(url)
+                            html = await _within(fetcher.fetch_html(url, head_check(url, parser, url_fast)),
+                                                 opts.url_timeout)
+                        except Exception as e:
+                            # önbellek / profil sqlite'ı, HEAD denetimi: tek URL'nin hatası gather'ı düşürmesin
+                            emit(error_product(url, e))
+                            continue
+                        if not html:
+                            emit(failed_product(url))
+                            continue
+                        await loop.run_in_executor(parse_pool, parse_emit, url, html, url_fast)
+
+                async def to_stage(url: str) -> None:
+                    # ayrıştırma süreçlerinde site profili yok: yalnızca --fast alanları
+                    stop = head_check(url, parser, fast)
+                    raw = await _within(fetcher.fetch_raw(url, stop), opts.url_timeout)
+                    if not raw:
+                        emit(failed_product(url))
+                        return
+                    if monitoring():
+                        # ayrıştırma süreçlerinde izleme durumu yok; değişmeyen sayfa buradan döner
+                        html = await loop.run_in_executor(parse_pool, decode_html, *raw)
+                        known = await loop.run_in_executor(parse_pool, unchanged_product, url, html)
+                        if known is not None:
+                            await loop.run_in_executor(parse_pool, emit, known)
+                            return
+                    # submit süreç havuzu doluysa bekler; event loop'u bloklamasın
+                    await loop.run_in_executor(parse_pool, stage.submit, url, *raw)
+
+                await asyncio.gather(producer(), *(worker() for _ in range(n_workers)))
+    finally:
+        if stage is not None:
+            stage.close()
+
+
+def scrape_urls(urls: Iterable[str], n_workers: int, opts: JobOptions, run: JobRun) -> None:
+    async def source(fetcher: AsyncFetcher, parse_pool: Executor) -> AsyncIterator[str]:
+        for u in urls:
+            yield u
+
+    asyncio.run(_pipeline(source, n_workers, opts, run))
+
+
+def scrape_iter(links: Iterator[str], n_workers: int, opts: JobOptions, run: JobRun) -> None:
+    """Ağa çıkan (engelleyen) bir URL üretecini thread'de gruplar halinde okuyarak tarar."""
+    def pull() -> List[str]:
+        return list(islice(links, PULL_BATCH))
+
+    async def source(fetcher: AsyncFetcher, parse_pool: Executor) -> AsyncIterator[str]:
+        loop = asyncio.get_running_loop()
+        while batch := await loop.run_in_executor(parse_pool, pull):
+            for u in batch:
+                yield u
+
+    asyncio.run(_pipeline(source, n_workers, opts, run))
+
+
+def scrape_category(crawl: CategoryCrawl, opts: JobOptions, run: JobRun) -> None:
+    """Liste sayfalarını gezerken bulunan ürünleri aynı anda tarar (boru hattı)."""
+    async def source(fetcher: AsyncFetcher, parse_pool: Executor) -> AsyncIterator[str]:
+        loop = asyncio.get_running_loop()
+
+        async def fetch_page(page_url: str) -> Tuple[str, Optional[str]]:
+            return page_url, await fetcher.fetch_html(page_url)
+
+        # Liste sayfaları da `crawl.prefetch` kadar aynı anda indirilir
+        pending: set = set()
+        while True:
+            for page_url in crawl.take(crawl.prefetch - len(pending)):
+                pending.add(asyncio.ensure_future(fetch_page(page_url)))
+            if not pending:
+                break
+            finished, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in finished:
+                page_url, html = task.result()
+                if not html:
+                    crawl.fail(page_url)
+                    continue
+                for u in await loop.run_in_executor(parse_pool, crawl.feed, page_url, html):
+                    yield u
+
+    asyncio.run(_pipeline(source, min(opts.concurrency, crawl.max_products), opts, run))
@@ -0,0 +1,179 @@
+"""Ürün sayfası için tek geçişli belge analizi.
+
+Ağaç bir kez dolaşılır ve çıkarıcıların ihtiyaç duyduğu her şey aynı anda toplanır: JSON-LD
+`Product`, meta etiketleri, galeri adayları, görseller, ilk başlıklar ve blok (p/li/td/div)
+başına gruplanmış görünür metin. İç içe div'lerde her metin parçası yalnızca en yakın bloğuna
+yazılır; eski `find_all([...])` + `get_text` birleşimindeki katlanarak tekrar eden metin oluşmaz.
+
+Karar mantığı `PageCollector`'da; bs4 ağacı için `analyze`, selectolax/lexbor için
+`catcher.lexbor.analyze_lexbor` aynı toplayıcıyı besler, bu yüzden çıktı arka uçtan bağımsızdır.
+"""
+
+import re
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from catcher.config import DEFAULT_PARSER, EXCLUDE_CLASSES
+from catcher.parsing import json_ld_product, make_soup, resolve_parser
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+TEXT_BLOCK_TAGS = frozenset(["p", "li", "td", "div"])
+GALLERY_TAGS = frozenset(["div", "section", "ul", "ol"])
+SKIP_TEXT_TAGS = frozenset(["style"])
+GALLERY_OWNER_RE = re.compile(r"product|urun")
+GALLERY_KIND_RE = re.compile(r"gallery|media|images|slider|carousel|thumbs|zoom|fotorama|swiper")
+
+
+def is_excluded_by_class(tag) -> bool:
+    classes = tag.get("class") or []
+    classes_low = [c.lower() for c in classes]
+    return any(any(ex in c for ex in EXCLUDE_CLASSES) for c in classes_low)
+
+
+def is_gallery_container(tag) -> bool:
+    idtxt = (tag.get("id") or "").lower()
+    clstxt = " ".join((tag.get("class") or [])).lower()
+    if not idtxt and not clstxt:
+        return False
+    key = idtxt + " " + clstxt
+    return bool(GALLERY_OWNER_RE.search(key) and GALLERY_KIND_RE.search(key)) and not is_excluded_by_class(tag)
+
+
+class PageAnalysis:
+    """Ayrıştırıcıdan bağımsız sayfa özeti; görseller/galeriler öznitelik sözlükleri olarak tutulur."""
+
+    def __init__(self):
+        self.json_ld: Dict[str, Any] = {}
+        self.meta_property: Dict[str, str] = {}
+        self.meta_name: Dict[str, str] = {}
+        self.galleries: List[Dict[str, Any]] = []
+        self.gallery_images: List[Dict[str, Any]] = []
+        self.images: List[Dict[str, Any]] = []
+        self.h1_text: Optional[str] = None
+        self.h2_text: Optional[str] = None
+        self.text_lines: List[str] = []
+        self.canonical: Optional[str] = None
+
+    @property
+    def text_blob(self) -> str:
+        return "\n".join(self.text_lines)
+
+    @property
+    def heading(self) -> Optional[str]:
+        return self.h1_text if self.h1_text is not None else self.h2_text
+
+    def meta(self, names: List[str]) -> Optional[str]:
+        # find_meta ile aynı öncelik: önce property=, yoksa name=; ilk eşleşen dolu içerik
+        for n in names:
+            content = self.meta_property[n] if n in self.meta_property else self.meta_name.get(n)
+            if content and content.strip():
+                return content.strip()
+        return None
+
+
+class PageCollector:
+    """Ağaç yürüyücülerinin (bs4, lexbor) ortak kararları; her eleman için bir kez çağrılır.
+
+    `text=False` blok metnini, `galleries=False` galeri aramasını atlar (site profili gerek görmezse).
+    """
+
+    def __init__(self, text: bool = True, galleries: bool = True):
+        self.page = PageAnalysis()
+        self.blocks: List[List[str]] = []
+        self.ld_done = False
+        self.text = text
+        self.galleries = galleries
+
+    def element(self, name: str, attrs: Dict[str, Any], in_gallery: bool,
+                text: Callable[[], Optional[str]]) -> Optional[Tuple[bool, bool]]:
+        """None: alt ağaca inilmez. Aksi halde (yeni metin bloğu mu, galeri içinde mi)."""
+        page = self.page
+        if name == "script":
+            t = attrs.get("type")
+            if not self.ld_done and t and "ld+json" in t:
+                item = json_ld_product(text())
+                if item is not None:
+                    page.json_ld = item
+                    self.ld_done = True
+            return None
+        if name in SKIP_TEXT_TAGS:
+            return None
+        if name == "meta":
+            content = attrs.get("content")
+            prop, nm = attrs.get("property"), attrs.get("name")
+            if prop is not None and prop not in page.meta_property:
+                page.meta_property[prop] = content or ""
+            if nm is not None and nm not in page.meta_name:
+                page.meta_name[nm] = content or ""
+            return None
+        if name == "link":
+            if page.canonical is None and "canonical" in (attrs.get("rel") or ()) and attrs.get("href"):
+                page.canonical = attrs["href"]
+            return None
+        if name == "img":
+            page.images.append(attrs)
+            if in_gallery:
+                page.gallery_images.append(attrs)
+            return None
+        if name == "h1":
+            if page.h1_text is None:
+                page.h1_text = text() or ""
+        elif name == "h2":
+            if page.h2_text is None:
+                page.h2_text = text() or ""
+
+        if self.galleries and name in GALLERY_TAGS and is_gallery_container(attrs):
+            page.galleries.append(attrs)
+            in_gallery = True
+        return name in TEXT_BLOCK_TAGS, in_gallery
+
+    def new_block(self) -> int:
+        if not self.text:
+            return -1  # yürüyücüler yalnızca >= 0 bloğa metin yazar
+        self.blocks.append([])
+        return len(self.blocks) - 1
+
+    def finish(self) -> PageAnalysis:
+        self.page.text_lines = list(dict.fromkeys(" ".join(parts) for parts in self.blocks if parts))
+        return self.page
+
+
+def analyze(soup: "BeautifulSoup", text: bool = True, galleries: bool = True) -> PageAnalysis:
+    from bs4 import CData, NavigableString, Tag
+
+    text_types = (NavigableString, CData)
+    col = PageCollector(text, galleries)
+    blocks = col.blocks
+
+    # (düğüm, en yakın metin bloğunun sırası, galeri içinde mi)
+    stack: List[Tuple[Any, int, bool]] = [(soup, -1, False)]
+    while stack:
+        node, block, in_gallery = stack.pop()
+        if not isinstance(node, Tag):
+            if block >= 0 and type(node) in text_types:
+                s = node.strip()
+                if s:
+                    blocks[block].append(s)
+            continue
+
+        if node is not soup:
+            flags = col.element(node.name, node.attrs, in_gallery, lambda n=node: n.string or n.text)
+            if flags is None:
+                continue
+            opens_block, in_gallery = flags
+            if opens_block:
+                block = col.new_block()
+
+        contents = node.contents
+        for i in range(len(contents) - 1, -1, -1):
+            stack.append((contents[i], block, in_gallery))
+
+    return col.finish()
+
+
+def analyze_html(html: str, parser: str = DEFAULT_PARSER, text: bool = True, galleries: bool = True) -> PageAnalysis:
+    if resolve_parser(parser) == "selectolax":
+        from catcher.lexbor import analyze_lexbor
+        return analyze_lexbor(html, text, galleries)
+    return analyze(make_soup(html, parser), text, galleries)
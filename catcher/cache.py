@@ -0,0 +1,158 @@
+"""Kalıcı HTTP önbelleği (SQLite + zlib).
+
+Gövdeler sıkıştırılmış olarak normalize edilmiş URL anahtarıyla saklanır. TTL içindeki kayıtlar
+ağa çıkmadan döner; süresi dolanlar ETag / Last-Modified ile koşullu istekle yenilenir (304 →
+kayıt tazelenir). Toplam boyut `max_bytes`'ı aşarsa en uzun süredir kullanılmayan kayıtlar
+silinir (LRU). "offline" modda hiç ağa çıkılmaz: sezgiler değiştikten sonra çıkarımı aynı
+sayfalar üzerinde yeniden koşmak için.
+
+Kullanım (fetcher tarafı):
+    hit, page, headers = cache.before(url)
+    if page is not None or cache.offline: return page
+    ... isteği `headers` ile gönder ...
+    return cache.after(url, hit, status, (body, charset), resp_headers)
+"""
+
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from catcher.config import CACHE_MODES, DEFAULT_CACHE_MAX_MB, DEFAULT_CACHE_TTL, ensure_dir
+
+RawPage = Tuple[bytes, Optional[str]]
+
+
+def cache_key(url: str) -> str:
+    # şema/host küçük harf, fragment yok, sorgu parametreleri sıralı
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", query, ""))
+
+
+class CacheHit(NamedTuple):
+    page: RawPage
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+
+class HttpCache:
+    def __init__(self, path: str, mode: str = "on", ttl: float = DEFAULT_CACHE_TTL,
+                 max_bytes: int = DEFAULT_CACHE_MAX_MB * 1024 * 1024):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Bilinmeyen önbellek modu: {mode}")
+        self.path = path
+        self.mode = mode
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        ensure_dir(os.path.dirname(os.path.abspath(path)))
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, url TEXT, body BLOB, charset TEXT, etag TEXT, last_modified TEXT,"
+            " size INTEGER, fetched_at REAL, accessed_at REAL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_lru ON responses(accessed_at)")
+        self._size = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    @property
+    def offline(self) -> bool:
+        return self.mode == "offline"
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    # ---- okuma ---- #
+    def lookup(self, url: str) -> Optional[CacheHit]:
+        key = cache_key(url)
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body, charset, etag, last_modified, fetched_at FROM responses WHERE key=?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE responses SET accessed_at=? WHERE key=?", (time.time(), key))
+        body, charset, etag, last_modified, fetched_at = row
+        return CacheHit((zlib.decompress(body), charset), etag, last_modified, fetched_at)
+
+    def is_fresh(self, hit: CacheHit) -> bool:
+        return time.time() - hit.fetched_at < self.ttl
+
+    def before(self, url: str) -> Tuple[Optional[CacheHit], Optional[RawPage], Dict[str, str]]:
+        """(kayıt, ağa çıkmadan dönülecek sayfa, koşullu istek başlıkları)."""
+        hit = self.lookup(url)
+        if hit is None:
+            return None, None, {}
+        if self.offline or self.is_fresh(hit):
+            return hit, hit.page, {}
+        headers: Dict[str, str] = {}
+        if hit.etag:
+            headers["If-None-Match"] = hit.etag
+        if hit.last_modified:
+            headers["If-Modified-Since"] = hit.last_modified
+        return hit, None, headers
+
+    # ---- yazma ---- #
+    def after(self, url: str, hit: Optional[CacheHit], status: int, page: Optional[RawPage], headers: Any) -> Optional[RawPage]:
+        """Yanıtı işler: 304 ise eski kaydı tazeler, 200 ise kaydeder; dönülecek sayfayı verir."""
+        if status == 304 and hit is not None:
+            self.touch(url)
+            return hit.page
+        if page is not None:
+            self.store(url, page, headers.get("ETag"), headers.get("Last-Modified"))
+        return page
+
+    def touch(self, url: str) -> None:
+        now = time.time()
+        with self._lock:
+            self._db.execute("UPDATE responses SET fetched_at=?, accessed_at=? WHERE key=?", (now, now, cache_key(url)))
+
+    def store(self, url: str, page: RawPage, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        body = zlib.compress(page[0], 6)
+        now = time.time()
+        key = cache_key(url)
+        with self._lock:
+            old = self._db.execute("SELECT size FROM responses WHERE key=?", (key,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, body, page[1], etag, last_modified, len(body), now, now),
+            )
+            self._size += len(body) - (old[0] if old else 0)
+            if self._size > self.max_bytes:
+                self._evict_locked()
+
+    def _evict_locked(self) -> None:
+        # %90'a inene kadar en eski erişilen kayıtları sil
+        target = int(self.max_bytes * 0.9)
+        rows = self._db.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
+        doomed = []
+        for key, size in rows:
+            if self._size <= target:
+                break
+            doomed.append((key,))
+            self._size -= size
+        self._db.executemany("DELETE FROM responses WHERE key=?", doomed)
+
+
+_caches: Dict[Tuple[str, str, float, int], HttpCache] = {}
+_caches_lock = threading.Lock()
+
+
+def open_cache(path: str, mode: str, ttl: float, max_bytes: int) -> Optional[HttpCache]:
+    """Aynı ayarlar için süreç içinde tek örnek; mode="off" ise None."""
+    if mode == "off":
+        return None
+    key = (os.path.abspath(path), mode, ttl, max_bytes)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = _caches[key] = HttpCache(path, mode, ttl, max_bytes)
+        return cache
@@ -0,0 +1,46 @@
+"""İşbirlikçi iptal ve iş süresi sınırı.
+
+`CancelToken` işe (JobRun) verilir; motorlar yeni URL almadan önce `stopped`'a bakar. Durunca
+keşif kesilir, kuyrukta bekleyen URL'ler indirilmeden atılır, uçuştaki istekler ve ayrıştırmalar
+biter, sink'ler kapanır: kısmi sonuçlar dosyaya yazılmış olur. Günlüklü işte atılan URL'ler
+`pending` kalır ve `--resume` ile tamamlanır.
+"""
+
+import threading
+import time
+from typing import Optional
+
+CANCELLED, DEADLINE = "cancelled", "deadline"
+
+
+class CancelToken:
+    def __init__(self, deadline: float = 0.0):
+        self.reason: Optional[str] = None  # CANCELLED | DEADLINE
+        self._event = threading.Event()
+        self._until: Optional[float] = None
+        self.set_deadline(deadline)
+
+    def set_deadline(self, seconds: float) -> None:
+        """Şu andan `seconds` saniye sonra kendiliğinden durur; 0 = sınırsız."""
+        self._until = time.monotonic() + seconds if seconds > 0 else None
+
+    def cancel(self, reason: str = CANCELLED) -> None:
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    @property
+    def stopped(self) -> bool:
+        if self._event.is_set():
+            return True
+        if self._until is not None and time.monotonic() >= self._until:
+            self.cancel(DEADLINE)
+            return True
+        return False
+
+    def wait(self, timeout: float) -> bool:
+        """En fazla `timeout` saniye bekler (süre sınırında erken uyanır); durduysa True."""
+        if self._until is not None:
+            timeout = min(timeout, max(0.0, self._until - time.monotonic()))
+        self._event.wait(timeout)
+        return self.stopped
@@ -0,0 +1,488 @@
+"""Komut satırı arayüzü (ekransız sunucular / cron için).
+
+Örnekler:
+  python -m catcher -c https://shop.example/kategori/elbise --max-pages 5 -o out/elbise.xlsx
+  python -m catcher -f urunler.txt --format csv -o out/
+  python -m catcher -f urunler.txt --format jsonl --format parquet -o out/
+  python -m catcher -f urunler.txt --journal buyuk_is          # çökerse: aynı komut + --resume
+  python -m catcher -s https://shop.example --since 2024-05-01  # site haritasından, yalnızca değişenler
+  python -m catcher -f urunler.txt --metrics output/catcher.prom  # aşama süreleri / HTTP sayaçları
+  python -m catcher -c https://shop.example/kategori/elbise --monitor elbise  # her gün: yalnızca değişenler
+  python -m catcher -s https://shop.example --deadline 1800 --url-timeout 20  # en fazla 30 dk; Ctrl+C kısmi yazar
+  python -m catcher --jobs gece.txt --workers 32 -o out/          # çok site, ortak worker havuzu
+  python -m catcher -s https://shop.example --frontier katalog    # paylaşılan sınırı tohumla
+  python -m catcher --frontier katalog --worker                   # her süreç / makinede
+  python -m catcher --frontier katalog --export -o out/katalog.parquet
+"""
+
+import argparse
+import os
+import secrets
+import signal
+import sys
+import threading
+import time
+from typing import Callable, List, Optional, TextIO, Tuple
+
+from catcher.cancel import CANCELLED, CancelToken
+from catcher.config import (
+    APP_NAME, CACHE_MODES, FRONTIER_HOST, FRONTIER_LEASE_SECS, FRONTIER_TOKEN_ENV, DEFAULT_CACHE_MAX_MB, DEFAULT_CACHE_MODE, DEFAULT_CACHE_TTL, DEFAULT_CONCURRENCY, DEFAULT_HOST_RATE, DEFAULT_IMAGE_WORKERS, DEFAULT_MAX_PAGES, DEFAULT_MAX_PRODUCTS, DEFAULT_PAGE_PREFETCH,
+    DEFAULT_MAX_BODY_MB, DEFAULT_PARSE_BATCH, DEFAULT_PARSER, DEFAULT_PER_HOST, DEFAULT_WORKERS, ENGINES, FAST_PATH_FIELDS,
+    OUTPUT_DIR, PARSERS,
+)
+from catcher.engine import JobResult, collect_links, run_job
+from catcher.distributed import export_frontier, run_worker, seed_frontier
+from catcher.export import DEFAULT_FORMATS, EXPORT_FORMATS
+from catcher.frontier import FRONTIER_STATES, Frontier, FrontierError, SqliteFrontier, open_frontier, serve_frontier
+from catcher.journal import JournalError
+from catcher.metrics import Progress, get_metrics
+from catcher.models import Product
+from catcher.options import JobOptions
+from catcher.scheduler import JobsFileError, SiteJob, read_jobs_file, run_jobs
+from catcher.sitemap import parse_lastmod
+
+
+def read_url_file(path: str) -> List[str]:
+    fh = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        return [ln.strip() for ln in fh if ln.strip() and not ln.lstrip().startswith("#")]
+    finally:
+        if fh is not sys.stdin:
+            fh.close()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(prog="catcher", description=f"{APP_NAME} — başsız toplayıcı")
+    src = p.add_argument_group("kaynak")
+    src.add_argument("urls", nargs="*", help="Ürün URL'leri")
+    src.add_argument("-c", "--category", help="Kategori URL'si (ürün linkleri buradan toplanır)")
+    src.add_argument("-f", "--urls-file", help="Her satırda bir ürün URL'si olan dosya ('-' = stdin)")
+    src.add_argument("-s", "--sitemap", metavar="URL",
+                     help="Site (robots.txt'deki Sitemap: satırları) ya da doğrudan site haritası URL'si")
+    src.add_argument("--since", metavar="TARİH",
+                     help="Site haritası: <lastmod>'u bu tarihten (2024-05-01[T10:00+03:00]) eski ürünleri atla")
+    src.add_argument("--jobs", metavar="DOSYA",
+                     help="İş dosyası: satır başına 'category|sitemap|urls|url ADRES [priority= weight= budget= name=]'; "
+                          "işler ortak worker havuzunda site başına adil sırayla taranır")
+
+    dist = p.add_argument_group("paylaşılan sınır (çok süreç / makine)")
+    dist.add_argument("--frontier", metavar="AD|YOL|URL",
+                      help="Sınır: isim (output/frontier/<isim>.sqlite), sqlite yolu ya da http://makine:port. "
+                           "Kaynak verilirse URL'ler sınıra eklenir")
+    dist.add_argument("--worker", action="store_true", help="Sınırdan URL kirala ve tara (sınır tükenene kadar)")
+    dist.add_argument("--lease-secs", type=float, default=FRONTIER_LEASE_SECS,
+                      help="Kira süresi; worker bu süre içinde yanıt vermezse URL'leri başkasına geçer")
+    dist.add_argument("--export", action="store_true", help="Sınırdaki tamamlanmış satırları -o / --format'a yaz")
+    dist.add_argument("--serve-frontier", metavar="[HOST:]PORT",
+                      help="SQLite sınırını HTTP'den yayınla (yalnızca port verilirse 127.0.0.1; diğer makineler "
+                           "için ör. 0.0.0.0:8870). Her istek --frontier-token anahtarını ister")
+    dist.add_argument("--frontier-token", metavar="ANAHTAR",
+                      help=f"HTTP sınırının paylaşılan anahtarı (verilmezse {FRONTIER_TOKEN_ENV}; sunucu ikisi de "
+                           "yoksa rastgele üretip yazdırır)")
+
+    p.add_argument("--max-pages", type=int, default=DEFAULT_MAX_PAGES, help="Kategoride gezilecek en fazla sayfa")
+    p.add_argument("--max-products", type=int, default=DEFAULT_MAX_PRODUCTS,
+                   help="Kategoriden / site haritasından alınacak en fazla ürün")
+    p.add_argument("--page-prefetch", type=int, default=DEFAULT_PAGE_PREFETCH,
+                   help="Kategoride aynı anda indirilecek liste sayfası")
+    p.add_argument("--include", default="", help="Dahil et (substring; ; ile ayır)")
+    p.add_argument("--exclude", default="", help="Hariç tut (substring; ; ile ayır)")
+    p.add_argument("-o", "--output", help=f"Çıktı dosyası (.xlsx/.csv/.jsonl/.parquet) ya da klasör (varsayılan: {OUTPUT_DIR})")
+    p.add_argument("--format", dest="formats", action="append", choices=EXPORT_FORMATS,
+                   help="Yazılacak biçim (tekrarlanabilir; varsayılan: xlsx + csv)")
+    p.add_argument("--engine", choices=ENGINES,
+                   help="Tarama motoru (varsayılan async: aiohttp, kurulu değilse threads; --jobs / --worker her zaman threads)")
+    p.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="async: toplam eşzamanlı istek")
+    p.add_argument("--per-host", type=int, default=DEFAULT_PER_HOST, help="async / --jobs: host başına eşzamanlı istek")
+    p.add_argument("--rate", type=float, default=DEFAULT_HOST_RATE,
+                   help="Host başına başlangıç hızı (istek/sn; 429/503'te düşer, sağlıklıyken artar; 0 = sınırsız)")
+    p.add_argument("--ignore-robots", action="store_true", help="robots.txt Crawl-delay'i yok say")
+    p.add_argument("--max-body-mb", type=int, default=DEFAULT_MAX_BODY_MB,
+                   help="Yanıt gövdesi bundan büyükse kesilir (MB; 0 = sınırsız)")
+    p.add_argument("--deadline", type=float, default=0.0, metavar="SN",
+                   help="İşin en uzun süresi: dolunca yeni URL alınmaz, uçuştakiler biter, kısmi sonuç yazılır (0 = sınırsız)")
+    p.add_argument("--url-timeout", type=float, default=0.0, metavar="SN",
+                   help="URL başına indirme süresi, yeniden denemeler dahil; aşan URL hatalı yazılır (0 = sınırsız)")
+    p.add_argument("--fast", action="store_true",
+                   help="Hızlı yol: <head>'deki JSON-LD --fast-fields alanlarını dolduruyorsa gövdenin geri kalanı indirilmez")
+    p.add_argument("--fast-fields", default=",".join(FAST_PATH_FIELDS), metavar="ALANLAR",
+                   help="--fast için dolması gereken alanlar (virgülle ayır)")
+    p.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="threads: worker thread sayısı")
+    p.add_argument("--parser", choices=PARSERS, default=DEFAULT_PARSER,
+                   help="HTML ayrıştırıcı (auto: kurulu en hızlısı; selectolax > lxml > html.parser)")
+    p.add_argument("--parse-processes", type=int, default=0,
+                   help="Ürün sayfalarını bu kadar süreçte ayrıştır (0: kapalı, -1: çekirdek sayısı)")
+    p.add_argument("--parse-batch", type=int, default=DEFAULT_PARSE_BATCH,
+                   help="Süreç havuzuna tek seferde gönderilecek sayfa sayısı")
+    p.add_argument("--cache", choices=CACHE_MODES, default=DEFAULT_CACHE_MODE,
+                   help="HTTP önbelleği (offline: ağa çıkmadan yalnızca önbellekten çalış)")
+    p.add_argument("--cache-ttl", type=float, default=DEFAULT_CACHE_TTL,
+                   help="Önbellek kaydı bu kadar saniye tazedir; sonra ETag/Last-Modified ile yenilenir")
+    p.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_MAX_MB, help="Önbellek üst sınırı (MB, LRU)")
+    p.add_argument("--cache-path", help="Önbellek dosyası (varsayılan: output/cache/http_cache.sqlite)")
+    p.add_argument("--no-profiles", action="store_true",
+                   help="Site profillerini kullanma (her sayfada tüm sezgiler; öğrenilenler de kaydedilmez)")
+    p.add_argument("--profiles-path", metavar="YOL", help="Site profili dosyası (varsayılan: output/site_profiles.json)")
+    p.add_argument("--collapse-canonical", action="store_true",
+                   help="<link rel=canonical> adresi aynı olan ürün sayfalarını tek satıra indir")
+    p.add_argument("--journal", metavar="AD|YOL",
+                   help="Satırları anında SQLite günlüğe yaz (isim verilirse output/jobs/<isim>.sqlite)")
+    p.add_argument("--resume", action="store_true",
+                   help="--journal ile: tamamlanan URL'leri atla, hatalı/bekleyenleri yeniden dene")
+    p.add_argument("--fresh", action="store_true",
+                   help="--journal ile: günlükteki önceki çalışmayı sil, baştan başla (dolu günlük bu olmadan açılmaz)")
+    p.add_argument("--monitor", metavar="AD|YOL",
+                   help="İzleme modu: son bilinen ürünlerle karşılaştır, yalnızca değişiklikleri (yeni / fiyat / "
+                        "alan / kaldırılan) yaz; durum output/monitor/<isim>.sqlite")
+    p.add_argument("--links-only", action="store_true", help="Yalnızca bulunan ürün linklerini yazdır (önizleme)")
+    p.add_argument("--images", action="store_true",
+                   help="Galeri görsellerini indir (aynı içerik bir kez; images/manifest.jsonl ürün -> dosya)")
+    p.add_argument("--images-dir", metavar="KLASÖR", help="Görsel klasörü (varsayılan: çıktı dosyalarının yanında images/)")
+    p.add_argument("--image-workers", type=int, default=DEFAULT_IMAGE_WORKERS, help="Aynı anda indirilecek görsel")
+    p.add_argument("--metrics", metavar="YOL",
+                   help="Ölçüm dökümü (.json ya da Prometheus metni, ör. .prom); iş sürerken yenilenir")
+    p.add_argument("--no-progress", action="store_true", help="İlerleme çubuğunu gösterme")
+    p.add_argument("-q", "--quiet", action="store_true", help="Durum mesajlarını gizle")
+    return p
+
+
+def options_from_args(args: argparse.Namespace) -> JobOptions:
+    urls = list(args.urls)
+    if args.urls_file:
+        urls.extend(read_url_file(args.urls_file))
+    return JobOptions(
+        category_url=args.category,
+        urls=urls,
+        sitemap_url=args.sitemap,
+        since=since_arg(args.since),
+        max_pages=max(1, args.max_pages),
+        max_products=max(1, args.max_products),
+        page_prefetch=max(1, args.page_prefetch),
+        rate=max(0.0, args.rate),
+        robots=not args.ignore_robots,
+        max_body_mb=max(0, args.max_body_mb),
+        deadline=max(0.0, args.deadline),
+        url_timeout=max(0.0, args.url_timeout),
+        fast_fields=fast_fields(args.fast_fields) if args.fast else (),
+        include_filter=args.include.strip(),
+        exclude_filter=args.exclude.strip(),
+        output_path=args.output,
+        formats=tuple(args.formats or DEFAULT_FORMATS),
+        workers=max(1, args.workers),
+        engine=args.engine or "async",
+        concurrency=max(1, args.concurrency),
+        per_host=max(1, args.per_host),
+        parser=args.parser,
+        parse_processes=(os.cpu_count() or 1) if args.parse_processes < 0 else args.parse_processes,
+        parse_batch=max(1, args.parse_batch),
+        cache=args.cache,
+        cache_ttl=max(0.0, args.cache_ttl),
+        cache_max_mb=max(1, args.cache_size),
+        cache_path=args.cache_path,
+        profiles=not args.no_profiles,
+        profiles_path=args.profiles_path,
+        journal=args.journal,
+        resume=args.resume,
+        fresh=args.fresh,
+        monitor=args.monitor,
+        collapse_canonical=args.collapse_canonical,
+        keep_products=False,  # satırlar yalnızca dosyalara akar
+        images=args.images or bool(args.images_dir),
+        images_dir=args.images_dir,
+        image_workers=max(1, args.image_workers),
+        metrics_path=args.metrics,
+    )
+
+
+def since_arg(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    ts = parse_lastmod(value)
+    if ts is None:
+        raise argparse.ArgumentTypeError(f"--since: tarih anlaşılamadı: {value}")
+    return ts
+
+
+def fast_fields(value: str) -> Tuple[str, ...]:
+    names = tuple(dict.fromkeys(f.strip() for f in value.split(",") if f.strip()))
+    unknown = [f for f in names if f not in Product.__dataclass_fields__]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"--fast-fields: bilinmeyen alan: {', '.join(unknown)}")
+    return names
+
+
+PROGRESS_LOG_SECS = 10.0  # terminal değilse (cron/log) ilerleme satırı aralığı
+BAR_WIDTH = 24
+
+
+class ProgressBar:
+    """stderr'e ilerleme: terminalde yerinde güncellenen tek satır, değilse aralıklı log satırları."""
+
+    def __init__(self, stream: TextIO = sys.stderr, every: float = PROGRESS_LOG_SECS):
+        self.stream = stream
+        self.tty = stream.isatty()
+        self.every = every
+        self.last: Optional[Progress] = None
+        self._printed: Optional[Progress] = None
+        self._shown = 0  # terminalde ekrandaki satırın uzunluğu
+        self._logged = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self, p: Progress) -> None:
+        with self._lock:
+            self.last = p
+            if self.tty:
+                line = f"{self.bar(p)} {p.describe()}"
+                self.stream.write("\r" + line.ljust(self._shown))
+                self._shown = len(line)
+            elif time.monotonic() - self._logged >= self.every:
+                self._logged = time.monotonic()
+                self._printed = p
+                self.stream.write(p.describe() + "\n")
+            self.stream.flush()
+
+    @staticmethod
+    def bar(p: Progress) -> str:
+        filled = int(BAR_WIDTH * p.done / p.total) if p.total else 0
+        return "[" + "#" * min(filled, BAR_WIDTH) + "-" * max(0, BAR_WIDTH - filled) + "]"
+
+    def clear(self) -> None:
+        """Araya durum mesajı yazılmadan önce çubuğu siler."""
+        with self._lock:
+            if self._shown:
+                self.stream.write("\r" + " " * self._shown + "\r")
+                self._shown = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._shown:
+                self.stream.write("\n")
+                self._shown = 0
+            elif self.last is not None and self.last is not self._printed:
+                self.stream.write(self.last.describe() + "\n")
+            self.stream.flush()
+
+
+def stop_on_signals(cancel: CancelToken) -> None:
+    """İlk Ctrl+C / SIGTERM işi durdurur (kısmi sonuçlar yazılır); ikinci Ctrl+C hemen çıkar."""
+    def handle(signum: int, frame: object) -> None:
+        if cancel.reason == CANCELLED:
+            signal.default_int_handler(signum, frame)
+        cancel.cancel()
+        # ilerleme çubuğunun kilidine dokunmadan (sinyal onu tutan thread'de gelebilir)
+        sys.stderr.write("\nDurduruluyor: uçuştaki istekler bitiyor, kısmi sonuçlar yazılıyor… "
+                         "(hemen çıkmak için yeniden Ctrl+C)\n")
+        sys.stderr.flush()
+
+    signal.signal(signal.SIGINT, handle)
+    signal.signal(signal.SIGTERM, handle)
+
+
+def exit_code(code: int, cancel: CancelToken) -> int:
+    # kullanıcı durdurduysa kabuk geleneği: 128 + SIGINT
+    return 130 if cancel.reason == CANCELLED else code
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.jobs and (args.category or args.sitemap or args.urls or args.urls_file):
+        parser.error("--jobs diğer kaynaklarla birlikte kullanılamaz")
+    if args.jobs and (args.journal or args.links_only):
+        parser.error("--jobs ile --journal / --links-only kullanılamaz")
+    if args.jobs and (args.engine == "async" or args.parse_processes):
+        # zamanlayıcı ortak thread havuzuyla tarar; bu seçenekler sessizce yok sayılmasın
+        parser.error("--jobs ile --engine async / --parse-processes kullanılamaz")
+    if args.worker and (args.engine == "async" or args.parse_processes):
+        parser.error("--worker ile --engine async / --parse-processes kullanılamaz")
+    if (args.worker or args.export or args.serve_frontier) and not args.frontier:
+        parser.error("--worker / --export / --serve-frontier için --frontier gerekli")
+    if args.frontier and (args.jobs or args.journal or args.links_only):
+        parser.error("--frontier ile --jobs / --journal / --links-only kullanılamaz")
+    if not (args.category or args.sitemap or args.urls or args.urls_file or args.jobs or args.frontier):
+        parser.error("--category, --sitemap, --urls-file, --jobs, --frontier ya da en az bir URL gerekli")
+    if args.category and args.sitemap:
+        parser.error("--category ve --sitemap birlikte kullanılamaz")
+    if (args.resume or args.fresh) and not args.journal:
+        parser.error("--resume / --fresh için --journal gerekli")
+    if args.resume and args.fresh:
+        parser.error("--resume ve --fresh birlikte kullanılamaz")
+    if args.monitor and (args.jobs or args.frontier or args.links_only):
+        parser.error("--monitor ile --jobs / --frontier / --links-only kullanılamaz")
+    try:
+        opts = options_from_args(args)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+
+    bar = None if args.quiet or args.no_progress else ProgressBar()
+    cancel = CancelToken()
+    if not args.serve_frontier:  # sınır sunucusu Ctrl-C ile doğrudan kapanır
+        stop_on_signals(cancel)
+
+    def status(msg: str) -> None:
+        if not args.quiet:
+            if bar is not None:
+                bar.clear()
+            print(msg, file=sys.stderr, flush=True)
+
+    if args.jobs:
+        try:
+            jobs = read_jobs_file(args.jobs)
+        except (OSError, JobsFileError) as e:
+            parser.error(f"--jobs: {e}")
+        if not jobs:
+            parser.error("--jobs: dosyada iş yok")
+        return exit_code(main_jobs(jobs, opts, status, bar, cancel), cancel)
+
+    if args.frontier:
+        try:
+            frontier = open_frontier(args.frontier, args.frontier_token)
+        except FrontierError as e:
+            parser.error(str(e))
+        try:
+            return exit_code(main_frontier(args, opts, frontier, status, bar, cancel), cancel)
+        except FrontierError as e:
+            status(f"Hata: {e}")
+            return 2
+        finally:
+            frontier.close()
+
+    if args.links_only:
+        links = collect_links(opts)
+        for u in links:
+            print(u)
+        status(f"Önizleme: {len(links)} link bulundu")
+        return 0 if links else 1
+
+    try:
+        result = run_job(opts, status, bar, cancel)
+    except JournalError as e:
+        status(f"Hata: {e}")
+        return 2
+    finally:
+        if bar is not None:
+            bar.close()
+    for fmt, err in result.errors.items():
+        status(f"{fmt.upper()} yazılamadı: {err}")
+    if not result.urls and not result.rows:
+        status("Hata: uygun ürün linki bulunamadı." if not cancel.stopped else "İş durduruldu; satır yazılmadı.")
+        return exit_code(1, cancel)
+    status(f"{result.rows} satır yazıldı")
+    print_summary(status)
+    for path in result.paths.values():
+        status(f"Kayıt: {path}")
+    print_images(status, result)
+    print_changes(status, result)
+    return exit_code(3 if result.errors and not result.paths else 0, cancel)
+
+
+def main_jobs(jobs: List[SiteJob], opts: JobOptions, status: Callable[[str], None], bar: Optional[ProgressBar],
+              cancel: Optional[CancelToken] = None) -> int:
+    try:
+        results = run_jobs(jobs, opts, status, bar, cancel)
+    finally:
+        if bar is not None:
+            bar.close()
+    rows = sum(r.rows for r in results.values())
+    for name, result in results.items():
+        for fmt, err in result.errors.items():
+            status(f"[{name}] {fmt.upper()} yazılamadı: {err}")
+        for path in result.paths.values():
+            status(f"[{name}] Kayıt: {path}")
+    status(f"{len(results)} iş, toplam {rows} satır yazıldı")
+    print_summary(status)
+    print_images(status, next(iter(results.values()), None))
+    if not rows:
+        return 1
+    return 3 if any(r.errors and not r.paths for r in results.values()) else 0
+
+
+def main_frontier(args: argparse.Namespace, opts: JobOptions, frontier: Frontier, status: Callable[[str], None],
+                  bar: Optional[ProgressBar], cancel: Optional[CancelToken] = None) -> int:
+    if args.serve_frontier:
+        if not isinstance(frontier, SqliteFrontier):
+            status("Hata: --serve-frontier yalnızca SQLite sınırı yayınlar")
+            return 2
+        host, _, port = args.serve_frontier.rpartition(":")
+        host = host or FRONTIER_HOST
+        token = args.frontier_token or os.environ.get(FRONTIER_TOKEN_ENV)
+        if not token:
+            token = secrets.token_urlsafe(24)
+            # -q'da da yazılır: anahtar olmadan worker'lar bağlanamaz
+            print(f"Sınır anahtarı (worker'larda --frontier-token ya da {FRONTIER_TOKEN_ENV}): {token}",
+                  file=sys.stderr, flush=True)
+        status(f"Sınır yayında: http://{host}:{port} (Ctrl-C ile dur)")
+        try:
+            serve_frontier(frontier, host, int(port), token)
+        except KeyboardInterrupt:
+            pass
+        return 0
+    seeding = bool(args.category or args.sitemap or args.urls or args.urls_file)
+    seeder = None
+    if seeding:
+        added: List[int] = []
+        errors: List[BaseException] = []
+
+        def seed() -> None:
+            try:
+                added.append(seed_frontier(opts, frontier, status, cancel))
+            except Exception as e:
+                errors.append(e)
+                if args.worker:
+                    # worker'lar bulunanları bitirip çıksın; aynı tohumlama yeniden koşunca mühür kalkar
+                    frontier.seal()
+        # worker da isteniyorsa keşif arka planda sürer, bulunan URL'ler hemen taranır
+        seeder = threading.Thread(target=seed, daemon=True)
+        seeder.start()
+        if not args.worker:
+            seeder.join()
+    if args.worker:
+        try:
+            worker = run_worker(opts, frontier, status, bar, max(1.0, args.lease_secs), cancel)
+        finally:
+            if bar is not None:
+                bar.close()
+        status(f"Worker bitti: {worker.run.done} URL tamamlandı ({worker.run.failed} hatalı), "
+               f"{worker.released} yeniden denemeye bırakıldı, {worker.lost} kirası düştüğü için atıldı")
+        print_summary(status)
+    if seeder is not None:
+        seeder.join()
+        if errors:
+            status(f"Hata: keşif yarıda kaldı: {errors[0]}")
+            return 2
+        if frontier.sealed():
+            status(f"Sınıra {added[0]} yeni URL eklendi (mühürlendi)")
+    counts = frontier.counts()
+    status("Sınır: " + ", ".join(f"{counts.get(k, 0)} {k}" for k in FRONTIER_STATES))
+    if args.export:
+        result = export_frontier(opts, frontier)
+        for fmt, err in result.errors.items():
+            status(f"{fmt.upper()} yazılamadı: {err}")
+        status(f"{result.rows} satır yazıldı")
+        for path in result.paths.values():
+            status(f"Kayıt: {path}")
+        if result.errors and not result.paths:
+            return 3
+    return 0
+
+
+def print_summary(status: Callable[[str], None]) -> None:
+    metrics = get_metrics()
+    status(f"HTTP: {metrics.total('domain_requests'):.0f} istek, {metrics.total('http_retries'):.0f} yeniden deneme, "
+           f"{metrics.total('http_bytes') / 1048576:.1f} MB")
+    for line in metrics.summary():
+        status(f"  {line}")
+
+
+def print_changes(status: Callable[[str], None], result: JobResult) -> None:
+    if result.changes:
+        ch = result.changes
+        status(f"Değişiklikler: {ch['new']} yeni, {ch['price']} fiyat, {ch['changed']} alan, {ch['removed']} kaldırıldı; "
+               f"{ch['same']} aynı ({ch['skipped']} sayfa değişmediği için ayrıştırılmadı)")
+
+
+def print_images(status: Callable[[str], None], result: Optional[JobResult]) -> None:
+    if result is not None and result.image_manifest:
+        st = result.images
+        status(f"Görseller: {st.get('downloaded', 0)} indirildi, {st.get('duplicates', 0)} içerik tekrarı, "
+               f"{st.get('skipped', 0)} zaten diskteydi, {st.get('failed', 0)} alınamadı — {result.image_manifest}")
@@ -0,0 +1,167 @@
+"""Catcher genel ayarları ve sabitleri (yan etkisiz; dizin oluşturma yalnızca gerektiğinde)."""
+
+import os
+
+# ----------------------------- Çalışma dizini + çıktı ----------------------------- #
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OUTPUT_DIR = os.path.join(BASE_DIR, "output")
+
+
+def ensure_dir(path: str) -> str:
+    os.makedirs(path, exist_ok=True)
+    return path
+
+# ----------------------------- Genel Ayarlar ----------------------------- #
+APP_NAME = "Catcher v05.3"
+OUTPUT_SUFFIX = "catcher_v05_3"
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+)
+HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept-Language": "tr-TR,tr;q=0.9,en;q=0.8",
+    "Accept-Encoding": "gzip, deflate",
+}
+REQ_TIMEOUT = (6, 18)  # (connect, read) saniye
+MAX_RETRIES = 2        # toplam deneme: 1+MAX_RETRIES; yalnızca geçici hatalar yeniden denenir
+BACKOFF_BASE = 0.5     # üstel backoff: rastgele [0, min(BACKOFF_CAP, BASE * 2^deneme)] sn
+BACKOFF_CAP = 10.0
+
+# Host başına hız sınırı (token bucket, istek/sn). Sağlıklı yanıtlarda hız adım adım artar,
+# 429/503'te yarıya iner; Retry-After ve robots.txt Crawl-delay uyulur. 0 = sınırsız.
+DEFAULT_HOST_RATE = 10.0
+MIN_HOST_RATE = 0.2
+MAX_HOST_RATE = 100.0
+HOST_RATE_STEP = 1.0      # sağlıklı trafikte saniyede yaklaşık bu kadar istek/sn artış
+HOST_RATE_BACKOFF = 0.5   # kısıtlama yanıtında çarpan
+MAX_RETRY_AFTER = 60.0    # bundan uzun Retry-After beklenmez, sınıra kırpılır
+RESPECT_ROBOTS = True
+
+# Yanıt gövdesi parça parça okunur; sınırı aşan ya da bitmeyen yanıt kesilir (kesik gövde önbelleğe yazılmaz)
+DEFAULT_MAX_BODY_MB = 8
+BODY_DEADLINE = 60.0   # bir gövdeyi okumak için toplam süre (sn); REQ_TIMEOUT yalnızca parçalar arası
+READ_CHUNK = 64 * 1024
+
+# Hızlı yol: <head>'deki JSON-LD `Product` bu alanların hepsini dolduruyorsa gövdenin geri kalanı
+# ne indirilir ne ayrıştırılır (metin sezgileri ve galeri görselleri atlanır)
+FAST_PATH_FIELDS = ("title", "price", "currency", "colors", "sizes", "material", "image_urls")
+
+DEFAULT_MAX_PAGES = 20
+DEFAULT_MAX_PRODUCTS = 1000
+# HTML ayrıştırıcı: "auto" = kurulu en hızlısı (selectolax > lxml > html.parser)
+PARSERS = ("auto", "html.parser", "lxml", "selectolax")
+PARSER_PREFERENCE = ("selectolax", "lxml", "html.parser")
+DEFAULT_PARSER = "auto"
+
+# HTTP önbelleği: on = TTL içinde ağa çıkma, sonra koşullu yenile; offline = yalnızca önbellek
+CACHE_MODES = ("off", "on", "offline")
+DEFAULT_CACHE_MODE = "on"
+DEFAULT_CACHE_TTL = 3600  # saniye
+DEFAULT_CACHE_MAX_MB = 512
+CACHE_FILENAME = "http_cache.sqlite"
+
+# Süreç havuzunda ayrıştırma: IPC maliyetini bölmek için sayfalar gruplar halinde gönderilir
+DEFAULT_PARSE_BATCH = 16
+
+# URL normalizasyonu: tekilleştirmede ve indirilecek URL'de atılan sorgu parametreleri.
+# "*" ile biten girdi önek eşler. Varyant parametreleri yalnızca ürün URL'lerinden atılır
+# (liste sayfalarında aynı parametreler filtre anlamı taşıyabilir).
+TRACKING_PARAMS = [
+    "utm_*", "gclid", "gbraid", "wbraid", "dclid", "fbclid", "msclkid", "yclid", "igshid",
+    "mc_cid", "mc_eid", "_ga", "_gl", "srsltid", "ref", "ref_src", "spm", "scm",
+]
+VARIANT_PARAMS = [
+    "color", "colour", "renk", "size", "beden", "variant", "variation_id", "attribute_*",
+]
+
+# Site haritası keşfi: robots.txt'deki "Sitemap:" satırları (yoksa /sitemap.xml). XML akış halinde
+# ayrıştırılır; indeks dosyaları bu derinliğe kadar izlenir, URL'ler filtreye gruplar halinde verilir.
+SITEMAP_MAX_DEPTH = 3
+SITEMAP_BATCH = 500
+
+# Görsel indirme (isteğe bağlı): galeri görselleri sınırlı sayıda thread'le diske akar, aynı içerik
+# (sha256) bir kez saklanır. CDN boyut varyantları (_800x, -300x300, ?width=…) tek görsele indirgenir.
+DEFAULT_IMAGE_WORKERS = 8
+IMAGE_QUEUE_SIZE = 256  # bekleyen ürün; dolunca satır yazan taraf bekler (görseller taramanın gerisinde birikmez)
+MAX_IMAGE_MB = 25
+IMAGE_DIRNAME = "images"
+IMAGE_MANIFEST = "manifest.jsonl"
+CDN_SIZE_PARAMS = ["w", "h", "width", "height", "size", "quality", "q", "fit", "crop", "dpr", "v"]
+
+# Ölçümler: aşama süreleri (sn) bu kovalarla histograma yazılır; ilerleme en sık bu aralıkla
+# bildirilir, ölçüm dosyası (Prometheus metni / JSON) iş sürerken bu aralıkla yenilenir.
+METRIC_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+METRIC_STAGES = ("wait", "fetch", "decode", "parse", "extract", "write", "image", "export")
+PROGRESS_INTERVAL = 0.5
+METRICS_FLUSH_SECS = 10.0
+
+# Çoklu iş zamanlayıcısı: her (iş, host) bir şeride düşer; şeritler öncelik + ağırlıklı
+# round-robin ile sırayla beslenir, host başına uçuştaki istek DEFAULT_PER_HOST ile sınırlıdır.
+LANE_BUFFER = 64          # şerit başına bekleyen URL; dolunca o işin keşfi bekler
+DEFAULT_JOB_WEIGHT = 1
+
+# Paylaşılan iş sınırı (frontier): süreçler/makineler URL'leri kiralar (lease); süresi içinde
+# tamamlanmayan kira düşer ve URL başka worker'a verilir. Canlı worker kirasını periyodik uzatır.
+FRONTIER_LEASE_SECS = 120.0
+FRONTIER_LEASE_BATCH = 4    # worker thread'inin tek seferde kiraladığı URL
+FRONTIER_MAX_ATTEMPTS = 3   # hatalı sonuç bu kadar denemeden sonra kalıcı `failed`
+FRONTIER_POLL_SECS = 1.0    # iş yokken (keşif sürerken) bekleme
+FRONTIER_ADD_BATCH = 200    # tohumlamada tek işlemde eklenen URL
+FRONTIER_PORT = 8870        # --serve-frontier varsayılanı
+FRONTIER_HOST = "127.0.0.1"  # yalnızca port verilirse; diğer makinelere açmak için HOST:PORT (ör. 0.0.0.0:8870)
+FRONTIER_TOKEN_HEADER = "X-Frontier-Token"
+FRONTIER_TOKEN_ENV = "CATCHER_FRONTIER_TOKEN"  # --frontier-token verilmezse
+
+# Site profilleri: bir alan adında hangi kapsam / sayfalama / alan kaynağının işe yaradığı öğrenilir,
+# sonraki sayfalarda yalnızca o yol çalışır. Profil tutmazsa tam sezgilere dönülür.
+PROFILE_FILENAME = "site_profiles.json"
+PROFILE_MIN_STREAK = 3    # aynı seçim art arda bu kadar sayfada kazanınca profile yazılır
+PROFILE_MAX_MISSES = 2    # öğrenilen seçim art arda bu kadar tutmazsa unutulur (yeniden öğrenilir)
+PROFILE_AUDIT_EVERY = 50  # profilli sayfaların ~1/N'i yine tam sezgilerle denetlenir
+
+DEFAULT_PAGE_PREFETCH = 4  # aynı anda indirilen liste sayfası
+EMPTY_PAGE_LIMIT = 2       # art arda bu kadar sayfa yeni ürün getirmezse sayfalama durur
+DEFAULT_WORKERS = 12
+
+# Async motor: toplam ve host başına eşzamanlı istek sınırı
+ENGINES = ("async", "threads")
+DEFAULT_CONCURRENCY = 100
+DEFAULT_PER_HOST = 8
+
+MATERIAL_DICT = [
+    "pamuk", "keten", "bambu", "viskon", "polyester", "ipek", "şifon", "saten", "modal",
+    "akrilik", "naylon", "elastan", "likra", "kaşmir", "yün", "tencel", "rayon",
+    "cotton", "linen", "bamboo", "viscose", "polyester", "silk", "chiffon", "satin", "modal",
+    "acrylic", "nylon", "elastane", "spandex", "cashmere", "wool", "lyocell", "rayon",
+]
+COLOR_HINTS = ["renk", "color", "colours", "colors", "tone", "ton", "shade", "hue"]
+SIZE_HINTS = ["boyut", "ölçü", "size", "dimension", "uzunluk", "eni", "cm", "mm"]
+
+# Ek sözlük dosyaları (satır başına bir terim); varsa yukarıdaki listelere eklenir
+DICT_DIR = os.path.join(BASE_DIR, "dicts")
+DICT_FILES = {"material": "materials.txt", "color": "colors.txt", "size": "sizes.txt"}
+
+EXCLUDE_REGION_SELECTORS = [
+    "header", "footer", "nav",
+    "div[id*='header']", "div[class*='header']",
+    "div[id*='footer']", "div[class*='footer']",
+]
+EXCLUDE_CLASSES = [
+    "swatch", "variant", "varian", "renk", "color", "option", "attribute", "thumb-variant",
+    "icon", "logo", "avatar", "badge", "placeholder"
+]
+IMG_EXT_ALLOW = (".jpg", ".jpeg", ".png", ".webp")
+
+PRODUCT_PATH_HINTS = [
+    "/urun/", "/product", "/products/", "/p-", "/item/", "/detail", "/detay", "/shop/",
+    "/collections/", "/collection/", "/catalog/", "/kategori/", "/category/"
+]
+CONTENT_SCOPES = [
+    "main a", "div[id*='main'] a", "div[class*='main'] a",
+    "div[id*='content'] a", "div[class*='content'] a",
+    "div[class*='listing'] a", "div[class*='grid'] a",
+    "div[class*='product'] a", "section[class*='product'] a",
+    "ul[class*='product'] a", "ol[class*='product'] a",
+    "div[class*='catalog'] a", "div[class*='collection'] a",
+]
@@ -0,0 +1,211 @@
+"""Kategori gezinimi.
+
+`CategoryCrawl` yalnızca karar verir (hangi linkler yeni, sırada hangi sayfalar var); sayfayı kimin
+indirdiği (requests ya da aiohttp) ona bağlı değil. Böylece her sayfanın ürün linkleri bulunur
+bulunmaz tarama kuyruğuna akabilir.
+
+Sayfalama bir sınır kümesi (frontier) olarak tutulur: rel=next, numaralı sayfalar ve `?page=N`
+adayları aynı kuyruğa girer, aynı anda birkaç tanesi indirilir. Ziyaret edilen sayfa bir daha
+indirilmez; art arda `EMPTY_PAGE_LIMIT` sayfa yeni ürün getirmezse gezinti durur.
+
+Site profili (catcher.profiles) ürün linklerinin tek bir kapsamdan geldiğini ve hangi sayfalama
+stratejilerinin kullanıldığını öğrenince yalnızca onlar çalıştırılır; özellikle `?page=N+1`
+tahminleri (son sayfadan sonra boşa indirilen sayfalar) öğrenilmemişse kuyruğa girmez.
+"""
+
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Deque, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from catcher.config import CONTENT_SCOPES, DEFAULT_PAGE_PREFETCH, DEFAULT_PARSER, EMPTY_PAGE_LIMIT
+from catcher.fetch import fetch_html
+from catcher.links import PAGER_STRATEGIES, ListingPage, bump_page_param, domain_from, filter_links, parse_listing
+from catcher.profiles import audited, site_profile
+from catcher.urls import SeenIndex, url_key
+
+MIXED_SCOPE = "mixed"  # ürün linkleri birden çok kapsamdan geliyor: kapsam daraltılmaz
+
+
+def page_key(url: str) -> str:
+    # liste sayfasında ?renk= gibi parametreler filtre olabilir; yalnızca izleme parametreleri atılır
+    return url_key(url, variants=False)
+
+
+def pager_choice(used: Set[str]) -> Optional[str]:
+    # `?page=N+1` tahmini başka strateji yokken öğrenilir; varsa onlar yeter
+    if used - {"bump"}:
+        used = used - {"bump"}
+    return "+".join(s for s in PAGER_STRATEGIES if s in used) or None
+
+
+def scope_choice(listing: ListingPage, filtered: List[str]) -> str:
+    keys = {url_key(u) for u in filtered}
+    used = {i for u, i in zip(listing.links, listing.scopes) if url_key(u) in keys}
+    return CONTENT_SCOPES[used.pop()] if len(used) == 1 else MIXED_SCOPE
+
+
+class CategoryCrawl:
+    def __init__(self, cat_url: str, max_pages: int, max_products: int, include_filter: str, exclude_filter: str,
+                 prefetch: int = DEFAULT_PAGE_PREFETCH, parser: str = DEFAULT_PARSER,
+                 seen: Optional[SeenIndex] = None):
+        self.cat_url = cat_url
+        self.max_pages = max_pages
+        self.max_products = max_products
+        self.include_filter = include_filter
+        self.exclude_filter = exclude_filter
+        self.prefetch = max(1, prefetch)
+        self.parser = parser
+        self.dom = domain_from(cat_url)
+        self.seen = seen if seen is not None else SeenIndex()  # tarama aşamasıyla paylaşılabilir
+        self.found = 0
+        self.pages = 0          # indirmeye gönderilen liste sayfası
+        self.in_flight = 0
+        self.empty_streak = 0
+        self.stopped = False
+        self.frontier: Deque[str] = deque([cat_url])
+        self.queued: Set[str] = {page_key(cat_url)}  # ziyaret edilen + sırada bekleyen sayfalar
+        self.profile = site_profile(cat_url)
+        self._lock = threading.Lock()
+
+    def done(self) -> bool:
+        with self._lock:
+            return self.in_flight == 0 and not self._can_take()
+
+    def _can_take(self) -> bool:
+        return not self.stopped and bool(self.frontier) and self.pages < self.max_pages
+
+    def take(self, n: int) -> List[str]:
+        """İndirilecek en fazla `n` liste sayfası verir; verilen her sayfa ziyaret edilmiş sayılır."""
+        out: List[str] = []
+        with self._lock:
+            while len(out) < n and self._can_take():
+                out.append(self.frontier.popleft())
+                self.pages += 1
+            self.in_flight += len(out)
+        return out
+
+    def _enqueue(self, url: str) -> bool:
+        key = page_key(url)
+        if key in self.queued:
+            return False
+        self.queued.add(key)
+        self.frontier.append(url)
+        return True
+
+    def _page_finished(self, had_new: bool) -> None:
+        self.in_flight -= 1
+        self.empty_streak = 0 if had_new else self.empty_streak + 1
+        if self.empty_streak >= EMPTY_PAGE_LIMIT or self.found >= self.max_products:
+            self.stop_locked()
+
+    def fail(self, page_url: str) -> None:
+        # İndirilemeyen sayfa, ürün getirmeyen sayfa gibi sayılır
+        with self._lock:
+            self._page_finished(had_new=False)
+
+    def feed(self, page_url: str, html: str) -> List[str]:
+        """Bir liste sayfasını işler; yeni ürün linklerini döndürür ve sayfalama adaylarını kuyruğa ekler."""
+        prof = self.profile
+        learned = prof is not None and not audited(page_url)
+        scope = prof.choice("scope") if learned else None
+        pager = prof.choice("pager") if learned else None
+        strategies = pager.split("+") if pager else PAGER_STRATEGIES
+        listing = parse_listing(html, page_url, self.parser, strategies)
+        filtered = self._filter(listing, scope)
+
+        candidates = self._candidates(page_url, listing, strategies)
+        new: List[str] = []
+        with self._lock:
+            for u in filtered:
+                if self.found >= self.max_products:
+                    break
+                if not self.seen.add(u):
+                    continue
+                new.append(u)
+                self.found += 1
+            if not self.stopped:
+                for c, _ in candidates:
+                    self._enqueue(c)
+        if pager and new and not candidates and pager != "bump":
+            # öğrenilen sayfalama hiç aday vermedi: son sayfa mı, site mi değişti? tam sezgilere bakılır
+            full = self._candidates(page_url, parse_listing(html, page_url, self.parser), PAGER_STRATEGIES)
+            with self._lock:
+                fresh = [c for c, via in full if via != "bump" and not self.stopped and self._enqueue(c)]
+            if fresh:
+                prof.miss("pager")
+        elif prof is not None and not pager and new:
+            used = pager_choice({via for _, via in candidates})
+            if used:
+                known = prof.choice("pager")
+                # denetimde son sayfa gibi öğrenilenin bir kısmını kullanan sayfa tutarlı sayılır
+                if known and set(used.split("+")) <= set(known.split("+")):
+                    used = known
+                prof.observe("pager", used)
+        if prof is not None and scope is None and filtered:
+            prof.observe("scope", scope_choice(listing, filtered))
+        with self._lock:
+            self._page_finished(had_new=bool(new))
+        return new
+
+    def _filter(self, listing: ListingPage, scope: Optional[str]) -> List[str]:
+        links = listing.links
+        if scope and scope != MIXED_SCOPE:
+            links = [u for u, i in zip(listing.links, listing.scopes) if CONTENT_SCOPES[i] == scope]
+        filtered = filter_links(links, self.dom, self.include_filter, self.exclude_filter)
+        if not filtered and links is not listing.links:
+            # öğrenilen kapsam boş kaldı; diğer kapsamlarda ürün varsa profil tutmamıştır
+            filtered = filter_links(listing.links, self.dom, self.include_filter, self.exclude_filter)
+            if filtered:
+                self.profile.miss("scope")
+        return filtered
+
+    def _candidates(self, page_url: str, listing: ListingPage, strategies: Sequence[str]) -> List[Tuple[str, str]]:
+        """(sayfa, onu öneren strateji) çiftleri, eski sırayla: sonraki, numaralı, `?page=N+1`."""
+        candidates: List[Tuple[str, str]] = []
+        if listing.next_url:
+            candidates.append((listing.next_url, listing.next_via))
+        candidates.extend((u, "numbered") for u in listing.numbered)
+        if "bump" in strategies:
+            bump = page_url
+            for _ in range(self.prefetch):
+                bump = bump_page_param(bump)
+                if not bump:
+                    break
+                candidates.append((bump, "bump"))
+        return candidates
+
+    def stop_locked(self) -> None:
+        self.stopped = True
+        self.frontier.clear()
+
+    def stop(self) -> None:
+        with self._lock:
+            self.stop_locked()
+
+
+def iter_product_links_from_category(cat_url: str, max_pages: int, max_products: int, include_filter: str, exclude_filter: str,
+                                     prefetch: int = DEFAULT_PAGE_PREFETCH, parser: str = DEFAULT_PARSER,
+                                     seen: Optional[SeenIndex] = None) -> Iterator[str]:
+    crawl = CategoryCrawl(cat_url, max_pages, max_products, include_filter, exclude_filter, prefetch, parser, seen)
+    with ThreadPoolExecutor(max_workers=crawl.prefetch) as pool:
+        futures: Dict = {}
+        while True:
+            for page_url in crawl.take(crawl.prefetch - len(futures)):
+                futures[pool.submit(fetch_html, page_url)] = page_url
+            if not futures:
+                break
+            finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                page_url = futures.pop(fut)
+                html = fut.result()
+                if html:
+                    yield from crawl.feed(page_url, html)
+                else:
+                    crawl.fail(page_url)
+
+
+def extract_product_links_from_category(cat_url: str, max_pages: int, max_products: int, include_filter: str, exclude_filter: str,
+                                        prefetch: int = DEFAULT_PAGE_PREFETCH, parser: str = DEFAULT_PARSER) -> List[str]:
+    return list(iter_product_links_from_category(cat_url, max_pages, max_products, include_filter, exclude_filter,
+                                                 prefetch, parser))
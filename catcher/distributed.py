@@ -0,0 +1,197 @@
+"""Paylaşılan sınır üzerinden çok süreçli / çok makineli tarama.
+
+    tohumla:   python -m catcher -s https://shop.example --frontier katalog
+    çalış:     python -m catcher --frontier katalog --worker      (istenen kadar süreç / makine)
+    yaz:       python -m catcher --frontier katalog --export -o out/katalog.parquet
+
+Worker süreci `workers` thread'le URL kiralar, tarar ve sonucu sınıra yazar; canlı kiraları arka
+planda uzatır. Hatalı sonuç `FRONTIER_MAX_ATTEMPTS`'e kadar kuyruğa geri bırakılır (başka worker
+deneyebilir). Host hız sınırı ve önbellek süreç başınadır: N worker süreci bir host'a en fazla
+N × `--rate` istek gönderir.
+
+Durdurulan (Ctrl+C, `--deadline`) worker yeni URL kiralamaz; elindeki kiralardan taranmamış olanları
+sınıra geri bırakır, taradıklarını yazar. Durdurulan tohumlama sınırı mühürlemez.
+"""
+
+import os
+import socket
+import threading
+from typing import Dict, Optional
+
+from catcher.cancel import CancelToken
+from catcher.config import FRONTIER_ADD_BATCH, FRONTIER_LEASE_BATCH, FRONTIER_LEASE_SECS, FRONTIER_MAX_ATTEMPTS, FRONTIER_POLL_SECS
+from catcher.engine import JobResult, StatusFn, _noop, image_dir, iter_links, output_paths, prepare, progress_hook
+from catcher.export import StreamingExport
+from catcher.extract import error_product, scrape_product
+from catcher.fetch import url_deadline
+from catcher.frontier import Frontier, Lease
+from catcher.media import ImageStage
+from catcher.metrics import MetricsFile, ProgressFn, count, reset_metrics, timer
+from catcher.models import Product, is_failed
+from catcher.options import JobOptions
+from catcher.profiles import save_profiles
+from catcher.run import JobRun
+from catcher.urls import SeenIndex
+
+
+def seed_frontier(opts: JobOptions, frontier: Frontier, status: StatusFn = _noop,
+                  cancel: Optional[CancelToken] = None) -> int:
+    """İşin kaynağındaki URL'leri sınıra ekler ve mühürler; yeni eklenen sayısı."""
+    cancel = cancel if cancel is not None else CancelToken()
+    if opts.deadline > 0:
+        cancel.set_deadline(opts.deadline)
+    prepare(opts)
+    frontier.seal(False)  # önceki tohumlamadan kalan mühür worker'ları erken bitirmesin
+    added, batch = 0, []
+    links = iter_links(opts, SeenIndex())
+    for url in links:
+        if cancel.stopped:
+            break
+        batch.append(url)
+        if len(batch) >= FRONTIER_ADD_BATCH:
+            added += frontier.add(batch)
+            batch = []
+            status(f"Sınıra {added} yeni URL eklendi…")
+    if batch:
+        added += frontier.add(batch)
+    close = getattr(links, "close", None)
+    if close is not None:
+        close()
+    if cancel.stopped:
+        # keşif yarım: worker'lar yeni tohumlamayı bekler, eklenenleri taramaya devam eder
+        status(f"Tohumlama durduruldu; sınır mühürlenmedi ({added} yeni URL eklendi)")
+    else:
+        frontier.seal()
+    save_profiles()
+    return added
+
+
+class FrontierWorker:
+    def __init__(self, frontier: Frontier, opts: JobOptions, owner: Optional[str] = None,
+                 progress: Optional[ProgressFn] = None, images: Optional[ImageStage] = None,
+                 ttl: float = FRONTIER_LEASE_SECS, cancel: Optional[CancelToken] = None):
+        self.frontier = frontier
+        self.opts = opts
+        self.owner = owner or f"{socket.gethostname()}:{os.getpid()}"
+        self.ttl = ttl
+        self.run = JobRun(keep=False, progress=progress, images=images, cancel=cancel)
+        self.lost = 0      # kirası başkasına geçtiği için atılan sonuç
+        self.released = 0  # yeniden denenmek üzere geri bırakılan
+        self._held: Dict[int, Lease] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def work(self) -> JobRun:
+        """Sınır tükenene (mühürlü ve boş) ya da iş durana kadar tarar."""
+        beat = threading.Thread(target=self._heartbeat, daemon=True)
+        beat.start()
+        pool = [threading.Thread(target=self._loop, daemon=True) for _ in range(max(1, self.opts.workers))]
+        for t in pool:
+            t.start()
+        try:
+            for t in pool:
+                t.join()
+        finally:
+            self._stop.set()
+            beat.join()
+        self.run.discovery_done()
+        return self.run
+
+    def _loop(self) -> None:
+        fast = tuple(self.opts.fast_fields)
+        cancel = self.run.cancel
+        while not self._stop.is_set() and not cancel.stopped:
+            with timer("frontier"):
+                leases = self.frontier.lease(self.owner, FRONTIER_LEASE_BATCH, self.ttl)
+            if not leases:
+                if self.frontier.finished():
+                    return
+                cancel.wait(FRONTIER_POLL_SECS)  # keşif sürüyor ya da başka worker'ın kirası düşecek
+                continue
+            with self._lock:
+                self._held.update((x.id, x) for x in leases)
+            for lease in leases:
+                if cancel.stopped:
+                    self._give_back(lease)
+                    continue
+                self.run.admit(lease.url)
+                try:
+                    with url_deadline(self.opts.url_timeout):
+                        prod = scrape_product(lease.url, self.opts.parser, fast)
+                except Exception as e:
+                    prod = error_product(lease.url, e)
+                self._finish(lease, prod)
+
+    def _give_back(self, lease: Lease) -> None:
+        # taranmadan durulan kira: başka worker (ya da sonraki çalışma) hemen alabilsin
+        with self._lock:
+            self._held.pop(lease.id, None)
+        if self.frontier.release(lease):
+            self.run.drop(lease.url)
+            count("frontier_released")
+
+    def _finish(self, lease: Lease, prod: Product) -> None:
+        with self._lock:
+            self._held.pop(lease.id, None)
+        if is_failed(prod) and lease.attempts < FRONTIER_MAX_ATTEMPTS:
+            if self.frontier.release(lease):
+                self.released += 1
+                count("frontier_released")
+            return
+        with timer("frontier"):
+            accepted = self.frontier.complete(lease, prod)
+        if accepted:
+            self.run.emit(prod)
+        else:
+            self.lost += 1
+            count("frontier_lost")
+
+    def _heartbeat(self) -> None:
+        while not self._stop.wait(self.ttl / 3):
+            with self._lock:
+                held = list(self._held.values())
+            kept = set(self.frontier.extend(held, self.ttl))
+            with self._lock:
+                for lease in held:
+                    if lease.id not in kept:
+                        self._held.pop(lease.id, None)
+
+
+def run_worker(opts: JobOptions, frontier: Frontier, status: StatusFn = _noop,
+               progress: Optional[ProgressFn] = None, ttl: float = FRONTIER_LEASE_SECS,
+               cancel: Optional[CancelToken] = None) -> FrontierWorker:
+    cancel = cancel if cancel is not None else CancelToken()
+    if opts.deadline > 0:
+        cancel.set_deadline(opts.deadline)
+    prepare(opts)
+    reset_metrics()
+    dump = MetricsFile(opts.metrics_path) if opts.metrics_path else None
+    images = ImageStage(image_dir(opts, {}), opts.image_workers) if opts.images else None
+    worker = FrontierWorker(frontier, opts, progress=progress_hook(progress, dump), images=images, ttl=ttl,
+                            cancel=cancel)
+    status(f"Worker {worker.owner}: {opts.workers} thread sınırdan URL kiralıyor…")
+    try:
+        worker.work()
+        cancel.set_deadline(0)
+        if cancel.stopped:
+            status(f"Worker durduruldu: {worker.run.dropped} kira sınıra geri bırakıldı")
+    finally:
+        if images is not None:
+            if cancel.stopped:
+                images.discard()
+            images.close()
+        save_profiles()
+        worker.run.report()
+        if dump is not None:
+            dump.write(worker.run.snapshot())
+    return worker
+
+
+def export_frontier(opts: JobOptions, frontier: Frontier) -> JobResult:
+    """Sınırdaki tüm satırları tek sink'e yazar (her URL bir kez)."""
+    sink = StreamingExport(output_paths(opts))
+    for values in frontier.rows():
+        sink.write_row(values)
+    with timer("export"):
+        paths = sink.close()
+    return JobResult(urls=[], products=[], paths=paths, errors=sink.errors, rows=sink.rows)
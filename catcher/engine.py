@@ -0,0 +1,303 @@
+"""Başsız (GUI'siz) iş motoru: link toplama, tarama ve dışa aktarma."""
+
+import os
+import queue
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from catcher import aio
+from catcher.cache import open_cache
+from catcher.cancel import DEADLINE, CancelToken
+from catcher.config import CACHE_FILENAME, IMAGE_DIRNAME, OUTPUT_DIR
+from catcher.crawl import CategoryCrawl, extract_product_links_from_category, iter_product_links_from_category
+from catcher.export import StreamingExport, default_paths, resolve_paths
+from catcher.fetch import set_body_limit, set_cache, set_limiter
+from catcher.journal import DONE, FAILED, PENDING, Journal, journal_path
+from catcher.media import ImageStage
+from catcher.metrics import MetricsFile, Progress, ProgressFn, reset_metrics, timer
+from catcher.models import COLUMNS, Product
+from catcher.monitor import DELTA_COLUMNS, MonitorState, monitor_path, use_monitor
+from catcher.options import JobOptions
+from catcher.procpool import ProcessParseStage
+from catcher.profiles import profiles_path, save_profiles, use_profiles
+from catcher.run import JobRun
+from catcher.sitemap import SitemapCrawl
+from catcher.throttle import make_limiter
+from catcher.urls import SeenIndex
+from catcher.workers import STOP, ScrapeWorker
+
+StatusFn = Callable[[str], None]
+
+
+@dataclass
+class JobResult:
+    urls: List[str]
+    products: Sequence[Product]  # run_job: sütunlu ResultStore
+    paths: Dict[str, str] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+    rows: int = 0  # yazılan satır (keep_products=False iken products boş kalır)
+    images: Dict[str, int] = field(default_factory=dict)  # görsel aşaması sayaçları (kapalıysa boş)
+    image_manifest: Optional[str] = None
+    changes: Dict[str, int] = field(default_factory=dict)  # izleme modu: değişiklik türü -> sayı
+
+
+def _noop(_: str) -> None:
+    pass
+
+
+def prepare(opts: JobOptions) -> None:
+    """İşten önce süreç geneli ayarları (önbellek, host hız sınırı, gövde sınırı, site profilleri) uygular."""
+    path = opts.cache_path or os.path.join(OUTPUT_DIR, "cache", CACHE_FILENAME)
+    set_cache(open_cache(path, opts.cache, opts.cache_ttl, opts.cache_max_mb * 1024 * 1024))
+    set_limiter(make_limiter(opts.rate, opts.robots))
+    set_body_limit(opts.max_body_mb * 1024 * 1024)
+    use_profiles(profiles_path(opts.profiles_path) if opts.profiles else None)
+
+
+def collect_links(opts: JobOptions) -> List[str]:
+    prepare(opts)
+    if opts.category_url:
+        links = extract_product_links_from_category(
+            opts.category_url, opts.max_pages, opts.max_products,
+            opts.include_filter, opts.exclude_filter, opts.page_prefetch, opts.parser,
+        )
+        save_profiles()
+        return links
+    if opts.sitemap_url:
+        return list(sitemap_for(opts))
+    return list(SeenIndex().unique(opts.urls))
+
+
+def resolve_engine(engine: str) -> str:
+    # aiohttp yoksa sessizce thread yoluna düş
+    if engine == "async" and not aio.available():
+        return "threads"
+    return engine
+
+
+def scrape_urls(urls: List[str], opts: Optional[JobOptions] = None, run: Optional[JobRun] = None) -> Sequence[Product]:
+    opts = opts or JobOptions()
+    run = run or JobRun(collapse=opts.collapse_canonical)
+    # tekrarlar ve izleme parametreli yazımlar daha kuyruğa girmeden elenir
+    urls = list(run.seen.unique(urls))
+    if urls:
+        prepare(opts)
+        _scrape_list(urls, opts, run)
+    return run.products
+
+
+def _scrape_list(urls: List[str], opts: JobOptions, run: JobRun) -> None:
+    if resolve_engine(opts.engine) == "async":
+        aio.scrape_urls(urls, min(opts.concurrency, len(urls)), opts, run)
+    else:
+        scrape_urls_threaded(urls, opts, run, min(opts.workers, len(urls)))
+
+
+def scrape_urls_threaded(urls: Iterable[str], opts: JobOptions, run: JobRun, workers: Optional[int] = None) -> None:
+    # Kaynak bir üreteç olabilir: bulunan her URL hemen kuyruğa girer, worker'lar beklemeden tüketir.
+    workers = max(1, workers or opts.workers)
+    in_q: queue.Queue = queue.Queue(maxsize=workers * 4)
+    stage = None
+    if opts.parse_processes > 0:
+        stage = ProcessParseStage(opts.parse_processes, run.emit, opts.parse_batch, opts.parser, opts.fast_fields)
+    pool = [ScrapeWorker(in_q, run.emit, opts.parser, stage, opts.fast_fields, run.cancel, run.drop, opts.url_timeout)
+            for _ in range(workers)]
+    for w in pool:
+        w.start()
+    try:
+        for u in urls:
+            if run.stopped:
+                break
+            if run.admit(u):
+                in_q.put(u)
+        run.discovery_done()
+    finally:
+        close = getattr(urls, "close", None)
+        if close is not None:
+            close()  # üreteç (kategori gezintisi) uçuştaki liste sayfalarını bitirip kapanır
+        for _ in pool:
+            in_q.put(STOP)
+        for w in pool:
+            w.join()
+        if stage is not None:
+            stage.close()
+
+
+def crawl_for(opts: JobOptions, seen: Optional[SeenIndex] = None) -> CategoryCrawl:
+    return CategoryCrawl(opts.category_url, opts.max_pages, opts.max_products,
+                         opts.include_filter, opts.exclude_filter, opts.page_prefetch, opts.parser, seen)
+
+
+def scrape_category(opts: JobOptions, run: Optional[JobRun] = None) -> Tuple[List[str], Sequence[Product]]:
+    """Kategoriyi gezerken bulunan ürünleri aynı anda tarar; (bulunan URL'ler, ürünler) döndürür."""
+    run = run or JobRun(collapse=opts.collapse_canonical)
+    prepare(opts)
+    # gezinti, tarama aşamasının indeksini paylaşır (canonical ile eklenen adresler de atlanır)
+    if resolve_engine(opts.engine) == "async":
+        aio.scrape_category(crawl_for(opts, run.seen), opts, run)
+    else:
+        scrape_urls_threaded(iter_links(opts, run.seen), opts, run)
+    return run.urls, run.products
+
+
+def sitemap_for(opts: JobOptions, seen: Optional[SeenIndex] = None) -> SitemapCrawl:
+    return SitemapCrawl(opts.sitemap_url, opts.max_products, opts.include_filter, opts.exclude_filter,
+                        opts.since, seen)
+
+
+def scrape_sitemap(opts: JobOptions, run: Optional[JobRun] = None) -> Tuple[List[str], Sequence[Product]]:
+    """Site haritasını akış halinde okurken bulunan ürünleri aynı anda tarar."""
+    run = run or JobRun(collapse=opts.collapse_canonical)
+    prepare(opts)
+    links = iter_links(opts, run.seen)
+    if resolve_engine(opts.engine) == "async":
+        aio.scrape_iter(links, min(opts.concurrency, opts.max_products), opts, run)
+    else:
+        scrape_urls_threaded(links, opts, run)
+    return run.urls, run.products
+
+
+def iter_links(opts: JobOptions, seen: SeenIndex) -> Iterator[str]:
+    """İşin kaynağındaki ürün URL'leri (kategori / site haritası / liste), bulundukça."""
+    if opts.category_url:
+        return iter_product_links_from_category(
+            opts.category_url, opts.max_pages, opts.max_products,
+            opts.include_filter, opts.exclude_filter, opts.page_prefetch, opts.parser, seen,
+        )
+    if opts.sitemap_url:
+        return iter(sitemap_for(opts, seen))
+    return seen.unique(opts.urls)
+
+
+def open_journal(opts: JobOptions) -> Optional[Journal]:
+    if not opts.journal:
+        return None
+    return Journal(journal_path(opts.journal), opts.category_url or opts.sitemap_url or "urls", opts.resume,
+                   opts.fresh)
+
+
+def open_monitor(opts: JobOptions) -> Optional[MonitorState]:
+    if not opts.monitor:
+        return None
+    return MonitorState(monitor_path(opts.monitor), opts.category_url or opts.sitemap_url or "urls")
+
+
+def covers_source(opts: JobOptions, run: JobRun) -> bool:
+    # ürün sınırına takılan, --since ile süzülen ya da durdurulan keşif kaynağın tamamını görmemiştir
+    if opts.since is not None or run.stopped:
+        return False
+    return not ((opts.category_url or opts.sitemap_url) and len(run.urls) >= opts.max_products)
+
+
+def output_paths(opts: JobOptions) -> Dict[str, str]:
+    if opts.output_path:
+        return resolve_paths(opts.output_path, opts.formats)
+    return default_paths(opts.output_dir, opts.formats, kind="delta" if opts.monitor else "scrape")
+
+
+def image_dir(opts: JobOptions, paths: Dict[str, str]) -> str:
+    if opts.images_dir:
+        return opts.images_dir
+    # çıktı dosyalarının yanına
+    first = next(iter(paths.values()), None)
+    return os.path.join(os.path.dirname(os.path.abspath(first)) if first else opts.output_dir, IMAGE_DIRNAME)
+
+
+def progress_hook(progress: Optional[ProgressFn], dump: Optional[MetricsFile]) -> Optional[ProgressFn]:
+    if dump is None:
+        return progress
+
+    def hook(p: Progress) -> None:
+        if progress is not None:
+            progress(p)
+        dump.maybe_write(p)
+    return hook
+
+
+def stop_message(cancel: CancelToken, dropped: int, resumable: bool = False) -> str:
+    why = "süre doldu" if cancel.reason == DEADLINE else "iptal edildi"
+    msg = f"İş durduruldu ({why}): kuyruktaki {dropped} URL taranmadı, kısmi sonuçlar yazıldı"
+    return msg + ("; --resume ile kalanlar tamamlanır" if resumable else "")
+
+
+def run_job(opts: JobOptions, status: StatusFn = _noop, progress: Optional[ProgressFn] = None,
+            cancel: Optional[CancelToken] = None) -> JobResult:
+    """`progress` iş sürerken (işçi thread'lerinden) `Progress` ile çağrılır; ölçümler `get_metrics()`'te.
+
+    `cancel` (başka thread'den / sinyalden) iptal edilirse ya da `opts.deadline` dolarsa iş yeni URL
+    almadan biter; uçuştakiler ve o ana kadar bulunanlar çıktıya yazılır.
+    """
+    cancel = cancel if cancel is not None else CancelToken()
+    if opts.deadline > 0:
+        cancel.set_deadline(opts.deadline)
+    reset_metrics()
+    dump = MetricsFile(opts.metrics_path) if opts.metrics_path else None
+    journal = open_journal(opts)
+    monitor = open_monitor(opts)
+    # satırlar bittikçe dosyalara akar; iş sonunda tek seferlik dışa aktarma yok
+    sink = StreamingExport(output_paths(opts), DELTA_COLUMNS if monitor is not None else COLUMNS)
+    images = ImageStage(image_dir(opts, sink.paths), opts.image_workers) if opts.images else None
+    run = JobRun(journal, sink, keep=opts.keep_products, collapse=opts.collapse_canonical,
+                 progress=progress_hook(progress, dump), images=images, monitor=monitor, cancel=cancel)
+    use_monitor(monitor)
+    image_stats: Dict[str, int] = {}
+    try:
+        if journal is not None and opts.resume:
+            counts = journal.counts()
+            status(f"Günlükten devam: {counts.get(DONE, 0)} tamam, {counts.get(FAILED, 0)} hatalı, "
+                   f"{counts.get(PENDING, 0)} bekleyen")
+            for prod in journal.products(DONE):
+                run.replay(prod)
+        discovery = opts.category_url or opts.sitemap_url
+        if discovery and journal is not None and journal.crawl_done:
+            # keşif önceki çalışmada bitti: liste sayfalarına / haritaya gitmeden kalanları tara
+            remaining = journal.remaining()
+            status(f"Keşif günlükte tamam; kalan {len(remaining)} URL işleniyor…")
+            scrape_urls(remaining, opts, run)
+        elif opts.category_url:
+            status("Kategori taranıyor; bulunan ürünler eşzamanlı işleniyor…")
+            scrape_category(opts, run)
+            if journal is not None and not run.stopped:
+                journal.mark_crawl_done()
+        elif opts.sitemap_url:
+            status("Site haritası okunuyor; bulunan ürünler eşzamanlı işleniyor…")
+            scrape_sitemap(opts, run)
+            if journal is not None and not run.stopped:
+                journal.mark_crawl_done()
+        else:
+            status(f"Toplam {len(opts.urls)} URL işleniyor…")
+            scrape_urls(list(opts.urls), opts, run)
+        cancel.set_deadline(0)  # tarama bitti: sonradan dolan süre işi yarıda kesilmiş saymasın
+        if run.stopped:
+            status(stop_message(cancel, run.dropped, journal is not None))
+        if run.skipped:
+            status(f"{run.skipped} URL önceki çalışmada tamamlanmıştı, atlandı")
+        if run.duplicates:
+            status(f"{run.duplicates} ürün canonical adresi tekrarlandığı için yazılmadı")
+        if monitor is not None:
+            if covers_source(opts, run):
+                run.removed()
+            else:
+                status("Kaynak tam gezilmedi (ürün sınırı / --since / durdurma); kaldırılan ürünler yazılmadı")
+    finally:
+        if images is not None:
+            if run.stopped:
+                images.discard()  # durdurulan işte sıradaki görseller beklenmez
+            elif images.q.qsize():
+                status(f"Kalan görseller indiriliyor ({images.q.qsize()} ürün)…")
+            image_stats = images.close()
+        with timer("export"):  # xlsx/parquet gibi dosyalar kapanırken yazılır
+            paths = sink.close()
+        if journal is not None:
+            journal.close()
+        if monitor is not None:
+            use_monitor(None)
+            monitor.close()
+        save_profiles()
+        run.report()
+        if dump is not None:
+            dump.write(run.snapshot())
+    # boş iş de dosya yollarını / yazma hatalarını / sayaçları döndürür; "bulunamadı" kararı çağıranda
+    return JobResult(urls=run.urls, products=run.products, paths=paths, errors=sink.errors, rows=sink.rows,
+                     images=image_stats, image_manifest=images.manifest_path if images is not None else None,
+                     changes=dict(monitor.stats) if monitor is not None else {})
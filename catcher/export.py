@@ -0,0 +1,209 @@
+"""Sonuç dışa aktarımı (XLSX/CSV/JSONL/Parquet).
+
+Satırlar iş sürerken akış halinde yazılır: her biçimin bir `RowSink`'i vardır ve ürün bittikçe
+`write` ile dosyaya eklenir. Bellekte tüm veri seti hiç tutulmaz. Sink'ler sütun sırasıyla değer
+demeti alır (`write_row`); `ResultStore`'dan yazarken satır başına `Product`/dict kurulmaz. XLSX, openpyxl'in write-only
+modu ile sabit bellekte yazılır ve Excel'in satır sınırında yeni sayfaya geçer. Parquet satır
+grupları halinde yazılır. openpyxl/pyarrow yalnızca o biçim istenince yüklenir.
+"""
+
+import csv
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from catcher.config import OUTPUT_SUFFIX, ensure_dir
+from catcher.models import COLUMNS, Product, row_values
+
+EXPORT_FORMATS = ("xlsx", "csv", "jsonl", "parquet")
+DEFAULT_FORMATS = ("xlsx", "csv")
+
+XLSX_MAX_ROWS = 1_048_576  # başlık dahil sayfa başına satır sınırı
+XLSX_SHEET = "products"
+PARQUET_ROW_GROUP = 10_000
+
+
+def default_paths(output_dir: str, formats: Sequence[str] = DEFAULT_FORMATS, ts: Optional[str] = None,
+                  kind: str = "scrape") -> Dict[str, str]:
+    ts = ts or time.strftime("%Y%m%d_%H%M%S")
+    base = os.path.join(output_dir, f"sehrazat_{kind}_{OUTPUT_SUFFIX}_{ts}")
+    return {fmt: f"{base}.{fmt}" for fmt in formats}
+
+
+def resolve_paths(output: str, formats: Sequence[str] = DEFAULT_FORMATS) -> Dict[str, str]:
+    # Uzantılı bir dosya verilirse yalnızca o biçim yazılır; aksi halde klasör kabul edilir.
+    ext = os.path.splitext(output)[1].lower().lstrip(".")
+    if ext in EXPORT_FORMATS:
+        return {ext: output}
+    return default_paths(output, formats)
+
+
+# ---- Satır yazıcıları ---- #
+Row = Tuple[Optional[str], ...]
+
+
+class RowSink:
+    def write(self, prod: Product) -> None:
+        self.write_row(row_values(prod))
+
+    def write_row(self, values: Row) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class CsvSink(RowSink):
+    def __init__(self, path: str, columns: Sequence[str] = COLUMNS):
+        self.fh = open(path, "w", newline="", encoding="utf-8")
+        self.writer = csv.writer(self.fh)
+        self.writer.writerow(columns)
+
+    def write_row(self, values: Row) -> None:
+        self.writer.writerow(values)
+
+    def close(self) -> None:
+        self.fh.close()
+
+
+class JsonlSink(RowSink):
+    def __init__(self, path: str, columns: Sequence[str] = COLUMNS):
+        self.fh = open(path, "w", encoding="utf-8")
+        self.columns = columns
+
+    def write_row(self, values: Row) -> None:
+        self.fh.write(json.dumps(dict(zip(self.columns, values)), ensure_ascii=False))
+        self.fh.write("\n")
+
+    def close(self) -> None:
+        self.fh.close()
+
+
+class XlsxSink(RowSink):
+    def __init__(self, path: str, columns: Sequence[str] = COLUMNS, max_rows: int = XLSX_MAX_ROWS):
+        from openpyxl import Workbook
+        from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+        self.path = path
+        self.columns = columns
+        self.max_rows = max_rows
+        self._illegal = ILLEGAL_CHARACTERS_RE
+        self.wb = Workbook(write_only=True)
+        self.sheets = 0
+        self._new_sheet()
+
+    def _new_sheet(self) -> None:
+        self.sheets += 1
+        title = XLSX_SHEET if self.sheets == 1 else f"{XLSX_SHEET}_{self.sheets}"
+        self.ws = self.wb.create_sheet(title)
+        self.ws.append(self.columns)
+        self.rows = 1
+
+    def write_row(self, values: Row) -> None:
+        if self.rows >= self.max_rows:
+            self._new_sheet()
+        # kontrol karakterleri openpyxl'de hata verir; sayfadaki metinden gelebilirler
+        self.ws.append([self._illegal.sub("", v) if isinstance(v, str) else v for v in values])
+        self.rows += 1
+
+    def close(self) -> None:
+        self.wb.save(self.path)
+
+
+class ParquetSink(RowSink):
+    def __init__(self, path: str, columns: Sequence[str] = COLUMNS, row_group: int = PARQUET_ROW_GROUP):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("Parquet için pyarrow kurulu değil (pip install pyarrow)")
+        self.pa = pa
+        self.schema = pa.schema([(c, pa.string()) for c in columns])
+        self.writer = pq.ParquetWriter(path, self.schema)
+        self.row_group = max(1, row_group)
+        self.buf: List[Tuple[Any, ...]] = []
+
+    def write_row(self, values: Row) -> None:
+        self.buf.append(values)
+        if len(self.buf) >= self.row_group:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self.buf:
+            return
+        cols = list(zip(*self.buf))
+        self.writer.write_table(self.pa.Table.from_arrays([self.pa.array(c, self.pa.string()) for c in cols],
+                                                          schema=self.schema))
+        self.buf = []
+
+    def close(self) -> None:
+        self.flush()
+        self.writer.close()
+
+
+SINKS = {"xlsx": XlsxSink, "csv": CsvSink, "jsonl": JsonlSink, "parquet": ParquetSink}
+
+
+class StreamingExport:
+    """Biçim başına bir sink; bir biçim hata verirse yalnızca o biçim düşer, diğerleri devam eder.
+
+    Dosyalar ilk satırda açılır; hiç satır gelmezse dosya oluşmaz. Birden çok thread'den
+    `write` çağrılabilir. `columns` ürün sütunlarından farklı satırlar (ör. izleme deltası) içindir.
+    """
+
+    def __init__(self, paths: Dict[str, str], columns: Sequence[str] = COLUMNS):
+        self.paths = dict(paths)
+        self.columns = tuple(columns)
+        self.errors: Dict[str, str] = {}
+        self.rows = 0
+        self._sinks: Optional[Dict[str, RowSink]] = None
+        self._lock = threading.Lock()
+
+    def _open(self) -> Dict[str, RowSink]:
+        sinks: Dict[str, RowSink] = {}
+        for fmt, path in self.paths.items():
+            try:
+                ensure_dir(os.path.dirname(os.path.abspath(path)))
+                sinks[fmt] = SINKS[fmt](path, self.columns)
+            except Exception as e:
+                self.errors[fmt] = str(e)
+        return sinks
+
+    def write(self, prod: Product) -> None:
+        self.write_row(row_values(prod))
+
+    def write_row(self, values: Row) -> None:
+        with self._lock:
+            if self._sinks is None:
+                self._sinks = self._open()
+            for fmt, sink in list(self._sinks.items()):
+                try:
+                    sink.write_row(values)
+                except Exception as e:
+                    self.errors[fmt] = str(e)
+                    del self._sinks[fmt]
+            self.rows += 1
+
+    def close(self) -> Dict[str, str]:
+        """Dosyaları kapatır; başarıyla yazılan {biçim: yol} döndürür."""
+        with self._lock:
+            sinks, self._sinks = self._sinks or {}, {}
+        written: Dict[str, str] = {}
+        for fmt, sink in sinks.items():
+            try:
+                sink.close()
+                written[fmt] = self.paths[fmt]
+            except Exception as e:
+                self.errors[fmt] = str(e)
+        return written
+
+
+def export_products(products: Iterable[Product], paths: Dict[str, str]) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Her biçimi ayrı dener; yazılan yolları ve biçim başına hata mesajlarını döndürür."""
+    out = StreamingExport(paths)
+    rows = getattr(products, "rows", None)  # ResultStore: satırlar Product kurulmadan akar
+    for values in rows() if rows is not None else map(row_values, products):
+        out.write_row(values)
+    written = out.close()
+    return written, out.errors
@@ -0,0 +1,211 @@
+"""Ürün ayrıştırma: JSON-LD + meta + metin sezgileri."""
+
+import re
+from typing import Dict, Optional, Sequence, Tuple
+from urllib.parse import urljoin
+
+from catcher.fetch import HeadCheck, fetch_html
+from catcher.analysis import PageAnalysis, analyze_html
+from catcher.images import images_with_source
+from catcher.matcher import term_matcher
+from catcher.metrics import timer
+from catcher.models import ERROR_NOTE_PREFIX, FETCH_FAILED_NOTE, Product
+from catcher.monitor import unchanged_product
+from catcher.parsing import DEFAULT_PARSER, head_section, text_or_none
+from catcher.profiles import FIELD_ASPECTS, TEXT_FIELDS, SiteProfile, audited, learned_fast, site_profile
+
+Sources = Dict[str, str]  # alan -> değeri sağlayan kaynak (site profili öğrenir)
+
+
+def infer_colors(text: str) -> Optional[str]:
+    has_hint = term_matcher("color").search
+    lines = [ln.strip() for ln in re.split(r"[\n\r\.\-•]", text) if ln.strip()]
+    hits = [ln for ln in lines if has_hint(ln.lower())]
+    return "; ".join(dict.fromkeys(hits)) or None
+
+
+def infer_sizes(text: str) -> Optional[str]:
+    has_hint = term_matcher("size").search
+    lines = [ln.strip() for ln in re.split(r"[\n\r]", text) if ln.strip()]
+    hits = [ln for ln in lines if has_hint(ln.lower())]
+    dims = re.findall(r"\b(\d{2,3})\s*[x×]\s*(\d{2,3})\b", text.lower())
+    if dims:
+        hits.append("; ".join(["x".join(d) for d in dims]))
+    return "; ".join(dict.fromkeys(hits)) or None
+
+
+def infer_material(text: str) -> Tuple[Optional[str], Optional[str]]:
+    mats = term_matcher("material").findall(text.lower())
+    ratio_hits = re.findall(r"%(?:\s*)?(\d{1,3})", text)
+    ratio = ", ".join([f"%{r}" for r in ratio_hits]) if ratio_hits else None
+    mat = ", ".join(mats) if mats else None
+    return mat or None, ratio
+
+
+def scrape_product(url: str, parser: str = DEFAULT_PARSER, fast: Sequence[str] = ()) -> Product:
+    # site profili alanların hepsinin head'den geldiğini öğrendiyse hızlı yol kendiliğinden açılır
+    fast = fast or learned_fast(url)
+    html = fetch_html(url, head_check(url, parser, fast))
+    if not html:
+        return failed_product(url)
+    return extract_product(url, html, parser, fast)
+
+
+def failed_product(url: str) -> Product:
+    return Product(url=url, raw_note=FETCH_FAILED_NOTE)
+
+
+def error_product(url: str, exc: BaseException) -> Product:
+    return Product(url=url, raw_note=f"{ERROR_NOTE_PREFIX}{exc}")
+
+
+def apply_json_ld(prod: Product, ld: dict, url: str) -> None:
+    prod.title = text_or_none(ld.get("name")) or prod.title
+    if isinstance(ld.get("brand"), dict):
+        prod.brand = text_or_none(ld.get("brand", {}).get("name")) or prod.brand
+    else:
+        prod.brand = text_or_none(ld.get("brand")) or prod.brand
+    offers = ld.get("offers")
+    if isinstance(offers, dict):
+        prod.price = text_or_none(offers.get("price"))
+        prod.currency = text_or_none(offers.get("priceCurrency"))
+    prod.sku = text_or_none(ld.get("sku")) or prod.sku
+    prod.colors = text_or_none(ld.get("color")) or prod.colors
+    prod.sizes = text_or_none(ld.get("size")) or prod.sizes
+    mat_field = text_or_none(ld.get("material"))
+    if mat_field:
+        prod.material = mat_field
+    imgs = ld.get("image")
+    if imgs:
+        if isinstance(imgs, list):
+            prod.image_urls = "; ".join([urljoin(url, i if isinstance(i, str) else i.get("url", "")) for i in imgs])
+        elif isinstance(imgs, str):
+            prod.image_urls = urljoin(url, imgs)
+
+
+def apply_meta_price(prod: Product, page: PageAnalysis) -> None:
+    if not prod.price:
+        price_meta = page.meta(["product:price:amount", "og:price:amount"]) or None
+        prod.price = price_meta
+    if not prod.currency:
+        currency_meta = page.meta(["product:price:currency", "og:price:currency"]) or None
+        prod.currency = currency_meta
+
+
+def new_product(url: str, page: PageAnalysis) -> Product:
+    prod = Product(url=url)
+    if page.canonical:
+        prod.canonical_url = urljoin(url, page.canonical)
+    return prod
+
+
+def head_product(url: str, html: str, parser: str = DEFAULT_PARSER, fields: Sequence[str] = ()) -> Optional[Product]:
+    """Hızlı yol: yalnızca <head> ayrıştırılır; JSON-LD + meta `fields`'in hepsini doldurmadıysa None."""
+    head = head_section(html)
+    if head is None:
+        return None
+    with timer("parse"):
+        page = analyze_html(head, parser)
+    if not page.json_ld:
+        return None
+    prod = new_product(url, page)
+    apply_json_ld(prod, page.json_ld, url)
+    apply_meta_price(prod, page)
+    # başlık yedeği (h1 > og:title) gövdeye bağlı; burada yalnızca JSON-LD adı sayılır
+    if not all(getattr(prod, f) for f in fields):
+        return None
+    return prod
+
+
+def head_check(url: str, parser: str = DEFAULT_PARSER, fast: Sequence[str] = ()) -> Optional[HeadCheck]:
+    """Hızlı yolda indirmeyi head'de kesmek için fetch'e verilen sınama (hızlı yol kapalıysa None)."""
+    if not fast:
+        return None
+    return lambda head: head_product(url, head, parser, fast) is not None
+
+
+def extract_product(url: str, html: str, parser: str = DEFAULT_PARSER, fast: Sequence[str] = ()) -> Product:
+    # izleme modu: sayfanın ilgili bölgesi değişmediyse son bilinen ürün
+    known = unchanged_product(url, html)
+    if known is not None:
+        return known
+    if fast:
+        prod = head_product(url, html, parser, fast)
+        if prod is not None:
+            return prod
+    profile = site_profile(url)
+    text = galleries = True
+    if profile is not None and not audited(url):
+        text, galleries = profile.needs_text(), profile.needs_galleries()
+    prod, sources = parse_product(url, html, parser, text, galleries)
+    if profile is not None and not (text and galleries) and profile.contradicts(sources):
+        # sayfa profilden sapıyor: atlanan metin / galeri toplanarak yeniden (observe sapmayı sayar)
+        prod, sources = parse_product(url, html, parser)
+    if profile is not None:
+        learn_product(profile, html, sources)
+    return prod
+
+
+def parse_product(url: str, html: str, parser: str = DEFAULT_PARSER, text: bool = True,
+                  galleries: bool = True) -> Tuple[Product, Sources]:
+    with timer("parse"):
+        page = analyze_html(html, parser, text, galleries)
+    sources: Sources = {}
+    with timer("extract"):
+        prod = product_from_page(url, page, sources)
+    return prod, sources
+
+
+def learn_product(profile: SiteProfile, html: str, sources: Sources) -> None:
+    head = head_section(html)
+    profile.observe("ld_head", "yes" if head is not None and "ld+json" in head else "no")
+    for aspect in FIELD_ASPECTS:
+        profile.observe(aspect, sources[aspect])
+
+
+def product_from_page(url: str, page: PageAnalysis, sources: Optional[Sources] = None) -> Product:
+    """`sources` verilirse her alanın hangi kaynaktan (ld / meta / heading / text / …) dolduğu yazılır."""
+    src: Sources = sources if sources is not None else {}
+    prod = new_product(url, page)
+    if page.json_ld:
+        apply_json_ld(prod, page.json_ld, url)
+    for f in ("title", "price", "currency", *TEXT_FIELDS):
+        src[f] = "ld" if getattr(prod, f) else "none"
+
+    if not prod.title:
+        prod.title = text_or_none(page.heading)
+        if prod.title:
+            src["title"] = "heading"
+        else:
+            prod.title = page.meta(["og:title", "twitter:title"]) or None
+            if prod.title:
+                src["title"] = "meta"
+
+    # metin yalnızca JSON-LD'nin boş bıraktığı alanlar için birleştirilir
+    if not (prod.colors and prod.sizes and prod.material):
+        text_blob = page.text_blob
+        if not prod.colors:
+            prod.colors = infer_colors(text_blob)
+        if not prod.sizes:
+            prod.sizes = infer_sizes(text_blob)
+        if not prod.material:
+            mat, ratio = infer_material(text_blob)
+            prod.material = mat
+            prod.material_ratio = ratio
+        for f in TEXT_FIELDS:
+            if src[f] == "none" and getattr(prod, f):
+                src[f] = "text"
+
+    apply_meta_price(prod, page)
+    for f in ("price", "currency"):
+        if src[f] == "none" and getattr(prod, f):
+            src[f] = "meta"
+
+    imgs, src["images"] = images_with_source(page, url)
+    if imgs:
+        prod.image_urls = "; ".join(imgs)
+
+    if not any([prod.title, prod.price, prod.material, prod.colors, prod.sizes]):
+        prod.raw_note = "Veri kısıtlı olabilir; site JS ile render ediyor olabilir."
+
+    return prod
@@ -0,0 +1,297 @@
+"""HTTP katmanı: paylaşılan oturum + host başına hız sınırı + sınıflandırılmış retry + isteğe bağlı kalıcı önbellek.
+
+Gövde parça parça okunur (`BodyReader`): boyut ya da süre sınırını aşan yanıt kesilir, böylece dev
+ya da hiç bitmeyen bir yanıt belleği ve worker'ı tutmaz. `stop` verilirse `</head>` geldiğinde
+head'le çağrılır; True dönerse bağlantı kapatılır ve gövdenin geri kalanı indirilmez. Kesik gövdeler
+önbelleğe yazılmaz. Her deneme (süre, durum, bayt) ve yeniden deneme `catcher.metrics`'e bildirilir.
+
+`url_deadline` içinde yapılan indirmelerin (yeniden denemeler ve beklemeler dahil) toplam süresi
+sınırlıdır: süre dolunca yeni deneme yapılmaz, uçuştaki istek kalan süreyle kesilir.
+"""
+
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from catcher.cache import HttpCache, RawPage
+from catcher.config import BODY_DEADLINE, DEFAULT_MAX_BODY_MB, DEFAULT_WORKERS, HEADERS, MAX_RETRIES, READ_CHUNK, REQ_TIMEOUT
+from catcher.metrics import count, record_response, record_retry, timer
+from catcher.parsing import decode_html
+from catcher.throttle import FATAL, OK, RateLimiter, backoff_delay, classify, response_retry_after, robots_delay, robots_url
+
+# requests ilk istekte yüklenir; motoru içe aktarmak ağ kütüphanesini yüklemez.
+_session: Any = None
+_session_lock = threading.Lock()
+_cache: Optional[HttpCache] = None
+_limiter: Optional[RateLimiter] = None
+_body_limit = DEFAULT_MAX_BODY_MB * 1024 * 1024
+_local = threading.local()  # thread başına URL süre sınırı (url_deadline)
+
+HeadCheck = Callable[[str], bool]  # head (çözülmüş) yeterliyse True: okumayı bırak
+
+
+def get_session() -> Any:
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                session = requests.Session()
+                # Varsayılan havuz (10) worker sayısının altında; her worker kendi keep-alive bağlantısını tutsun.
+                adapter = HTTPAdapter(pool_connections=DEFAULT_WORKERS, pool_maxsize=DEFAULT_WORKERS * 2)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+
+CHARSET_RE = re.compile(r"charset=[\"']?([^\s;\"']+)", re.I)
+
+
+def header_charset(content_type: Optional[str]) -> Optional[str]:
+    m = CHARSET_RE.search(content_type or "")
+    return m.group(1) if m else None
+
+
+def set_cache(cache: Optional[HttpCache]) -> None:
+    global _cache
+    _cache = cache
+
+
+def get_cache() -> Optional[HttpCache]:
+    return _cache
+
+
+def set_limiter(limiter: Optional[RateLimiter]) -> None:
+    global _limiter
+    _limiter = limiter
+
+
+def get_limiter() -> Optional[RateLimiter]:
+    return _limiter
+
+
+def set_body_limit(max_bytes: int) -> None:
+    global _body_limit
+    _body_limit = max_bytes
+
+
+def get_body_limit() -> int:
+    return _body_limit
+
+
+@contextmanager
+def url_deadline(seconds: float) -> Iterator[None]:
+    """Bu thread'deki `fetch_*` çağrıları `seconds` içinde biter ya da vazgeçer (None); 0 = sınırsız."""
+    prev = getattr(_local, "until", None)
+    _local.until = time.monotonic() + seconds if seconds > 0 else None
+    try:
+        yield
+    finally:
+        _local.until = prev
+
+
+def time_left() -> Optional[float]:
+    until = getattr(_local, "until", None)
+    return None if until is None else until - time.monotonic()
+
+
+def request_timeout(left: Optional[float]) -> Any:
+    if left is None:
+        return REQ_TIMEOUT
+    return tuple(min(t, left) for t in REQ_TIMEOUT)
+
+
+def body_deadline() -> float:
+    left = time_left()
+    return BODY_DEADLINE if left is None else min(BODY_DEADLINE, left)
+
+
+HEAD_END_BYTES_RE = re.compile(rb"</head\s*>", re.I)
+MORE, HEAD, LIMIT = None, "head", "limit"
+
+
+class BodyReader:
+    """Gövdeyi parçalar halinde biriktirir; sınırda durur, `</head>` gelişini bir kez bildirir."""
+
+    def __init__(self, limit: int, watch_head: bool = False, deadline: float = BODY_DEADLINE):
+        self.limit = limit  # <= 0: sınırsız
+        self.watch_head = watch_head
+        self.deadline = time.monotonic() + deadline
+        self.buf = bytearray()
+        self.complete = True  # False: gövdenin tamamı okunmadı
+
+    def feed(self, chunk: bytes) -> Optional[str]:
+        """MORE: okumaya devam; HEAD: head bu parçada bitti; LIMIT: boyut/süre sınırı, dur."""
+        start = len(self.buf)
+        if 0 < self.limit < start + len(chunk):
+            self.buf += chunk[:self.limit - start]
+            self.complete = False
+            return LIMIT
+        self.buf += chunk
+        if time.monotonic() > self.deadline:
+            self.complete = False
+            return LIMIT
+        # "</head>" iki parçaya bölünmüş olabilir; önceki parçanın sonundan ara
+        if self.watch_head and HEAD_END_BYTES_RE.search(self.buf, max(0, start - 8)):
+            self.watch_head = False
+            return HEAD
+        return MORE
+
+    def page(self, charset: Optional[str]) -> Optional[RawPage]:
+        return (bytes(self.buf), charset) if self.buf else None
+
+
+def read_body(resp: Any, charset: Optional[str], stop: Optional[HeadCheck],
+              deadline: float = BODY_DEADLINE) -> Tuple[Optional[RawPage], bool]:
+    """(sayfa, tamamı okundu mu)."""
+    reader = BodyReader(_body_limit, stop is not None, deadline)
+    for chunk in resp.iter_content(READ_CHUNK):
+        state = reader.feed(chunk)
+        if state == LIMIT:
+            break
+        if state == HEAD and stop(decode_html(bytes(reader.buf), charset)):
+            reader.complete = False
+            break
+    return reader.page(charset), reader.complete
+
+
+def _read_robots(limiter: RateLimiter, url: str) -> None:
+    # tek deneme, retry yok; robots.txt yoksa ya da okunamazsa varsayılan hız geçerli
+    try:
+        resp = get_session().get(robots_url(url), headers=HEADERS, timeout=REQ_TIMEOUT)
+        if resp.status_code == 200:
+            delay = robots_delay(resp.text)
+            if delay:
+                limiter.set_crawl_delay(url, delay)
+    except Exception:
+        pass
+    finally:
+        limiter.robots_done(url)
+
+
+def _begin(url: str) -> Optional[RateLimiter]:
+    limiter = _limiter
+    if limiter is not None and limiter.claim_robots(url):
+        _read_robots(limiter, url)
+    return limiter
+
+
+def _acquire(limiter: Optional[RateLimiter], url: str) -> None:
+    if limiter is not None:
+        with timer("wait"):
+            limiter.acquire(url)
+
+
+def _settle(limiter: Optional[RateLimiter], url: str, verdict: str, retry_after: Optional[float], attempt: int) -> bool:
+    """Denemenin sonucunu sınırlayıcıya bildirir; yeniden denenecekse bekler ve True döner."""
+    if limiter is not None:
+        # Retry-After sınırlayıcıda host'u bekletir; sonraki reserve bunu içerir
+        limiter.feedback(url, verdict, retry_after)
+        retry_after = None
+    # başarı, kalıcı hata ya da son deneme: beklemeden dön
+    if verdict in (OK, FATAL) or attempt == MAX_RETRIES:
+        return False
+    delay = max(backoff_delay(attempt), retry_after or 0.0)
+    left = time_left()
+    if left is not None and delay >= left:
+        count("url_timeouts")  # bekleme URL süresini aşar: vazgeç
+        return False
+    record_retry(url, verdict)
+    time.sleep(delay)
+    return True
+
+
+def _get(url: str, extra_headers: Optional[Dict[str, str]] = None,
+         stop: Optional[HeadCheck] = None) -> Tuple[int, Optional[RawPage], Any, bool]:
+    """(durum, sayfa, başlıklar, gövde tam mı); başarısızsa durum 0."""
+    session = get_session()
+    headers = {**HEADERS, **extra_headers} if extra_headers else HEADERS
+    limiter = _begin(url)
+    for attempt in range(MAX_RETRIES + 1):
+        _acquire(limiter, url)
+        left = time_left()
+        if left is not None and left <= 0:
+            count("url_timeouts")
+            break
+        status, page, resp_headers, complete, error = None, None, None, True, None
+        t0 = time.perf_counter()
+        try:
+            with session.get(url, headers=headers, timeout=request_timeout(left), stream=True) as resp:
+                status, resp_headers = resp.status_code, resp.headers
+                if status == 200:
+                    charset = header_charset(resp_headers.get("Content-Type"))
+                    page, complete = read_body(resp, charset, stop, body_deadline())
+        except Exception as e:
+            error = e
+        record_response(url, status, len(page[0]) if page else 0, time.perf_counter() - t0)
+        verdict = classify(status, page is not None, error, bool(extra_headers))
+        retry = _settle(limiter, url, verdict, response_retry_after(resp_headers), attempt)
+        if verdict == OK:
+            return status, page, resp_headers, complete
+        if not retry:
+            break
+    return 0, None, None, True
+
+
+def stream_raw(url: str, content_type: str = "") -> Iterator[bytes]:
+    """Gövdeyi önbelleğe ve boyut sınırına takılmadan parça parça verir (site haritası gibi büyük belgeler).
+
+    Yanıt başlıkları gelene kadar `_get` ile aynı hız/retry kuralları geçerlidir; akış başladıktan
+    sonraki hata çağırana yükselir. Yanıt 200 değilse, ya da `content_type` verilmişken (ör. "image/")
+    Content-Type başka bir türse (CDN hata sayfası, 200 dönen yumuşak 404) hiçbir şey vermez.
+    """
+    session = get_session()
+    limiter = _begin(url)
+    for attempt in range(MAX_RETRIES + 1):
+        _acquire(limiter, url)
+        resp, error = None, None
+        t0 = time.perf_counter()
+        try:
+            resp = session.get(url, headers=HEADERS, timeout=REQ_TIMEOUT, stream=True)
+        except Exception as e:
+            error = e
+        # süre başlıklara kadar; akan gövde çağıranın işidir
+        record_response(url, resp.status_code if resp is not None else None, 0, time.perf_counter() - t0)
+        verdict = classify(resp.status_code if resp is not None else None, True, error)
+        retry = _settle(limiter, url, verdict, response_retry_after(resp.headers if resp is not None else None), attempt)
+        if verdict == OK:
+            with resp:
+                ctype = (resp.headers.get("Content-Type") or "").split(";", 1)[0].strip().lower()
+                if content_type and not ctype.startswith(content_type):
+                    count("content_type_rejected", type=ctype or "none")
+                    return
+                yield from resp.iter_content(READ_CHUNK)
+            return
+        if resp is not None:
+            resp.close()
+        if not retry:
+            return
+
+
+def fetch_raw(url: str, stop: Optional[HeadCheck] = None) -> Optional[RawPage]:
+    """Çözülmemiş gövde + başlıktaki charset; önbellek açıksa önce oraya bakılır."""
+    cache = _cache
+    hit, extra = None, None
+    if cache is not None:
+        hit, page, extra = cache.before(url)
+        if page is not None or cache.offline:
+            count("cache_hits" if page is not None else "cache_misses")
+            return page
+    status, page, headers, complete = _get(url, extra, stop)
+    if not status:
+        return None
+    if cache is not None and complete:
+        page = cache.after(url, hit, status, page, headers)
+    return page
+
+
+def fetch_html(url: str, stop: Optional[HeadCheck] = None) -> Optional[str]:
+    raw = fetch_raw(url, stop)
+    if not raw:
+        return None
+    with timer("decode"):
+        return decode_html(*raw)
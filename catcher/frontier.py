@@ -0,0 +1,376 @@
+"""Paylaşılan iş sınırı (frontier): birden çok süreç / makine aynı URL kümesini tarar.
+
+Tohumlayan süreç bulunan ürün URL'lerini ekler (`add`) ve keşif bitince sınırı mühürler
+(`seal`). Worker'lar URL'leri süreli kiralar (`lease`); kira süresi içinde `complete` edilmeyen
+URL (worker çöktü, makine düştü) süre dolunca yeniden kiralanabilir hale gelir. Her kiralama yeni
+bir belirteç (token) üretir ve `complete` yalnızca belirteç hâlâ geçerliyse kabul edilir: kirası
+düşüp başkasına verilmiş URL'nin geç gelen sonucu yazılmaz, böylece her URL tam bir kez tamamlanır.
+Satırlar sınırın içinde saklanır (ortak sink); dosyalar `rows` üzerinden tek yerden yazılır.
+
+Arka uçlar:
+    sqlite:///yol/frontier.sqlite (ya da düz yol / isim)  — aynı makinedeki süreçler (WAL + kilit)
+    http://makine:8870                                    — `serve_frontier` ile paylaşılan SQLite
+
+SQLite dosyası ağ dosya sistemi üzerinden paylaşılmamalı (kilitler güvenilmez); makineler arası
+kullanımda sınırı bir makinede `serve_frontier` ile yayınlayın. HTTP ucu her istekte paylaşılan
+anahtarı (`FRONTIER_TOKEN_HEADER`) ister: anahtarsız biri URL ekleyip worker'lara istediği adresi
+indirtemez, sonuçların üzerine yazamaz. Trafik şifresizdir; güvenilmeyen ağda önüne TLS koyun.
+Başka bir depo (ör. Redis) `register_backend` ile eklenebilir.
+"""
+
+import hmac
+import json
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from catcher.config import (
+    FRONTIER_LEASE_SECS, FRONTIER_MAX_ATTEMPTS, FRONTIER_TOKEN_ENV, FRONTIER_TOKEN_HEADER, OUTPUT_DIR, ensure_dir,
+)
+from catcher.models import COLUMNS, ERROR_NOTE_PREFIX, Product, is_failed, row_values
+from catcher.store import Row
+from catcher.urls import url_key
+
+PENDING, LEASED, DONE, FAILED = "pending", "leased", "done", "failed"
+FRONTIER_STATES = (PENDING, LEASED, DONE, FAILED)
+ROWS_PAGE = 1000
+
+
+class FrontierError(RuntimeError):
+    pass
+
+
+class Lease(NamedTuple):
+    id: int
+    url: str
+    token: str
+    attempts: int  # bu kiralama dahil
+
+
+class Frontier:
+    """Arka uç sözleşmesi. Tüm yöntemler birden çok thread'den çağrılabilir."""
+
+    def add(self, urls: List[str]) -> int:
+        """URL'leri ekler (normalize anahtarla tekil); yeni eklenen sayısı."""
+        raise NotImplementedError
+
+    def lease(self, owner: str, n: int, ttl: float = FRONTIER_LEASE_SECS) -> List[Lease]:
+        raise NotImplementedError
+
+    def extend(self, leases: List[Lease], ttl: float = FRONTIER_LEASE_SECS) -> List[int]:
+        """Kiraları uzatır; hâlâ elde tutulanların id'leri."""
+        raise NotImplementedError
+
+    def complete(self, lease: Lease, prod: Product) -> bool:
+        """Sonucu yazar; kira başkasına geçtiyse False (sonuç atılmalı)."""
+        raise NotImplementedError
+
+    def release(self, lease: Lease) -> bool:
+        """URL'yi yeniden denenmek üzere kuyruğa geri bırakır."""
+        raise NotImplementedError
+
+    def seal(self, value: bool = True) -> None:
+        """Keşif bitti (True) / yeniden başladı (False); mühürsüz sınırda worker'lar boşta bekler."""
+        raise NotImplementedError
+
+    def sealed(self) -> bool:
+        raise NotImplementedError
+
+    def counts(self) -> Dict[str, int]:
+        raise NotImplementedError
+
+    def rows(self) -> Iterator[Row]:
+        """Tamamlanan satırlar, eklenme sırasıyla."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+    def finished(self) -> bool:
+        """Keşif bitti ve bekleyen / kirada URL kalmadı."""
+        if not self.sealed():
+            return False
+        counts = self.counts()
+        return not counts.get(PENDING) and not counts.get(LEASED)
+
+
+def row_dict(prod: Product) -> Dict[str, Optional[str]]:
+    return dict(zip(COLUMNS, row_values(prod)))
+
+
+def dict_row(d: Dict[str, Optional[str]]) -> Row:
+    return tuple(d.get(c) for c in COLUMNS)
+
+
+# ----------------------------- SQLite ----------------------------- #
+class SqliteFrontier(Frontier):
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        ensure_dir(os.path.dirname(os.path.abspath(path)))
+        # diğer süreçlerin yazma kilidini bekle (BEGIN IMMEDIATE sırası)
+        self._db = sqlite3.connect(path, timeout=60, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS frontier ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT, key TEXT UNIQUE, url TEXT, status TEXT,"
+            " owner TEXT, token TEXT, lease_until REAL, attempts INTEGER DEFAULT 0, row TEXT, updated_at REAL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS frontier_queue ON frontier(status, id)")
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def _tx(self, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                out = fn()
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+            return out
+
+    def add(self, urls: List[str]) -> int:
+        now = time.time()
+        rows = [(url_key(u), u, PENDING, now) for u in urls]
+
+        def insert() -> int:
+            before = self._db.total_changes
+            self._db.executemany("INSERT OR IGNORE INTO frontier (key, url, status, updated_at) VALUES (?, ?, ?, ?)", rows)
+            return self._db.total_changes - before
+        return self._tx(insert)
+
+    def lease(self, owner: str, n: int, ttl: float = FRONTIER_LEASE_SECS) -> List[Lease]:
+        def take() -> List[Lease]:
+            now = time.time()
+            # önce süresi dolmuş kiralar (az sayıda), sonra sıradaki bekleyenler
+            rows = self._db.execute(
+                "SELECT id, url, attempts FROM frontier WHERE status=? AND lease_until<? LIMIT ?", (LEASED, now, n)
+            ).fetchall()
+            if len(rows) < n:
+                rows += self._db.execute(
+                    "SELECT id, url, attempts FROM frontier WHERE status=? ORDER BY id LIMIT ?", (PENDING, n - len(rows))
+                ).fetchall()
+            leases = []
+            for id_, url, attempts in rows:
+                if attempts >= FRONTIER_MAX_ATTEMPTS:
+                    # her denemede worker'ı düşüren URL sonsuza dek dönmesin
+                    row = Product(url=url, raw_note=f"{ERROR_NOTE_PREFIX}{attempts} denemede kira süresi doldu")
+                    self._db.execute("UPDATE frontier SET status=?, row=?, owner=NULL, token=NULL, updated_at=? WHERE id=?",
+                                     (FAILED, json.dumps(row_dict(row), ensure_ascii=False), now, id_))
+                    continue
+                token = secrets.token_hex(8)
+                self._db.execute(
+                    "UPDATE frontier SET status=?, owner=?, token=?, lease_until=?, attempts=attempts + 1, updated_at=?"
+                    " WHERE id=?", (LEASED, owner, token, now + ttl, now, id_))
+                leases.append(Lease(id_, url, token, attempts + 1))
+            return leases
+        return self._tx(take)
+
+    def extend(self, leases: List[Lease], ttl: float = FRONTIER_LEASE_SECS) -> List[int]:
+        def renew() -> List[int]:
+            until = time.time() + ttl
+            held = []
+            for lease in leases:
+                cur = self._db.execute("UPDATE frontier SET lease_until=? WHERE id=? AND token=? AND status=?",
+                                       (until, lease.id, lease.token, LEASED))
+                if cur.rowcount:
+                    held.append(lease.id)
+            return held
+        return self._tx(renew) if leases else []
+
+    def complete(self, lease: Lease, prod: Product) -> bool:
+        status = FAILED if is_failed(prod) else DONE
+        row = json.dumps(row_dict(prod), ensure_ascii=False)
+        with self._lock:
+            cur = self._db.execute(
+                "UPDATE frontier SET status=?, row=?, owner=NULL, token=NULL, lease_until=NULL, updated_at=?"
+                " WHERE id=? AND token=? AND status=?", (status, row, time.time(), lease.id, lease.token, LEASED))
+        return cur.rowcount == 1
+
+    def release(self, lease: Lease) -> bool:
+        with self._lock:
+            cur = self._db.execute(
+                "UPDATE frontier SET status=?, owner=NULL, token=NULL, lease_until=NULL, updated_at=?"
+                " WHERE id=? AND token=? AND status=?", (PENDING, time.time(), lease.id, lease.token, LEASED))
+        return cur.rowcount == 1
+
+    def seal(self, value: bool = True) -> None:
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('sealed', ?)", ("1" if value else "0",))
+
+    def sealed(self) -> bool:
+        with self._lock:
+            row = self._db.execute("SELECT value FROM meta WHERE key='sealed'").fetchone()
+        return bool(row) and row[0] == "1"
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._db.execute("SELECT status, COUNT(*) FROM frontier GROUP BY status").fetchall())
+
+    def rows_after(self, after: int, limit: int = ROWS_PAGE) -> List[List[Any]]:
+        """[[id, satır sözlüğü]]: `after`'dan sonraki tamamlanmış satırlar (sayfalı okuma)."""
+        with self._lock:
+            rows = self._db.execute("SELECT id, row FROM frontier WHERE id>? AND row IS NOT NULL ORDER BY id LIMIT ?",
+                                    (after, limit)).fetchall()
+        return [[id_, json.loads(r)] for id_, r in rows]
+
+    def rows(self) -> Iterator[Row]:
+        after = 0
+        while page := self.rows_after(after):
+            for id_, d in page:
+                yield dict_row(d)
+            after = page[-1][0]
+
+
+# ----------------------------- HTTP ----------------------------- #
+class HttpFrontier(Frontier):
+    """`serve_frontier` ile yayınlanan sınırın istemcisi."""
+
+    def __init__(self, base_url: str, timeout: float = 60.0, token: Optional[str] = None):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.token = token or os.environ.get(FRONTIER_TOKEN_ENV, "")
+
+    def _call(self, method: str, **payload: Any) -> Any:
+        req = Request(f"{self.base_url}/{method}", data=json.dumps(payload).encode(),
+                      headers={"Content-Type": "application/json", FRONTIER_TOKEN_HEADER: self.token}, method="POST")
+        try:
+            with urlopen(req, timeout=self.timeout) as resp:
+                return json.loads(resp.read())["result"]
+        except HTTPError as e:
+            if e.code == 401:
+                raise FrontierError(f"frontier sunucusu anahtarı reddetti ({self.base_url}): --frontier-token "
+                                    f"ya da {FRONTIER_TOKEN_ENV} sunucudakiyle aynı olmalı")
+            raise FrontierError(f"frontier sunucusu hata döndü ({self.base_url}): {e}")
+        except OSError as e:
+            raise FrontierError(f"frontier sunucusu yanıt vermedi ({self.base_url}): {e}")
+
+    def add(self, urls: List[str]) -> int:
+        return self._call("add", urls=urls)
+
+    def lease(self, owner: str, n: int, ttl: float = FRONTIER_LEASE_SECS) -> List[Lease]:
+        return [Lease(*x) for x in self._call("lease", owner=owner, n=n, ttl=ttl)]
+
+    def extend(self, leases: List[Lease], ttl: float = FRONTIER_LEASE_SECS) -> List[int]:
+        return self._call("extend", leases=[list(x) for x in leases], ttl=ttl) if leases else []
+
+    def complete(self, lease: Lease, prod: Product) -> bool:
+        return self._call("complete", lease=list(lease), row=row_dict(prod))
+
+    def release(self, lease: Lease) -> bool:
+        return self._call("release", lease=list(lease))
+
+    def seal(self, value: bool = True) -> None:
+        self._call("seal", value=value)
+
+    def sealed(self) -> bool:
+        return self._call("sealed")
+
+    def counts(self) -> Dict[str, int]:
+        return self._call("counts")
+
+    def rows(self) -> Iterator[Row]:
+        after = 0
+        while page := self._call("rows_after", after=after):
+            for id_, d in page:
+                yield dict_row(d)
+            after = page[-1][0]
+
+
+def _routes(frontier: SqliteFrontier) -> Dict[str, Callable[..., Any]]:
+    return {
+        "add": lambda urls: frontier.add(urls),
+        "lease": lambda owner, n, ttl: frontier.lease(owner, n, ttl),
+        "extend": lambda leases, ttl: frontier.extend([Lease(*x) for x in leases], ttl),
+        "complete": lambda lease, row: frontier.complete(Lease(*lease), Product(**row)),
+        "release": lambda lease: frontier.release(Lease(*lease)),
+        "seal": lambda value=True: frontier.seal(value),
+        "sealed": frontier.sealed,
+        "counts": frontier.counts,
+        "rows_after": lambda after: frontier.rows_after(after),
+    }
+
+
+def make_server(frontier: SqliteFrontier, host: str, port: int, token: str) -> ThreadingHTTPServer:
+    if not token:
+        raise FrontierError("frontier sunucusu anahtarsız açılmaz")
+    routes = _routes(frontier)
+    expected = token.encode()
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args) -> None:
+            pass
+
+        def do_POST(self) -> None:
+            if not hmac.compare_digest((self.headers.get(FRONTIER_TOKEN_HEADER) or "").encode(), expected):
+                self.send_error(401)
+                return
+            fn = routes.get(self.path.strip("/"))
+            if fn is None:
+                self.send_error(404)
+                return
+            try:
+                payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+                body = json.dumps({"result": fn(**payload)}, ensure_ascii=False).encode()
+            except (TypeError, ValueError) as e:
+                self.send_error(400, str(e))
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    return server
+
+
+def serve_frontier(frontier: SqliteFrontier, host: str, port: int, token: str) -> None:
+    """Sınırı HTTP üzerinden yayınlar (Ctrl-C'ye kadar); istemciler `token`'ı göndermeli."""
+    with make_server(frontier, host, port, token) as server:
+        server.serve_forever()
+
+
+# ----------------------------- Arka uç seçimi ----------------------------- #
+def frontier_path(name: str) -> str:
+    # düz bir isim: OUTPUT_DIR/frontier/<isim>.sqlite; yol verilirse olduğu gibi
+    if os.sep in name or (os.altsep and os.altsep in name) or name.endswith((".sqlite", ".db")):
+        return name
+    return os.path.join(OUTPUT_DIR, "frontier", f"{name}.sqlite")
+
+
+BACKENDS: Dict[str, Callable[[str], Frontier]] = {
+    "sqlite": lambda spec: SqliteFrontier(frontier_path(spec.split("://", 1)[-1])),
+    "http": HttpFrontier,
+    "https": HttpFrontier,
+}
+
+
+def register_backend(scheme: str, factory: Callable[[str], Frontier]) -> None:
+    """`şema://…` biçimli adresler için arka uç ekler (fabrika tam adresi alır)."""
+    BACKENDS[scheme] = factory
+
+
+def open_frontier(spec: str, token: Optional[str] = None) -> Frontier:
+    """`token` HTTP sınırına gönderilir (verilmezse ortam değişkeni)."""
+    scheme = spec.split("://", 1)[0].lower() if "://" in spec else "sqlite"
+    factory = BACKENDS.get(scheme)
+    if factory is None:
+        raise FrontierError(f"Bilinmeyen frontier arka ucu: {scheme}")
+    frontier = factory(spec)
+    if token and isinstance(frontier, HttpFrontier):
+        frontier.token = token
+    return frontier
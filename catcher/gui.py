@@ -0,0 +1,267 @@
+"""Tkinter arayüzü. Tüm ağ/ayrıştırma işleri `catcher.engine` üzerinden arka planda yürür."""
+
+import threading
+import tkinter as tk
+from tkinter import filedialog, messagebox
+from typing import Dict, List, Optional
+
+from catcher.cancel import CancelToken
+from catcher.config import APP_NAME, DEFAULT_MAX_PAGES, DEFAULT_MAX_PRODUCTS, OUTPUT_DIR, ensure_dir
+from catcher.engine import JobResult, collect_links, run_job
+from catcher.options import JobOptions
+from catcher.scheduler import SiteJob, job_name, jobs_from_urls, run_jobs, unique_names
+from catcher.throttle import host_of
+
+CATEGORY_HINT = "Mod: Kategori URL — Her satıra bir kategori URL'si gir (birden çok site aynı anda taranır)."
+LIST_HINT = "Mod: Ürün URL listesi — Her satıra bir ürün URL'si yapıştır. Farklı siteler ayrı dosyalara yazılır."
+
+
+class App:
+    def __init__(self, root: tk.Tk):
+        self.root = root
+        root.title(f"{APP_NAME} — Çok Alanlı Toplayıcı")
+        root.geometry("980x760")
+
+        mode_frame = tk.Frame(root)
+        mode_frame.pack(fill=tk.X, padx=10, pady=6)
+        self.mode = tk.StringVar(value="category")
+        tk.Radiobutton(mode_frame, text="Ürün URL listesi", variable=self.mode, value="list").pack(side=tk.LEFT)
+        tk.Radiobutton(mode_frame, text="Kategori URL", variable=self.mode, value="category").pack(side=tk.LEFT, padx=12)
+
+        self.lbl = tk.Label(root, text=CATEGORY_HINT)
+        self.lbl.pack(pady=4)
+
+        self.txt = tk.Text(root, height=14)
+        self.txt.pack(fill=tk.BOTH, expand=True, padx=10)
+
+        cat_frame = tk.Frame(root)
+        cat_frame.pack(fill=tk.X, padx=10, pady=6)
+
+        tk.Label(cat_frame, text="Max Sayfa:").grid(row=0, column=0, sticky="w")
+        self.ent_pages = tk.Entry(cat_frame, width=6)
+        self.ent_pages.insert(0, str(DEFAULT_MAX_PAGES))
+        self.ent_pages.grid(row=0, column=1, padx=6)
+
+        tk.Label(cat_frame, text="Max Ürün:").grid(row=0, column=2, sticky="w")
+        self.ent_products = tk.Entry(cat_frame, width=8)
+        self.ent_products.insert(0, str(DEFAULT_MAX_PRODUCTS))
+        self.ent_products.grid(row=0, column=3, padx=6)
+
+        tk.Label(cat_frame, text="Dahil Et (substring; ; ile ayır):").grid(row=1, column=0, sticky="w", pady=4)
+        self.ent_include = tk.Entry(cat_frame, width=46)
+        self.ent_include.insert(0, "")
+        self.ent_include.grid(row=1, column=1, columnspan=3, sticky="we")
+
+        tk.Label(cat_frame, text="Hariç Tut (substring; ; ile ayır):").grid(row=2, column=0, sticky="w")
+        self.ent_exclude = tk.Entry(cat_frame, width=46)
+        self.ent_exclude.insert(0, "")
+        self.ent_exclude.grid(row=2, column=1, columnspan=3, sticky="we")
+
+        btn_frame = tk.Frame(root)
+        btn_frame.pack(fill=tk.X, pady=8)
+        self.btn_preview = tk.Button(btn_frame, text="Linkleri Önizle", command=self.on_preview)
+        self.btn_preview.pack(side=tk.LEFT, padx=10)
+        self.btn_run = tk.Button(btn_frame, text="Çalıştır ve Excel'e Yaz", command=self.on_run)
+        self.btn_run.pack(side=tk.LEFT, padx=10)
+        self.btn_stop = tk.Button(btn_frame, text="Durdur", command=self.on_stop, state=tk.DISABLED)
+        self.btn_stop.pack(side=tk.LEFT)
+        self.btn_save_as = tk.Button(btn_frame, text="Çıktı Klasörü Seç", command=self.choose_dir)
+        self.btn_save_as.pack(side=tk.LEFT)
+
+        self.status = tk.Label(root, text="Hazır.")
+        self.status.pack(anchor="w", padx=10, pady=4)
+
+        self.output_dir = ensure_dir(OUTPUT_DIR)
+        self.cancel: Optional[CancelToken] = None  # iş sürerken dolu
+        self.close_after = False  # pencere kapatıldı: iş durunca çık
+
+        self.mode.trace_add('write', self.on_mode_change)
+        root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+    # ---- UI yardımcıları ---- #
+    def set_status(self, text: str):
+        self.status.config(text=text)
+        self.root.update_idletasks()
+
+    def on_mode_change(self, *args):
+        if self.mode.get() == "list":
+            self.lbl.config(text=LIST_HINT)
+        else:
+            self.lbl.config(text=CATEGORY_HINT)
+
+    def choose_dir(self):
+        d = filedialog.askdirectory(initialdir=self.output_dir or OUTPUT_DIR)
+        if d:
+            self.output_dir = d
+            self.set_status(f"Çıktı: {self.output_dir}")
+
+    # ---- Önizleme (arka plan) ---- #
+    def on_preview(self):
+        if self.mode.get() != "category":
+            messagebox.showinfo("Bilgi", "Önizleme yalnızca Kategori URL modunda çalışır.")
+            return
+        raw = self.txt.get("1.0", tk.END).strip()
+        lines = [u.strip() for u in raw.splitlines() if u.strip()]
+        if not lines:
+            messagebox.showerror("Hata", "İlk satıra kategori URL'si gir.")
+            return
+        cat_url = lines[0]
+        self.btn_preview.config(state=tk.DISABLED)
+        self.set_status("Kategori linkleri toplanıyor (önizleme)…")
+
+        def worker():
+            try:
+                links = self.collect_category_links(cat_url)
+            except Exception:
+                links = []
+            def show():
+                self.btn_preview.config(state=tk.NORMAL)
+                if not links:
+                    messagebox.showerror("Önizleme", "Hiç ürün linki bulunamadı. Filtreleri gevşetmeyi deneyin.")
+                    self.set_status("Hazır.")
+                    return
+                top = tk.Toplevel(self.root)
+                top.title("Bulunan Ürün Linkleri")
+                text = tk.Text(top, height=24, width=110)
+                text.pack(fill=tk.BOTH, expand=True)
+                text.insert("1.0", "\n".join(links))
+                self.set_status(f"Önizleme: {len(links)} link bulundu")
+            self.root.after(0, show)
+        threading.Thread(target=worker, daemon=True).start()
+
+    # ---- Durdur / kapat ---- #
+    def on_stop(self):
+        if self.cancel is None:
+            return
+        self.cancel.cancel()
+        self.btn_stop.config(state=tk.DISABLED)
+        self.set_status("Durduruluyor: uçuştaki istekler bitiyor, kısmi sonuçlar yazılıyor…")
+
+    def on_close(self):
+        # iş sürerken pencere hemen yok edilmez: dosyalar kapanmadan çıkılırsa xlsx/parquet yarım kalır
+        if self.cancel is None:
+            self.root.destroy()
+            return
+        self.close_after = True
+        self.on_stop()
+
+    def _job_finished(self) -> bool:
+        """Butonları geri açar; pencere kapatılmak isteniyorsa kapatır (True)."""
+        self.cancel = None
+        if self.close_after:
+            self.root.destroy()
+            return True
+        self.btn_run.config(state=tk.NORMAL)
+        self.btn_stop.config(state=tk.DISABLED)
+        return False
+
+    # ---- Çalıştır (arka plan) ---- #
+    def on_run(self):
+        raw = self.txt.get("1.0", tk.END).strip()
+        lines = [u.strip() for u in raw.splitlines() if u.strip()]
+        if not lines:
+            messagebox.showerror("Hata", "En az 1 satır girmelisin.")
+            return
+
+        mode = self.mode.get()
+        if mode == "list":
+            if len({host_of(u) for u in lines}) > 1:
+                # farklı siteler: site başına bir iş, ortak worker havuzunda adil sırayla
+                jobs = jobs_from_urls(lines)
+                self._start_job(self.job_options(), f"{len(lines)} URL, {len(jobs)} site işleniyor…", jobs)
+            else:
+                self._start_job(self.job_options(urls=lines), f"Toplam {len(lines)} URL işleniyor…")
+        elif len(lines) > 1:
+            jobs = unique_names([SiteJob(name=job_name(u), category_url=u) for u in lines])
+            self._start_job(self.job_options(), f"{len(jobs)} kategori aynı anda taranıyor…", jobs)
+        else:
+            # Link toplama ve ürün tarama aynı anda (boru hattı) arka planda yürür
+            self._start_job(self.job_options(category_url=lines[0]),
+                            "Kategori taranıyor; bulunan ürünler eşzamanlı işleniyor…")
+
+    def _start_job(self, opts: JobOptions, status_text: str, jobs: Optional[List[SiteJob]] = None):
+        self.btn_run.config(state=tk.DISABLED)
+        self.btn_stop.config(state=tk.NORMAL)
+        self.cancel = cancel = CancelToken()
+        self.set_status(status_text)
+
+        def background():
+            status = lambda msg: self.root.after(0, self.set_status, msg)
+            progress = lambda p: self.root.after(0, self.set_status, p.describe())
+            try:
+                if jobs:
+                    result = merge_results(run_jobs(jobs, opts, status, progress, cancel))
+                else:
+                    result = run_job(opts, status, progress, cancel)
+            except Exception:
+                result = JobResult(urls=[], products=[])
+            if not result.urls and not result.rows:  # günlükten devamda URL kalmamış olabilir
+                def fail():
+                    if self._job_finished():
+                        return
+                    if cancel.stopped:
+                        self.set_status("Durduruldu; satır yazılmadı.")
+                        return
+                    messagebox.showerror("Hata", "Kategori altında uygun ürün linki bulunamadı.")
+                    self.set_status("Hazır.")
+                self.root.after(0, fail)
+                return
+            paths, errors = result.paths, result.errors
+            xlsx_path, csv_path = paths.get("xlsx"), paths.get("csv")
+            if jobs:
+                xlsx_path = csv_path = f"{len(jobs)} dosya, {opts.output_dir}"
+
+            def finalize():
+                if self._job_finished():
+                    return
+                if errors.get("xlsx"):
+                    messagebox.showerror("Excel hatası", f"Excel yazılamadı: {errors['xlsx']}")
+                if errors.get("csv"):
+                    messagebox.showerror("CSV hatası", f"CSV yazılamadı: {errors['csv']}")
+                stopped = cancel.stopped
+                self.set_status(f"{'Durduruldu (kısmi sonuç)' if stopped else 'Bitti'}. Kayıt: {xlsx_path}")
+                done = "İşlem durduruldu; o ana kadarki sonuçlar yazıldı." if stopped else "İşlem tamamlandı."
+                messagebox.showinfo("Tamam", f"{done}\nExcel: {xlsx_path}\nCSV: {csv_path}")
+            self.root.after(0, finalize)
+
+        threading.Thread(target=background, daemon=True).start()
+
+    # Ortak yardımcılar
+    def job_options(self, **kw) -> JobOptions:
+        try:
+            max_pages = max(1, int(self.ent_pages.get()))
+        except Exception:
+            max_pages = DEFAULT_MAX_PAGES
+        try:
+            max_products = max(1, int(self.ent_products.get()))
+        except Exception:
+            max_products = DEFAULT_MAX_PRODUCTS
+        return JobOptions(
+            max_pages=max_pages,
+            max_products=max_products,
+            include_filter=self.ent_include.get().strip(),
+            exclude_filter=self.ent_exclude.get().strip(),
+            output_dir=self.output_dir,
+            **kw,
+        )
+
+    def collect_category_links(self, cat_url: str) -> List[str]:
+        return collect_links(self.job_options(category_url=cat_url))
+
+def merge_results(results: Dict[str, JobResult]) -> JobResult:
+    """Çoklu iş sonuçlarını pencerenin beklediği tek sonuca indirger (dosya yolları iş adıyla)."""
+    merged = JobResult(urls=[], products=[])
+    for name, r in results.items():
+        merged.urls.extend(r.urls)
+        merged.rows += r.rows
+        merged.paths.update({f"{name}.{fmt}": p for fmt, p in r.paths.items()})
+        merged.errors.update({fmt: f"{name}: {e}" for fmt, e in r.errors.items()})
+    return merged
+
+
+# ----------------------------- Giriş Noktası ----------------------------- #
+
+def main():
+    root = tk.Tk()
+    App(root)
+    root.mainloop()
@@ -0,0 +1,77 @@
+"""Görsel çıkarımı."""
+
+from typing import TYPE_CHECKING, Any, List, Tuple
+from urllib.parse import urljoin
+
+from catcher.analysis import PageAnalysis, analyze, is_excluded_by_class, is_gallery_container
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+__all__ = ["extract_product_images", "find_gallery_containers", "images_from_analysis", "images_with_source",
+           "is_excluded_by_class"]
+
+ALT_EXCLUDE = ["swatch", "variant", "renk", "color", "logo", "icon"]
+
+
+def find_gallery_containers(soup: "BeautifulSoup") -> List[Any]:
+    return [tag for tag in soup.find_all(["div", "section", "ul", "ol"]) if is_gallery_container(tag)]
+
+
+def image_src(img) -> Any:
+    return img.get("data-src") or img.get("data-large_image") or img.get("src")
+
+
+def images_from_analysis(page: PageAnalysis, base_url: str) -> List[str]:
+    return images_with_source(page, base_url)[0]
+
+
+def images_with_source(page: PageAnalysis, base_url: str) -> Tuple[List[str], str]:
+    """(görseller, kaynak): "ld" yalnızca JSON-LD, "gallery" galeri eklediyse, "page" sayfanın tüm görselleri."""
+    urls: List[str] = []
+
+    ld = page.json_ld
+    if ld.get("image"):
+        imgs = ld["image"] if isinstance(ld["image"], list) else [ld["image"]]
+        for u in imgs:
+            if isinstance(u, dict) and u.get("url"):
+                urls.append(urljoin(base_url, u["url"]))
+            elif isinstance(u, str):
+                urls.append(urljoin(base_url, u))
+    n_ld = len(urls)
+
+    for img in page.gallery_images:
+        src = image_src(img)
+        if not src:
+            continue
+        full = urljoin(base_url, src)
+        if is_excluded_by_class(img):
+            continue
+        alt = (img.get("alt") or "").lower()
+        if any(k in alt for k in ALT_EXCLUDE):
+            continue
+        if len(full) < 6:
+            continue
+        urls.append(full)
+
+    ld_urls = set(urls[:n_ld])
+    source = "gallery" if any(u not in ld_urls for u in urls[n_ld:]) else "ld" if urls else "none"
+    if not urls:
+        for img in page.images:
+            if is_excluded_by_class(img):
+                continue
+            src = image_src(img)
+            if not src:
+                continue
+            full = urljoin(base_url, src)
+            alt = (img.get("alt") or "").lower()
+            if any(k in alt for k in ALT_EXCLUDE):
+                continue
+            urls.append(full)
+            source = "page"
+
+    return list(dict.fromkeys(u for u in urls if u))[:30], source
+
+
+def extract_product_images(soup: "BeautifulSoup", base_url: str) -> List[str]:
+    return images_from_analysis(analyze(soup), base_url)
@@ -0,0 +1,136 @@
+"""Kalıcı iş günlüğü (SQLite): uzun taramalar kaldığı yerden devam eder.
+
+Bulunan her ürün URL'si `pending` olarak, tamamlanan her satır da `done` ya da `failed`
+olarak hemen yazılır. Günlük WAL modunda çalışır ve her yazım ayrı bir commit'tir; süreç
+çökerse en fazla uçuştaki sayfalar kaybolur. Aynı günlükle `resume` edilen bir iş `done`
+URL'leri atlar, `failed` ve `pending` olanları yeniden dener. Dışa aktarma günlükteki tüm
+satırlardan yapılır. Kategori gezintisi önceki çalışmada bittiyse liste sayfaları yeniden
+gezilmez; kalan URL'ler doğrudan günlükten okunur.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterator, List, Optional
+
+from catcher.config import OUTPUT_DIR, ensure_dir
+from catcher.models import COLUMNS, Product, is_failed, row_values
+
+PENDING, DONE, FAILED = "pending", "done", "failed"
+
+
+class JournalError(ValueError):
+    pass
+
+
+def journal_path(name: str) -> str:
+    # düz bir isim verilirse OUTPUT_DIR/jobs/<isim>.sqlite; yol verilirse olduğu gibi
+    if os.sep in name or (os.altsep and os.altsep in name) or name.endswith((".sqlite", ".db")):
+        return name
+    return os.path.join(OUTPUT_DIR, "jobs", f"{name}.sqlite")
+
+
+class Journal:
+    def __init__(self, path: str, source: str, resume: bool = False, fresh: bool = False):
+        """`resume` yoksa dolu günlük yalnızca `fresh` ile silinir; yanlışlıkla yeniden çalıştırılan komut
+        çökme sonrası durumu (ya da günlük olmayan başka bir sqlite dosyasını) silmesin."""
+        self.path = path
+        self._lock = threading.Lock()
+        ensure_dir(os.path.dirname(os.path.abspath(path)))
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        tables = {name for (name,) in self._db.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+        if tables and "urls" not in tables:
+            self._db.close()
+            raise JournalError(f"{path} bir iş günlüğü değil (başka bir sqlite dosyası)")
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS urls ("
+            " seq INTEGER PRIMARY KEY AUTOINCREMENT, url TEXT UNIQUE, status TEXT,"
+            " attempts INTEGER DEFAULT 0, row TEXT, updated_at REAL)"
+        )
+        previous = self._meta("source")
+        if resume and previous is not None and previous != source:
+            self._db.close()
+            raise JournalError(f"Günlük başka bir işe ait: {previous}")
+        if not resume:
+            (rows,) = self._db.execute("SELECT COUNT(*) FROM urls").fetchone()
+            if rows and not fresh:
+                self._db.close()
+                raise JournalError(f"Günlükte önceki çalışmanın {rows} kaydı var: kaldığı yerden devam için "
+                                   f"--resume, silip baştan başlamak için --fresh")
+            self._db.execute("DELETE FROM urls")
+            self._db.execute("DELETE FROM meta")
+        self._set_meta("source", source)
+        self._done = {u for (u,) in self._db.execute("SELECT url FROM urls WHERE status=?", (DONE,))}
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def _meta(self, key: str) -> Optional[str]:
+        row = self._db.execute("SELECT value FROM meta WHERE key=?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    # ---- gezinti durumu ---- #
+    @property
+    def crawl_done(self) -> bool:
+        return self._meta("crawl_done") == "1"
+
+    def mark_crawl_done(self) -> None:
+        with self._lock:
+            self._set_meta("crawl_done", "1")
+
+    # ---- URL / satır kayıtları ---- #
+    def admit(self, url: str) -> bool:
+        """URL'yi günlüğe ekler; zaten tamamlanmışsa False (taranmasın)."""
+        if url in self._done:
+            return False
+        with self._lock:
+            self._db.execute(
+                "INSERT OR IGNORE INTO urls (url, status, updated_at) VALUES (?, ?, ?)", (url, PENDING, time.time())
+            )
+        return True
+
+    def record(self, prod: Product) -> None:
+        status = FAILED if is_failed(prod) else DONE
+        row = json.dumps(dict(zip(COLUMNS, row_values(prod))), ensure_ascii=False)
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO urls (url, status, attempts, row, updated_at) VALUES (?, ?, 1, ?, ?)"
+                " ON CONFLICT(url) DO UPDATE SET status=excluded.status, attempts=attempts + 1,"
+                " row=excluded.row, updated_at=excluded.updated_at",
+                (prod.url, status, row, time.time()),
+            )
+            if status == DONE:
+                self._done.add(prod.url)
+
+    def skip(self, url: str) -> None:
+        """Tamamlandı say ama satır yazma (ör. canonical adresi başka bir satırda)."""
+        with self._lock:
+            self._db.execute("UPDATE urls SET status=?, row=NULL, updated_at=? WHERE url=?", (DONE, time.time(), url))
+            self._done.add(url)
+
+    def remaining(self) -> List[str]:
+        with self._lock:
+            rows = self._db.execute("SELECT url FROM urls WHERE status!=? ORDER BY seq", (DONE,)).fetchall()
+        return [u for (u,) in rows]
+
+    def products(self, status: Optional[str] = None) -> Iterator[Product]:
+        """Günlükteki satırlar, URL'lerin bulunma sırasıyla (imleçten akar, bellekte birikmez)."""
+        sql, args = "SELECT row FROM urls WHERE row IS NOT NULL", ()
+        if status is not None:
+            sql, args = sql + " AND status=?", (status,)
+        for (r,) in self._db.execute(sql + " ORDER BY seq", args):
+            yield Product(**json.loads(r))
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._db.execute("SELECT status, COUNT(*) FROM urls GROUP BY status").fetchall()
+        return dict(rows)
@@ -0,0 +1,197 @@
+"""selectolax (lexbor) arka ucu.
+
+BeautifulSoup ağacı kurulmadan çalışır. Ürün sayfaları `PageCollector`'ı bs4 yürüyücüsüyle aynı
+sırada besler; liste sayfalarında yalnızca kapsam içi linkler ve sayfalama adayları çıkarılır.
+Kurallar `catcher.links` içindeki bs4 sürümleriyle birebir aynıdır.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urljoin
+
+from catcher.analysis import PageAnalysis, PageCollector
+from catcher.config import CONTENT_SCOPES, EXCLUDE_REGION_SELECTORS
+from catcher.links import (
+    EXCLUDED_TAGS, NEXT_CLASS_RE, NEXT_STRATEGIES, NEXT_TEXTS, PAGER_STRATEGIES, first_scope, match_region, order_scoped,
+    region_rules, scope_indices,
+)
+
+MULTI_VALUED = ("class", "rel")
+
+
+def parse(html: str) -> Any:
+    from selectolax.lexbor import LexborHTMLParser
+    return LexborHTMLParser(html)
+
+
+def attrs_of(node) -> Dict[str, Any]:
+    # bs4 ile aynı biçim: class/rel liste, değersiz öznitelik ""
+    attrs: Dict[str, Any] = {}
+    for k, v in node.attributes.items():
+        if v is None:
+            v = ""
+        if k in MULTI_VALUED:
+            v = v.split()
+        attrs[k] = v
+    return attrs
+
+
+def analyze_lexbor(html: str, text: bool = True, galleries: bool = True) -> PageAnalysis:
+    tree = parse(html)
+    col = PageCollector(text, galleries)
+    blocks = col.blocks
+
+    stack: List[Tuple[Any, int, bool]] = [(tree.root, -1, False)]
+    while stack:
+        node, block, in_gallery = stack.pop()
+        while node is not None:
+            tag = node.tag
+            if tag == "-text":
+                if block >= 0:
+                    s = node.text_content.strip()
+                    if s:
+                        blocks[block].append(s)
+            elif tag[0] != "-" and tag[0] != "_":
+                flags = col.element(tag, attrs_of(node), in_gallery, lambda n=node: n.text(deep=True))
+                if flags is not None:
+                    opens_block, child_gallery = flags
+                    child_block = col.new_block() if opens_block else block
+                    # kardeşe dönmek için kalan zinciri yığına koy, önce çocuklara in
+                    stack.append((node.next, block, in_gallery))
+                    node, block, in_gallery = node.child, child_block, child_gallery
+                    continue
+            node = node.next
+
+    return col.finish()
+
+
+def single_string(node) -> Optional[str]:
+    # bs4 `.string`: tek çocuk varsa onun metni (özyinelemeli), yoksa None
+    child = node.child
+    if child is None or child.next is not None:
+        return None
+    if child.tag == "-text":
+        return child.text_content
+    if child.tag[0] in "-_":
+        return None
+    return single_string(child)
+
+
+def scoped_links_lexbor(tree, page_url: str) -> List[List[str]]:
+    rules = region_rules()
+    if rules is None:
+        return scoped_links_by_css(tree, page_url)
+
+    hits: List[List[str]] = [[] for _ in CONTENT_SCOPES]
+    stack: List[Tuple[Any, int, bool]] = [(tree.root, 0, False)]
+    while stack:
+        node, mask, excluded = stack.pop()
+        while node is not None:
+            tag = node.tag
+            if tag[0] != "-" and tag[0] != "_":
+                if tag == "a" and mask and not excluded:
+                    href = node.attributes.get("href")
+                    if href:
+                        hits[first_scope(mask)].append(urljoin(page_url, href))
+                if node.child is not None:
+                    child_mask, child_excluded = mask, excluded
+                    if tag in rules:
+                        m, ex = match_region(rules, tag, node.attributes)
+                        child_mask, child_excluded = mask | m, excluded or ex
+                    stack.append((node.next, mask, excluded))
+                    node, mask, excluded = node.child, child_mask, child_excluded
+                    continue
+            node = node.next
+    return hits
+
+
+def extract_links_in_scopes_lexbor(tree, page_url: str) -> List[str]:
+    return order_scoped(scoped_links_lexbor(tree, page_url))
+
+
+def scoped_links_by_css(tree, page_url: str) -> List[List[str]]:
+    excluded = set()
+    for sel in EXCLUDE_REGION_SELECTORS:
+        for node in tree.css(sel):
+            excluded.add(node.mem_id)
+
+    def is_inside_excluded(a) -> bool:
+        parent = a.parent
+        while parent is not None:
+            if parent.mem_id in excluded or parent.tag in EXCLUDED_TAGS:
+                return True
+            parent = parent.parent
+        return False
+
+    hits: List[List[str]] = []
+    for scope in CONTENT_SCOPES:
+        links: List[str] = []
+        for a in tree.css(scope):
+            href = a.attributes.get("href")
+            if not href:
+                continue
+            if is_inside_excluded(a):
+                continue
+            links.append(urljoin(page_url, href))
+        hits.append(links)
+    return hits
+
+
+def next_tag_lexbor(tree, anchors: List[Any], strategy: str) -> Any:
+    # bs4 `find` gibi stratejinin ilk eşleşen etiketi (href'i olmasa da)
+    if strategy == "link_rel":
+        for link in tree.css("link[rel]"):
+            if "next" in (link.attributes.get("rel") or ""):
+                return link
+        return None
+    for a in anchors:
+        if strategy == "a_rel":
+            rel = a.attributes.get("rel") or ""
+            if rel == "next" or "next" in rel.split():
+                return a
+        elif strategy == "a_text":
+            s = single_string(a)
+            if s and s.strip().lower() in NEXT_TEXTS:
+                return a
+        else:
+            cls = a.attributes.get("class")
+            if cls and any(NEXT_CLASS_RE.search(c.lower()) for c in cls.split()):
+                return a
+    return None
+
+
+def find_next_lexbor(tree, page_url: str,
+                     strategies: Sequence[str] = NEXT_STRATEGIES) -> Tuple[Optional[str], Optional[str]]:
+    # ilk eşleşen etiketin href'i yoksa sonraki stratejiye geçilir
+    anchors = tree.css("a") if any(s != "link_rel" for s in strategies) else []
+    for strategy in strategies:
+        tag = next_tag_lexbor(tree, anchors, strategy)
+        if tag is not None and tag.attributes.get("href"):
+            return urljoin(page_url, tag.attributes["href"]), strategy
+    return None, None
+
+
+def next_by_rel_or_class_lexbor(tree, page_url: str) -> Optional[str]:
+    return find_next_lexbor(tree, page_url)[0]
+
+
+def all_numbered_pages_lexbor(tree, page_url: str) -> List[str]:
+    pages: List[str] = []
+    for a in tree.css("a[href]"):
+        txt = (a.text(deep=True, strip=True) or "").lower()
+        if txt.isdigit():
+            pages.append(urljoin(page_url, a.attributes["href"]))
+    return list(dict.fromkeys(pages))
+
+
+def parse_listing_lexbor(html: str, page_url: str, pager: Sequence[str] = PAGER_STRATEGIES
+                         ) -> Tuple[List[str], Optional[str], List[str], List[int], Optional[str]]:
+    tree = parse(html)
+    hits = scoped_links_lexbor(tree, page_url)
+    next_url, next_via = find_next_lexbor(tree, page_url, [s for s in NEXT_STRATEGIES if s in pager])
+    return (
+        order_scoped(hits),
+        next_url,
+        all_numbered_pages_lexbor(tree, page_url) if "numbered" in pager else [],
+        scope_indices(hits),
+        next_via,
+    )
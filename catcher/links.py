@@ -0,0 +1,270 @@
+"""Link sezgisi + sayfalama."""
+
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urlencode, urljoin, urlparse, urlunparse
+
+from catcher.config import CONTENT_SCOPES, DEFAULT_PARSER, EXCLUDE_REGION_SELECTORS, PRODUCT_PATH_HINTS
+from catcher.parsing import make_soup, resolve_parser
+from catcher.urls import clean_url, url_key
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+
+def domain_from(url: str) -> str:
+    try:
+        return urlparse(url).netloc.lower()
+    except Exception:
+        return ""
+
+
+# ---- Kapsam içi linkler ---- #
+# CONTENT_SCOPES ("kapsayıcı a") ve EXCLUDE_REGION_SELECTORS basit seçicilerdir: etiket, isteğe
+# bağlı tek bir [öznitelik*='değer']. Bunlar tek ağaç yürüyüşünde elle eşlenir: her düğüm
+# atalarından kapsam maskesini ve "hariç bölgede mi" bayrağını devralır. Her <a> bir kez görülür;
+# çıktı sırası (ilk eşleşen kapsam, belge sırası), yani eski seçici-seçici toplamanın tekrarları
+# atılmış haliyle aynıdır. Config bu biçime uymayan bir seçici içerirse seçici yoluna dönülür.
+SIMPLE_SELECTOR_RE = re.compile(r"""^([a-z][a-z0-9]*)(?:\[([a-z_-]+)\*=['"]([^'"]+)['"]\])?$""")
+EXCLUDED_TAGS = ("header", "footer", "nav")
+
+# etiket -> [(kapsam biti, öznitelik, aranan)]; bit 0 ise hariç bölge kuralı
+RegionRules = Dict[str, List[Tuple[int, Optional[str], Optional[str]]]]
+
+
+@lru_cache(maxsize=1)
+def region_rules() -> Optional[RegionRules]:
+    rules: RegionRules = {}
+    specs = [(sel[:-2], 1 << i) for i, sel in enumerate(CONTENT_SCOPES) if sel.endswith(" a")]
+    if len(specs) != len(CONTENT_SCOPES):
+        return None
+    specs += [(sel, 0) for sel in list(EXCLUDE_REGION_SELECTORS) + list(EXCLUDED_TAGS)]
+    for sel, bit in specs:
+        m = SIMPLE_SELECTOR_RE.match(sel.strip())
+        if not m:
+            return None
+        tag, attr, needle = m.groups()
+        rules.setdefault(tag, []).append((bit, attr, needle))
+    return rules
+
+
+def attr_text(v: Any) -> str:
+    # bs4 class/rel listesini seçici motoru gibi boşlukla birleştir
+    return " ".join(v) if isinstance(v, list) else (v or "")
+
+
+def match_region(rules: RegionRules, name: str, attrs: Dict[str, Any]) -> Tuple[int, bool]:
+    mask, excluded = 0, False
+    for bit, attr, needle in rules.get(name, ()):
+        if attr is not None and needle not in attr_text(attrs.get(attr)):
+            continue
+        if bit:
+            mask |= bit
+        else:
+            excluded = True
+    return mask, excluded
+
+
+def first_scope(mask: int) -> int:
+    return (mask & -mask).bit_length() - 1
+
+
+def order_scoped(hits: List[List[str]]) -> List[str]:
+    return [u for bucket in hits for u in bucket]
+
+
+def scope_indices(hits: List[List[str]]) -> List[int]:
+    """`order_scoped` çıktısıyla paralel: her linkin kapsam sırası."""
+    return [i for i, bucket in enumerate(hits) for _ in bucket]
+
+
+def scoped_links(soup: "BeautifulSoup", page_url: str) -> List[List[str]]:
+    """Kapsam içi ham linkler, kapsam başına (CONTENT_SCOPES sırası) ayrı listede."""
+    rules = region_rules()
+    if rules is None:
+        return scoped_links_by_select(soup, page_url)
+    from bs4 import Tag
+
+    hits: List[List[str]] = [[] for _ in CONTENT_SCOPES]
+    # (düğüm, atalardan gelen kapsam maskesi, hariç bölge içinde mi)
+    stack: List[Tuple[Any, int, bool]] = [(soup, 0, False)]
+    while stack:
+        node, mask, excluded = stack.pop()
+        if node is not soup:
+            if node.name == "a" and mask and not excluded:
+                href = node.get("href")
+                if href:
+                    hits[first_scope(mask)].append(urljoin(page_url, href))
+            if node.name in rules:
+                m, ex = match_region(rules, node.name, node.attrs)
+                mask, excluded = mask | m, excluded or ex
+        contents = node.contents
+        for i in range(len(contents) - 1, -1, -1):
+            child = contents[i]
+            if isinstance(child, Tag):
+                stack.append((child, mask, excluded))
+    return hits
+
+
+def extract_links_in_scopes(soup: "BeautifulSoup", page_url: str) -> List[str]:
+    return order_scoped(scoped_links(soup, page_url))
+
+
+def scoped_links_by_select(soup: "BeautifulSoup", page_url: str) -> List[List[str]]:
+    # Genel seçici yolu (config'de basit olmayan seçiciler için); aynı linki birden çok kez döndürebilir.
+    excluded_nodes = set()
+    for sel in EXCLUDE_REGION_SELECTORS:
+        for node in soup.select(sel):
+            excluded_nodes.add(node)
+
+    def is_inside_excluded(a_tag) -> bool:
+        parent = a_tag.parent
+        while parent is not None:
+            if parent in excluded_nodes or parent.name in EXCLUDED_TAGS:
+                return True
+            parent = parent.parent
+        return False
+
+    hits: List[List[str]] = []
+    for scope in CONTENT_SCOPES:
+        links: List[str] = []
+        for a in soup.select(scope):
+            href = a.get("href")
+            if not href:
+                continue
+            if is_inside_excluded(a):
+                continue
+            full = urljoin(page_url, href)
+            links.append(full)
+        hits.append(links)
+    return hits
+
+
+def extract_links_by_select(soup: "BeautifulSoup", page_url: str) -> List[str]:
+    return order_scoped(scoped_links_by_select(soup, page_url))
+
+
+def looks_like_product_url(u: str) -> bool:
+    path = urlparse(u).path.lower()
+    if any(h in path for h in PRODUCT_PATH_HINTS):
+        return True
+    segs = [s for s in path.split('/') if s]
+    if segs:
+        last = segs[-1]
+        if len(last) >= 6 and ("-" in last or any(ch.isdigit() for ch in last)):
+            return True
+    return False
+
+
+def parse_filters(s: str) -> List[str]:
+    return [x.strip() for x in s.split(";") if x.strip()]
+
+
+def filter_links(links: List[str], domain: str, include_filter: str, exclude_filter: str) -> List[str]:
+    links = [u for u in links if domain_from(u) == domain]
+    inc = parse_filters(include_filter)
+    exc = parse_filters(exclude_filter)
+
+    def ok(u: str) -> bool:
+        if inc and not any(s in u for s in inc):
+            return False
+        if exc and any(s in u for s in exc):
+            return False
+        if not inc and not looks_like_product_url(u):
+            return False
+        return True
+
+    # aynı ürünün izleme/varyant/fragment farkları tek URL'ye iner; ilk görülen sıra korunur
+    uniq: Dict[str, str] = {}
+    for u in links:
+        if ok(u):
+            uniq.setdefault(url_key(u), clean_url(u))
+    return list(uniq.values())
+
+
+# ---- Sayfalama ---- #
+# "sonraki" stratejileri öncelik sırasıyla; her biri ilk eşleşen etikete bakar, href'i yoksa sıradakine
+# geçilir. Profil (catcher.profiles) bir alan adında hangilerinin işe yaradığını öğrenince yalnızca
+# onlar çalıştırılır.
+NEXT_STRATEGIES = ("link_rel", "a_rel", "a_text", "a_class")
+PAGER_STRATEGIES = NEXT_STRATEGIES + ("numbered", "bump")
+NEXT_TEXTS = ("sonraki", "next", ">", "»")
+NEXT_CLASS_RE = re.compile(r"next|sonraki|pagination__next|page-next")
+
+
+def next_tag(soup: "BeautifulSoup", strategy: str) -> Any:
+    if strategy == "link_rel":
+        return soup.find("link", rel=lambda v: v and "next" in v)
+    if strategy == "a_rel":
+        return soup.find("a", attrs={"rel": "next"})
+    if strategy == "a_text":
+        return soup.find("a", string=lambda t: t and t.strip().lower() in NEXT_TEXTS)
+    return soup.find("a", class_=lambda c: c and NEXT_CLASS_RE.search(c.lower()))
+
+
+def find_next(soup: "BeautifulSoup", page_url: str,
+              strategies: Sequence[str] = NEXT_STRATEGIES) -> Tuple[Optional[str], Optional[str]]:
+    """(sonraki sayfa, onu bulan strateji); bulunamazsa (None, None)."""
+    for strategy in strategies:
+        tag = next_tag(soup, strategy)
+        if tag and tag.get("href"):
+            return urljoin(page_url, tag["href"]), strategy
+    return None, None
+
+
+def next_by_rel_or_class(soup: "BeautifulSoup", page_url: str) -> Optional[str]:
+    return find_next(soup, page_url)[0]
+
+
+def all_numbered_pages(soup: "BeautifulSoup", page_url: str) -> List[str]:
+    pages: List[str] = []
+    for a in soup.select("a[href]"):
+        txt = (a.get_text(strip=True) or "").lower()
+        if txt.isdigit():
+            pages.append(urljoin(page_url, a["href"]))
+    return list(dict.fromkeys(pages))
+
+
+def bump_page_param(url: str) -> Optional[str]:
+    pr = urlparse(url)
+    qs = parse_qs(pr.query)
+    if "page" in qs:
+        try:
+            cur = int(qs["page"][0])
+            qs["page"] = [str(cur + 1)]
+            new_query = urlencode({k: v[0] if isinstance(v, list) else v for k, v in qs.items()})
+            return urlunparse((pr.scheme, pr.netloc, pr.path, pr.params, new_query, pr.fragment))
+        except Exception:
+            return None
+    return None
+
+
+class ListingPage(NamedTuple):
+    links: List[str]          # kapsam içi ham linkler (filtrelenmemiş)
+    next_url: Optional[str]   # rel=next / "sonraki" / next sınıfı
+    numbered: List[str]       # numaralı sayfa linkleri
+    scopes: List[int]         # links ile paralel: linkin geldiği kapsam (CONTENT_SCOPES sırası)
+    next_via: Optional[str]   # next_url'yi bulan strateji (NEXT_STRATEGIES)
+
+
+def parse_listing(html: str, page_url: str, parser: str = DEFAULT_PARSER,
+                  pager: Sequence[str] = PAGER_STRATEGIES) -> ListingPage:
+    """Liste sayfasından yalnızca linkleri ve sayfalama adaylarını çıkarır.
+
+    selectolax kuruluysa BeautifulSoup ağacı hiç kurulmaz (hızlı yol); sonuç bs4 yoluyla aynıdır.
+    `pager` yalnızca istenen sayfalama stratejilerini çalıştırır (öğrenilmiş site profili).
+    """
+    if resolve_parser(parser) == "selectolax":
+        from catcher.lexbor import parse_listing_lexbor
+        return ListingPage(*parse_listing_lexbor(html, page_url, pager))
+    soup = make_soup(html, parser)
+    hits = scoped_links(soup, page_url)
+    next_url, next_via = find_next(soup, page_url, [s for s in NEXT_STRATEGIES if s in pager])
+    return ListingPage(
+        order_scoped(hits),
+        next_url,
+        all_numbered_pages(soup, page_url) if "numbered" in pager else [],
+        scope_indices(hits),
+        next_via,
+    )
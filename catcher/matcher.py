@@ -0,0 +1,92 @@
+"""Derlenmiş çok terimli eşleyici (malzeme/renk/ölçü sözlükleri).
+
+Sözlük bir kez trie biçiminde tek bir regex'e derlenir; metin tek geçişte taranır, her
+konumda yalnızca o konumdaki harfle başlayan dal denenir. Böylece sözlük binlerce terime
+büyüse de sayfa başına maliyet terim sayısıyla doğrusal artmaz. Anlam eski `t in metin`
+döngüsüyle aynıdır: iç içe terimler de bulunur ("polyester" geçen metinde "poly" de sayılır).
+
+Sözlükler config'deki yerleşik listelerden, varsa `DICT_DIR` altındaki metin dosyalarından
+(satır başına bir terim, `#` yorum) genişletilerek yüklenir.
+"""
+
+import os
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+
+from catcher.config import COLOR_HINTS, DICT_DIR, DICT_FILES, MATERIAL_DICT, SIZE_HINTS
+
+BUILTIN_TERMS = {"material": MATERIAL_DICT, "color": COLOR_HINTS, "size": SIZE_HINTS}
+
+
+def trie_pattern(terms: Iterable[str]) -> str:
+    trie: Dict[str, dict] = {}
+    for t in terms:
+        node = trie
+        for ch in t:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        alts = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not alts:
+            return ""
+        body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+        # burada biten bir terim varsa devamı isteğe bağlı; açgözlü ? en uzun terimi seçer
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class TermMatcher:
+    def __init__(self, terms: Iterable[str]):
+        self.terms: List[str] = list(dict.fromkeys(t.strip().lower() for t in terms if t and t.strip()))
+        self.order = {t: i for i, t in enumerate(self.terms)}
+        self._re: Optional["re.Pattern[str]"] = None
+        self._scan: Optional["re.Pattern[str]"] = None
+        if self.terms:
+            pattern = trie_pattern(self.terms)
+            self._re = re.compile(pattern)
+            # önden bakış eşleşmeyi tüketmez: örtüşen terimler de her konumda bulunur
+            self._scan = re.compile(f"(?=({pattern}))")
+        self._closure: Dict[str, List[str]] = {}
+
+    def search(self, text: str) -> bool:
+        """Metinde (küçük harf) herhangi bir terim geçiyor mu."""
+        return self._re is not None and self._re.search(text) is not None
+
+    def findall(self, text: str) -> List[str]:
+        """Metinde (küçük harf) geçen tüm farklı terimler, sözlük sırasıyla."""
+        if self._scan is None:
+            return []
+        hits = set()
+        for longest in set(self._scan.findall(text)):
+            hits.update(self.prefix_terms(longest))
+        return sorted(hits, key=self.order.__getitem__)
+
+    def prefix_terms(self, term: str) -> List[str]:
+        # aynı konumda başlayan daha kısa terimler en uzun eşleşmenin önekleridir
+        out = self._closure.get(term)
+        if out is None:
+            out = [term[:i] for i in range(1, len(term) + 1) if term[:i] in self.order]
+            self._closure[term] = out
+        return out
+
+
+def read_terms(path: str) -> List[str]:
+    with open(path, encoding="utf-8") as fh:
+        return [ln.strip() for ln in fh if ln.strip() and not ln.lstrip().startswith("#")]
+
+
+def load_terms(kind: str, dict_dir: str = DICT_DIR) -> List[str]:
+    terms = list(BUILTIN_TERMS[kind])
+    path = os.path.join(dict_dir, DICT_FILES[kind])
+    if os.path.isfile(path):
+        terms.extend(read_terms(path))
+    return terms
+
+
+@lru_cache(maxsize=None)
+def term_matcher(kind: str) -> TermMatcher:
+    """"material" | "color" | "size" sözlüğünün derlenmiş eşleyicisi (süreç başına bir kez)."""
+    return TermMatcher(load_terms(kind))
@@ -0,0 +1,243 @@
+"""Ürün görsellerini indirme aşaması.
+
+Satır yazıldıktan sonra ürünün `image_urls`'i kuyruğa girer; `workers` kadar thread görselleri
+`stream_raw` ile parça parça diske akıtır (host hız sınırı ve yeniden denemeler geçerli, önbellek
+yok). Content-Type'ı `image/*` olmayan yanıtlar (CDN hata sayfaları) saklanmaz, alınamadı sayılır.
+Dosya indirilirken sha256'sı hesaplanır ve `<ilk 2>/<özet>.<uzantı>` adıyla saklanır: aynı içerik
+farklı adreslerden gelse de bir kez yazılır.
+
+Aynı görselin CDN boyut varyantları (Shopify `_800x`, WordPress `-300x300`, `?width=`, Cloudinary
+`w_400`) `image_key` ile tek anahtara düşer; ürün başına en büyük varyant indirilir. Her (ürün, görsel)
+eşleşmesi `manifest.jsonl`'a yerel yoluyla yazılır. Aynı klasörle yeniden çalışan (ör. `--resume`)
+iş manifesti okur; diskte duran görseller yeniden indirilmez.
+"""
+
+import hashlib
+import json
+import os
+import queue
+import re
+import tempfile
+import threading
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from catcher.config import CDN_SIZE_PARAMS, DEFAULT_IMAGE_WORKERS, IMAGE_MANIFEST, IMAGE_QUEUE_SIZE, MAX_IMAGE_MB, ensure_dir
+from catcher.fetch import stream_raw
+from catcher.metrics import count, timer
+from catcher.models import Product
+from catcher.urls import SeenIndex
+
+STOP = None
+ORIGINAL = 1 << 40  # boyut eki olmayan adres: özgün (en büyük) kabul edilir
+
+SIZE_PARAMS = frozenset(CDN_SIZE_PARAMS)
+# dosya adındaki boyut ekleri: Shopify (_800x, _800x600_crop_center@2x, _grande) ve WordPress (-300x300)
+SHOPIFY_SUFFIX_RE = re.compile(
+    r"_(?:(\d*)x(\d*)|pico|icon|thumb|small|compact|medium|large|grande|original|master)"
+    r"(?:_crop_[a-z]+)?(?:@\dx)?(?=\.[a-z0-9]+$)", re.I)
+WP_SUFFIX_RE = re.compile(r"-(\d{2,4})x(\d{2,4})(?=\.[a-z0-9]+$)", re.I)
+# yol parçası olarak boyut: Cloudinary (/w_400,h_300,c_fill/) ve /800x800/ gibi önbellek klasörleri
+CLOUDINARY_RE = re.compile(r"/(?:[a-z]{1,2}_[^/,]+,)*[wh]_(\d+)(?:,[^/]*)?(?=/)", re.I)
+SIZE_DIR_RE = re.compile(r"/(\d{2,4})x(\d{2,4})(?=/)")
+
+MAGIC = ((b"\xff\xd8\xff", ".jpg"), (b"\x89PNG", ".png"), (b"GIF8", ".gif"), (b"RIFF", ".webp"))
+
+
+def image_key(url: str) -> str:
+    """Boyut varyantlarından bağımsız karşılaştırma anahtarı (indirmede kullanılmaz)."""
+    parts = urlsplit(url.strip())
+    path = SIZE_DIR_RE.sub("", CLOUDINARY_RE.sub("", parts.path))
+    path = WP_SUFFIX_RE.sub("", SHOPIFY_SUFFIX_RE.sub("", path))
+    query = sorted((k, v) for k, v in parse_qsl(parts.query) if k.lower() not in SIZE_PARAMS)
+    return f"{parts.netloc.lower()}{path}" + (f"?{urlencode(query)}" if query else "")
+
+
+def size_hint(url: str) -> int:
+    """Adresteki boyut ipucundan kaba alan; ipucu yoksa ORIGINAL."""
+    parts = urlsplit(url)
+    dims: List[int] = []
+    for rx in (SHOPIFY_SUFFIX_RE, WP_SUFFIX_RE, SIZE_DIR_RE, CLOUDINARY_RE):
+        m = rx.search(parts.path)
+        if m:
+            dims = [int(g) for g in m.groups() if g]
+            if not dims:
+                return 0  # _grande gibi adlandırılmış küçük boy
+            break
+    for k, v in parse_qsl(parts.query):
+        if k.lower() in ("w", "h", "width", "height") and v.isdigit():
+            dims.append(int(v))
+    if not dims:
+        return ORIGINAL
+    return dims[0] * (dims[1] if len(dims) > 1 else dims[0])
+
+
+def pick_variants(urls: List[str]) -> List[Tuple[str, str]]:
+    """[(anahtar, indirilecek adres)]: her görsel bir kez, en büyük varyantıyla, ilk görülme sırasıyla."""
+    best: Dict[str, str] = {}
+    for u in urls:
+        key = image_key(u)
+        cur = best.get(key)
+        if cur is None or size_hint(u) > size_hint(cur):
+            best[key] = u
+    return list(best.items())
+
+
+def sniff_ext(head: bytes, url: str) -> str:
+    for magic, ext in MAGIC:
+        if head.startswith(magic):
+            return ext
+    if head[4:8] == b"ftyp":
+        return ".avif"
+    ext = os.path.splitext(urlsplit(url).path)[1].lower()
+    return ext if re.fullmatch(r"\.[a-z0-9]{2,5}", ext) else ".bin"
+
+
+class ImageStage:
+    """Sınırlı görsel indirme kuyruğu; kuyruk doluyken `submit` bekler (event loop'tan çağrılmamalı)."""
+
+    def __init__(self, root: str, workers: int = DEFAULT_IMAGE_WORKERS, max_bytes: int = MAX_IMAGE_MB * 1024 * 1024):
+        self.root = ensure_dir(root)
+        self.manifest_path = os.path.join(root, IMAGE_MANIFEST)
+        self.max_bytes = max_bytes
+        self.stats = {"downloaded": 0, "duplicates": 0, "skipped": 0, "failed": 0}
+        self._paths: Dict[str, str] = {}  # görsel anahtarı -> köke göre yol
+        self._inflight: Dict[str, threading.Event] = {}
+        self._pairs = SeenIndex(variants=False)  # manifestte zaten olan (ürün, görsel)
+        self._lock = threading.Lock()
+        self._discarding = False  # iş durdu: uçuştaki ürünün kalan görselleri de atlanır
+        self._load_manifest()
+        self._manifest = open(self.manifest_path, "a", encoding="utf-8")
+        self.q: queue.Queue = queue.Queue(maxsize=IMAGE_QUEUE_SIZE)  # geri basınç: tarama görsellerin çok önüne geçmez
+        self._threads = [threading.Thread(target=self._work, daemon=True) for _ in range(max(1, workers))]
+        for t in self._threads:
+            t.start()
+
+    def _load_manifest(self) -> None:
+        if not os.path.exists(self.manifest_path):
+            return
+        with open(self.manifest_path, encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    continue  # çökmede yarım kalmış son satır
+                key = image_key(rec["image"])
+                self._paths[key] = rec["path"]
+                self._pairs.add_key(f"{rec['product']}\t{key}")
+
+    def submit(self, prod: Product) -> None:
+        if prod.image_urls:
+            self.q.put((prod.url, [u for u in prod.image_urls.split("; ") if u]))
+
+    def discard(self) -> int:
+        """İş durdu: sırada bekleyen ürünleri indirmeden atar; atılan sayısı."""
+        self._discarding = True
+        dropped = 0
+        while True:
+            try:
+                self.q.get_nowait()
+            except queue.Empty:
+                return dropped
+            dropped += 1
+            count("image_discarded")
+
+    def _work(self) -> None:
+        while (item := self.q.get()) is not STOP:
+            product_url, urls = item
+            for key, url in pick_variants(urls):
+                if self._discarding:
+                    break
+                try:
+                    with timer("image"):
+                        path = self._resolve(key, url)
+                except Exception:
+                    path = None
+                if path is None:
+                    self._bump("failed")
+                    count("image_failed")
+                    continue
+                self._record(product_url, key, url, path)
+
+    def _bump(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+    def _resolve(self, key: str, url: str) -> Optional[str]:
+        """Görselin yerel yolu: diskte varsa hemen, başka thread indiriyorsa onu bekleyerek, yoksa indirerek."""
+        with self._lock:
+            path = self._paths.get(key)
+            if path is not None and os.path.exists(os.path.join(self.root, path)):
+                self.stats["skipped"] += 1
+                return path
+            event = self._inflight.get(key)
+            owner = event is None
+            if owner:
+                event = self._inflight[key] = threading.Event()
+        if not owner:
+            event.wait()
+            with self._lock:
+                return self._paths.get(key)
+        try:
+            path = self._download(url)
+            if path is not None:
+                with self._lock:
+                    self._paths[key] = path
+            return path
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            event.set()
+
+    def _download(self, url: str) -> Optional[str]:
+        digest = hashlib.sha256()
+        size, head = 0, b""
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".part")
+        chunks = stream_raw(url, "image/")  # HTML hata sayfası görsel diye saklanmasın
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                for chunk in chunks:
+                    if not head:
+                        head = chunk[:16]
+                    size += len(chunk)
+                    if size > self.max_bytes:
+                        return None
+                    digest.update(chunk)
+                    fh.write(chunk)
+            if not size:
+                return None
+            name = digest.hexdigest()
+            rel = os.path.join(name[:2], name + sniff_ext(head, url))
+            final = os.path.join(self.root, rel)
+            if os.path.exists(final):
+                # aynı içerik başka adresten zaten indirilmiş
+                self._bump("duplicates")
+                count("image_duplicates")
+                return rel
+            ensure_dir(os.path.dirname(final))
+            os.replace(tmp, final)
+            tmp = None
+            self._bump("downloaded")
+            count("image_bytes", size)
+            return rel
+        finally:
+            chunks.close()  # sınırda kesildiyse bağlantı hemen bırakılsın
+            if tmp is not None and os.path.exists(tmp):
+                os.remove(tmp)
+
+    def _record(self, product_url: str, key: str, url: str, path: str) -> None:
+        if not self._pairs.add_key(f"{product_url}\t{key}"):
+            return
+        line = json.dumps({"product": product_url, "image": url, "path": path}, ensure_ascii=False)
+        with self._lock:
+            self._manifest.write(line + "\n")
+            self._manifest.flush()
+
+    def close(self) -> Dict[str, int]:
+        """Kuyruktakileri bitirir; sayaçları döndürür."""
+        for _ in self._threads:
+            self.q.put(STOP)
+        for t in self._threads:
+            t.join()
+        self._manifest.close()
+        return dict(self.stats)
@@ -0,0 +1,281 @@
+"""İş ölçümleri: aşama süreleri, HTTP sayaçları ve ilerleme.
+
+Aşamalar (wait / fetch / decode / parse / extract / write) `timer` ile sarılır; süreler kovalı
+histograma yazılır. HTTP katmanı her denemeyi `record_response`, yeniden denemeyi `record_retry`
+ile bildirir (durum kodu, bayt, host başına istek/hata). Kayıt süreç genelidir (`get_metrics`);
+ayrıştırma süreçleri kendi kayıtlarını grup sonucuyla geri yollar (`drain` -> `merge`).
+
+Döküm `.json` uzantılı yola JSON, diğerlerine Prometheus metin biçiminde (node_exporter textfile
+toplayıcısı) yazılır; dosya geçici adla yazılıp yerine taşınır, okuyan yarım dosya görmez.
+"""
+
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from catcher.config import METRIC_BUCKETS, METRIC_STAGES, METRICS_FLUSH_SECS
+from catcher.throttle import host_of
+
+Labels = Tuple[Tuple[str, str], ...]
+Snapshot = Dict[str, Any]
+
+
+class Histogram:
+    __slots__ = ("counts", "total", "n")
+
+    def __init__(self):
+        self.counts = [0] * (len(METRIC_BUCKETS) + 1)  # son kova: +Inf
+        self.total = 0.0
+        self.n = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(METRIC_BUCKETS, value)] += 1
+        self.total += value
+        self.n += 1
+
+    def quantile(self, q: float) -> float:
+        """Yaklaşık değer: sıranın düştüğü kovanın üst sınırı."""
+        rank, seen = q * self.n, 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if c and seen >= rank:
+                return METRIC_BUCKETS[i] if i < len(METRIC_BUCKETS) else float("inf")
+        return 0.0
+
+
+class Metrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.time()
+        self.stages: Dict[str, Histogram] = {}
+        self.counters: Dict[Tuple[str, Labels], float] = {}
+
+    def _observe(self, stage: str, seconds: float) -> None:
+        h = self.stages.get(stage)
+        if h is None:
+            h = self.stages[stage] = Histogram()
+        h.observe(seconds)
+
+    def _count(self, name: str, n: float = 1, **labels: str) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        self.counters[key] = self.counters.get(key, 0) + n
+
+    def observe(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self._observe(stage, seconds)
+
+    def count(self, name: str, n: float = 1, **labels: str) -> None:
+        with self._lock:
+            self._count(name, n, **labels)
+
+    def response(self, url: str, status: Optional[int], nbytes: int, seconds: float) -> None:
+        host = host_of(url)
+        with self._lock:
+            self._observe("fetch", seconds)
+            self._count("http_responses", status=str(status) if status else "error")
+            self._count("domain_requests", domain=host)
+            if nbytes:
+                self._count("http_bytes", nbytes)
+                self._count("domain_bytes", nbytes, domain=host)
+            if not status or status >= 400:
+                self._count("domain_errors", domain=host)
+
+    def retry(self, url: str, reason: str) -> None:
+        with self._lock:
+            self._count("http_retries", reason=reason)
+            self._count("domain_retries", domain=host_of(url))
+
+    def total(self, name: str) -> float:
+        with self._lock:
+            return sum(v for (n, _), v in self.counters.items() if n == name)
+
+    # ---- Süreçler arası taşıma ---- #
+    def snapshot(self) -> Snapshot:
+        with self._lock:
+            return {
+                "started": self.started,
+                "stages": {k: {"count": h.n, "sum": h.total, "buckets": list(h.counts)} for k, h in self.stages.items()},
+                "counters": [{"name": n, "labels": dict(lb), "value": v} for (n, lb), v in self.counters.items()],
+            }
+
+    def drain(self) -> Snapshot:
+        snap = self.snapshot()
+        with self._lock:
+            self.stages.clear()
+            self.counters.clear()
+        return snap
+
+    def merge(self, snap: Snapshot) -> None:
+        with self._lock:
+            for stage, data in snap.get("stages", {}).items():
+                h = self.stages.get(stage)
+                if h is None:
+                    h = self.stages[stage] = Histogram()
+                h.counts = [a + b for a, b in zip(h.counts, data["buckets"])]
+                h.total += data["sum"]
+                h.n += data["count"]
+            for c in snap.get("counters", ()):
+                self._count(c["name"], c["value"], **c["labels"])
+
+    # ---- Raporlama ---- #
+    def summary(self) -> List[str]:
+        """Aşama başına 'ad: n, ort, p95, toplam' satırları; darboğaz toplam süresi en büyük olandır."""
+        with self._lock:
+            stages = dict(self.stages)
+        order = [s for s in METRIC_STAGES if s in stages] + sorted(set(stages) - set(METRIC_STAGES))
+        lines = []
+        for name in order:
+            h = stages[name]
+            if h.n:
+                lines.append(f"{name}: {h.n} × ort {h.total / h.n * 1000:.1f} ms, p95 ≤ {h.quantile(0.95) * 1000:.0f} ms, "
+                             f"toplam {h.total:.1f} s")
+        return lines
+
+    def to_prometheus(self, progress: Optional["Progress"] = None) -> str:
+        snap = self.snapshot()
+        out = ["# HELP catcher_stage_seconds Aşama süresi (sn)", "# TYPE catcher_stage_seconds histogram"]
+        for stage, data in sorted(snap["stages"].items()):
+            cum = 0
+            for bound, c in zip((*METRIC_BUCKETS, "+Inf"), data["buckets"]):
+                cum += c
+                out.append(f'catcher_stage_seconds_bucket{{stage="{stage}",le="{bound}"}} {cum}')
+            out.append(f'catcher_stage_seconds_sum{{stage="{stage}"}} {data["sum"]:.6f}')
+            out.append(f'catcher_stage_seconds_count{{stage="{stage}"}} {data["count"]}')
+        typed = set()
+        for c in sorted(snap["counters"], key=lambda c: (c["name"], sorted(c["labels"].items()))):
+            name = f"catcher_{c['name']}_total"
+            if name not in typed:
+                typed.add(name)
+                out.append(f"# TYPE {name} counter")
+            value = c["value"]
+            out.append(f"{name}{_labels(c['labels'])} {int(value) if float(value).is_integer() else value}")
+        if progress is not None:
+            for key in ("done", "failed", "total"):
+                out.append(f"# TYPE catcher_progress_{key} gauge")
+                out.append(f"catcher_progress_{key} {getattr(progress, key)}")
+        out.append("# TYPE catcher_start_time_seconds gauge")
+        out.append(f"catcher_start_time_seconds {snap['started']:.0f}")
+        return "\n".join(out) + "\n"
+
+    def to_json(self, progress: Optional["Progress"] = None) -> str:
+        snap = self.snapshot()
+        snap["bucket_bounds"] = list(METRIC_BUCKETS)
+        if progress is not None:
+            snap["progress"] = {**asdict(progress), "rate": progress.rate, "eta": progress.eta}
+        return json.dumps(snap, ensure_ascii=False, indent=1)
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    esc = (str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for v in labels.values())
+    return "{" + ",".join(f'{k}="{v}"' for k, v in zip(labels, esc)) + "}"
+
+
+# ----------------------------- Süreç geneli kayıt ----------------------------- #
+_metrics = Metrics()
+
+
+def get_metrics() -> Metrics:
+    return _metrics
+
+
+def reset_metrics() -> Metrics:
+    """Yeni iş (ya da yeni ayrıştırma süreci) için boş kayıt."""
+    global _metrics
+    _metrics = Metrics()
+    return _metrics
+
+
+@contextmanager
+def timer(stage: str) -> Iterator[None]:
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        _metrics.observe(stage, time.perf_counter() - t0)
+
+
+def record_response(url: str, status: Optional[int], nbytes: int, seconds: float) -> None:
+    """Bir HTTP denemesi (status None: bağlantı/zaman aşımı hatası)."""
+    _metrics.response(url, status, nbytes, seconds)
+
+
+def record_retry(url: str, reason: str) -> None:
+    _metrics.retry(url, reason)
+
+
+def count(name: str, n: float = 1, **labels: str) -> None:
+    _metrics.count(name, n, **labels)
+
+
+# ----------------------------- İlerleme ----------------------------- #
+@dataclass
+class Progress:
+    done: int          # biten ürün (hatalılar dahil)
+    failed: int
+    total: int         # taranmak üzere kabul edilen
+    elapsed: float     # sn
+    discovering: bool  # keşif sürüyor; toplam artabilir
+
+    @property
+    def rate(self) -> float:
+        return self.done / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> Optional[float]:
+        if self.discovering or not self.rate:
+            return None
+        return max(0, self.total - self.done) / self.rate
+
+    def describe(self) -> str:
+        total = f"{self.total}+" if self.discovering else str(self.total)
+        parts = [f"{self.done}/{total} ürün"]
+        if self.failed:
+            parts[0] += f" ({self.failed} hatalı)"
+        parts.append(f"{self.rate:.1f}/sn")
+        eta = self.eta
+        if eta is not None:
+            parts.append(f"kalan ~{format_duration(eta)}")
+        elif self.discovering:
+            parts.append("keşif sürüyor")
+        return " · ".join(parts)
+
+
+ProgressFn = Callable[[Progress], None]
+
+
+def format_duration(seconds: float) -> str:
+    s = int(seconds + 0.5)
+    h, rem = divmod(s, 3600)
+    return f"{h}:{rem // 60:02d}:{rem % 60:02d}" if h else f"{rem // 60}:{rem % 60:02d}"
+
+
+class MetricsFile:
+    """Ölçüm dökümünü iş sürerken `every` saniyede bir, sonunda da bir kez yazar."""
+
+    def __init__(self, path: str, every: float = METRICS_FLUSH_SECS):
+        self.path = path
+        self.every = every
+        self._last = 0.0
+        self._lock = threading.Lock()  # ilerleme birden çok thread'den gelir; aynı anda tek yazan
+
+    def maybe_write(self, progress: Optional[Progress] = None) -> None:
+        if time.monotonic() - self._last >= self.every:
+            self.write(progress)
+
+    def write(self, progress: Optional[Progress] = None) -> None:
+        m = _metrics
+        body = m.to_json(progress) if self.path.lower().endswith(".json") else m.to_prometheus(progress)
+        with self._lock:
+            self._last = time.monotonic()
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as fh:
+                fh.write(body)
+            os.replace(tmp, self.path)
@@ -0,0 +1,44 @@
+"""Çıktı kayıt tipleri."""
+
+import sys
+from dataclasses import dataclass, fields
+from operator import attrgetter
+from typing import Optional, Tuple
+
+FETCH_FAILED_NOTE = "HTML alınamadı"
+ERROR_NOTE_PREFIX = "Hata: "
+
+# __slots__: örnek başına __dict__ yok (dataclass slots=True, 3.10+)
+SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**SLOTS)
+class Product:
+    url: str
+    title: Optional[str] = None
+    colors: Optional[str] = None
+    sizes: Optional[str] = None
+    material: Optional[str] = None
+    material_ratio: Optional[str] = None
+    price: Optional[str] = None
+    currency: Optional[str] = None
+    sku: Optional[str] = None
+    brand: Optional[str] = None
+    image_urls: Optional[str] = None
+    raw_note: Optional[str] = None
+    canonical_url: Optional[str] = None  # sayfanın <link rel="canonical"> adresi
+
+
+def is_failed(prod: Product) -> bool:
+    # sayfa alınamadı ya da ayrıştırma patladı: devam edilen işte yeniden denenir
+    note = prod.raw_note or ""
+    return note == FETCH_FAILED_NOTE or note.startswith(ERROR_NOTE_PREFIX)
+
+
+COLUMNS = tuple(f.name for f in fields(Product))
+_row = attrgetter(*COLUMNS)
+
+
+def row_values(prod: Product) -> Tuple[Optional[str], ...]:
+    """Sütun sırasıyla değerler; `astuple`'ın alan başına kopyalayan özyinelemesi olmadan."""
+    return _row(prod)
@@ -0,0 +1,205 @@
+"""Fiyat / stok izleme: değişiklik (delta) modu.
+
+Her gün aynı katalog taranırken ürün başına son bilinen satır ve sayfanın ilgili bölgesinin parmak
+izi (JSON-LD, ürün meta etiketleri, görünen metin ve <img> etiketleri; diğer betikler, stiller ve
+öznitelikler hariç) SQLite'ta tutulur. Parmak izi değişmeyen sayfada çıkarım hiç çalışmaz, son
+bilinen ürün kullanılır. Çıktı tüm katalog değil yalnızca değişikliklerdir:
+
+    new       önceki çalışmada olmayan ürün
+    price     fiyat ya da para birimi değişti (old_price önceki fiyat)
+    changed   başka alanlar değişti (changed_fields hangileri)
+    removed   bu kaynakta önceki çalışmada vardı, bu çalışmada bulunamadı
+
+Ürünler normalleştirilmiş sayfa adresiyle (`url_key`: izleme parametreleri, varyant ve fragment
+farkları atılmış) eşlenir; adres bulunamazsa aynı kaynakta, bu çalışmada henüz görülmemiş aynı SKU'lu
+ürünle eşlenir (adresi değişen ürün kaldırılan + yeni değil, `url` alanı değişmiş sayılır).
+İndirilemeyen sayfa değişiklik sayılmaz ve son bilinen satır korunur.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from catcher.config import OUTPUT_DIR, ensure_dir
+from catcher.metrics import count
+from catcher.models import COLUMNS, Product, is_failed, row_values
+from catcher.urls import url_key
+
+NEW, PRICE, CHANGED, REMOVED = "new", "price", "changed", "removed"
+CHANGES = (NEW, PRICE, CHANGED, REMOVED)
+DELTA_COLUMNS = ("change", "changed_fields", "old_price") + COLUMNS
+PRICE_FIELDS = ("price", "currency")
+_PRICE = COLUMNS.index("price")
+_SKU = COLUMNS.index("sku")
+
+# ---- Parmak izi ---- #
+BLOCK_RE = re.compile(r"<(script|style|noscript|template)\b([^>]*)>(.*?)</\1\s*>|<!--.*?-->", re.S | re.I)
+PRODUCT_META_RE = re.compile(r"""<meta\b[^>]*(?:og:|product:|twitter:|itemprop)[^>]*>""", re.I)
+IMG_RE = re.compile(r"<img\b[^>]*>", re.I)
+TAG_RE = re.compile(r"<[^>]+>")
+
+Row = Tuple[Optional[str], ...]
+
+
+def fingerprint(html: str) -> str:
+    """Çıkarımın okuduğu bölgelerin özeti; oturum jetonu, sayaç betikleri gibi gürültü dışarıda."""
+    h = hashlib.blake2b(digest_size=16)
+    ld: List[str] = []
+
+    def strip(m: "re.Match") -> str:
+        if m.group(1) and "ld+json" in m.group(2).lower():
+            ld.append(m.group(3))
+        return " "
+
+    rest = BLOCK_RE.sub(strip, html)
+    for part in ld:
+        h.update(part.strip().encode("utf-8", "replace"))
+    for m in PRODUCT_META_RE.finditer(rest):
+        h.update(m.group(0).encode("utf-8", "replace"))
+    for m in IMG_RE.finditer(rest):
+        h.update(m.group(0).encode("utf-8", "replace"))
+    h.update(" ".join(TAG_RE.sub(" ", rest).split()).encode("utf-8", "replace"))
+    return h.hexdigest()
+
+
+def monitor_path(name: str) -> str:
+    # düz bir isim verilirse OUTPUT_DIR/monitor/<isim>.sqlite; yol verilirse olduğu gibi
+    if os.sep in name or (os.altsep and os.altsep in name) or name.endswith((".sqlite", ".db")):
+        return name
+    return os.path.join(OUTPUT_DIR, "monitor", f"{name}.sqlite")
+
+
+class MonitorState:
+    def __init__(self, path: str, source: str):
+        self.path = path
+        self.source = source
+        self.stats: Dict[str, int] = {c: 0 for c in CHANGES}
+        self.stats.update(same=0, skipped=0)
+        self._pending: Dict[str, str] = {}  # url -> bu çalışmada hesaplanan parmak izi
+        self._lock = threading.Lock()
+        ensure_dir(os.path.dirname(os.path.abspath(path)))
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS items ("
+            " key TEXT PRIMARY KEY, source TEXT, url TEXT, fingerprint TEXT, row TEXT, run INTEGER, sku TEXT)"
+        )
+        if "sku" not in {r[1] for r in self._db.execute("PRAGMA table_info(items)")}:
+            self._add_sku_column()
+        self._db.execute("CREATE INDEX IF NOT EXISTS items_source ON items (source, run)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS items_sku ON items (source, sku)")
+        row = self._db.execute("SELECT value FROM meta WHERE key='run'").fetchone()
+        self.run = int(row[0]) + 1 if row else 1
+        self._db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('run', ?)", (str(self.run),))
+        self._fps = {k: fp for k, fp in self._db.execute("SELECT key, fingerprint FROM items") if fp}
+
+    def _add_sku_column(self) -> None:
+        # SKU eşlemesinden önceki durum dosyası: sütun eklenir, satırlardan doldurulur
+        self._db.execute("ALTER TABLE items ADD COLUMN sku TEXT")
+        rows = self._db.execute("SELECT key, row FROM items").fetchall()
+        self._db.executemany("UPDATE items SET sku=? WHERE key=?", [(json.loads(r)[_SKU], k) for k, r in rows])
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def unchanged(self, url: str, html: str) -> Optional[Product]:
+        """Parmak izi son çalışmadakiyle aynıysa son bilinen ürün (çıkarım atlanır); değilse None."""
+        fp = fingerprint(html)
+        key = url_key(url)
+        with self._lock:
+            self._pending[url] = fp
+            if self._fps.get(key) != fp:
+                return None
+            row = self._db.execute("SELECT row FROM items WHERE key=?", (key,)).fetchone()
+        if row is None:
+            return None
+        count("monitor_skipped")
+        self._tally("skipped")
+        prod = Product(*json.loads(row[0]))
+        prod.url = url
+        return prod
+
+    def record(self, prod: Product) -> Optional[Row]:
+        """Ürünü son bilinen satırla karşılaştırıp saklar; değiştiyse delta satırı."""
+        key = url_key(prod.url)
+        moved = False
+        with self._lock:
+            fp = self._pending.pop(prod.url, None)
+            old = self._db.execute("SELECT row FROM items WHERE key=?", (key,)).fetchone()
+            if is_failed(prod):
+                # alınamayan sayfa kaldırılmış sayılmaz; son bilinen satır korunur
+                self._db.execute("UPDATE items SET run=?, source=? WHERE key=?", (self.run, self.source, key))
+                return None
+            if old is None and prod.sku:
+                # adresi değişmiş olabilir: aynı kaynakta bu çalışmada görülmemiş aynı SKU
+                hit = self._db.execute("SELECT key, row FROM items WHERE source=? AND sku=? AND run<? LIMIT 1",
+                                       (self.source, prod.sku, self.run)).fetchone()
+                if hit is not None:
+                    self._db.execute("DELETE FROM items WHERE key=?", (hit[0],))
+                    self._fps.pop(hit[0], None)
+                    old, moved = (hit[1],), True
+            values = row_values(prod)
+            self._db.execute(
+                "INSERT OR REPLACE INTO items (key, source, url, fingerprint, row, run, sku) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, self.source, prod.url, fp, json.dumps(values, ensure_ascii=False), self.run, prod.sku),
+            )
+            if fp:
+                self._fps[key] = fp
+            else:
+                self._fps.pop(key, None)
+        if old is None:
+            return self._delta(NEW, (), None, values)
+        before = json.loads(old[0])
+        changed = [c for c, a, b in zip(COLUMNS, before, values) if (c != "url" or moved) and a != b]
+        if not changed:
+            self._tally("same")
+            return None
+        kind = PRICE if any(c in PRICE_FIELDS for c in changed) else CHANGED
+        return self._delta(kind, changed, before[_PRICE], values)
+
+    def removed(self) -> Iterator[Row]:
+        """Bu kaynakta önceki çalışmalarda olup bu çalışmada görülmeyen ürünler (depodan silinir)."""
+        with self._lock:
+            rows = self._db.execute("SELECT key, row FROM items WHERE source=? AND run<?",
+                                    (self.source, self.run)).fetchall()
+            self._db.execute("DELETE FROM items WHERE source=? AND run<?", (self.source, self.run))
+            for key, _ in rows:
+                self._fps.pop(key, None)
+        for _, row in rows:
+            values = tuple(json.loads(row))
+            yield self._delta(REMOVED, (), values[_PRICE], values)
+
+    def _delta(self, kind: str, changed: Sequence[str], old_price: Optional[str], values: Row) -> Row:
+        self._tally(kind)
+        count("monitor_changes", change=kind)
+        return (kind, ";".join(changed) or None, old_price) + tuple(values)
+
+    def _tally(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+
+# ----------------------------- Süreç geneli durum ----------------------------- #
+_state: Optional[MonitorState] = None
+
+
+def use_monitor(state: Optional[MonitorState]) -> None:
+    global _state
+    _state = state
+
+
+def monitoring() -> bool:
+    return _state is not None
+
+
+def unchanged_product(url: str, html: str) -> Optional[Product]:
+    """İzleme açıksa ve sayfa değişmediyse son bilinen ürün."""
+    state = _state
+    return state.unchanged(url, html) if state is not None else None
@@ -0,0 +1,55 @@
+"""İş seçenekleri (GUI, CLI ve kütüphane kullanımı için ortak)."""
+
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence
+
+from catcher.config import (
+    DEFAULT_CACHE_MAX_MB, DEFAULT_CACHE_MODE, DEFAULT_CACHE_TTL, DEFAULT_CONCURRENCY, DEFAULT_IMAGE_WORKERS, DEFAULT_MAX_PAGES, DEFAULT_MAX_PRODUCTS, DEFAULT_PAGE_PREFETCH,
+    DEFAULT_HOST_RATE, DEFAULT_MAX_BODY_MB, DEFAULT_PARSE_BATCH, DEFAULT_PARSER, DEFAULT_PER_HOST, DEFAULT_WORKERS, OUTPUT_DIR, RESPECT_ROBOTS,
+)
+from catcher.export import DEFAULT_FORMATS
+
+
+@dataclass
+class JobOptions:
+    category_url: Optional[str] = None
+    urls: List[str] = field(default_factory=list)
+    sitemap_url: Optional[str] = None       # site ya da site haritası URL'si (ürünler haritadan keşfedilir)
+    since: Optional[float] = None           # site haritası: <lastmod>'u bundan (epoch) eski URL'ler atlanır
+    max_pages: int = DEFAULT_MAX_PAGES
+    max_products: int = DEFAULT_MAX_PRODUCTS
+    include_filter: str = ""
+    exclude_filter: str = ""
+    output_dir: str = OUTPUT_DIR
+    output_path: Optional[str] = None  # dosya (.xlsx/.csv/.jsonl/.parquet) ya da klasör
+    formats: Sequence[str] = DEFAULT_FORMATS  # "xlsx" | "csv" | "jsonl" | "parquet"
+    workers: int = DEFAULT_WORKERS          # threads motoru
+    engine: str = "async"                   # "async" | "threads"
+    concurrency: int = DEFAULT_CONCURRENCY  # async motor: toplam uçuştaki istek
+    per_host: int = DEFAULT_PER_HOST        # async motor: host başına bağlantı
+    page_prefetch: int = DEFAULT_PAGE_PREFETCH  # aynı anda indirilen liste sayfası
+    rate: float = DEFAULT_HOST_RATE         # host başına başlangıç hızı (istek/sn, uyarlanır); 0 = sınırsız
+    robots: bool = RESPECT_ROBOTS           # robots.txt Crawl-delay'e uy
+    max_body_mb: int = DEFAULT_MAX_BODY_MB  # yanıt gövdesi bundan büyükse kesilir; 0 = sınırsız
+    fast_fields: Sequence[str] = ()         # hızlı yol: head'deki JSON-LD bu alanları dolduruyorsa gövde atlanır
+    parser: str = DEFAULT_PARSER            # "auto" | "html.parser" | "lxml" | "selectolax"
+    parse_processes: int = 0                # >0: ürün sayfaları bu kadar süreçte ayrıştırılır
+    parse_batch: int = DEFAULT_PARSE_BATCH  # süreç havuzuna tek seferde gönderilen sayfa
+    cache: str = DEFAULT_CACHE_MODE         # "off" | "on" | "offline"
+    cache_ttl: float = DEFAULT_CACHE_TTL    # saniye; sonrası koşullu yenileme
+    cache_max_mb: int = DEFAULT_CACHE_MAX_MB
+    cache_path: Optional[str] = None        # varsayılan: OUTPUT_DIR/cache/http_cache.sqlite
+    journal: Optional[str] = None           # iş günlüğü: isim (OUTPUT_DIR/jobs/<isim>.sqlite) ya da yol
+    resume: bool = False                    # günlükteki işe kaldığı yerden devam et
+    fresh: bool = False                     # dolu günlüğü silip baştan başla (resume yokken zorunlu)
+    collapse_canonical: bool = False        # rel=canonical adresi aynı olan ürünleri tek satıra indir
+    keep_products: bool = True              # False: satırlar yalnızca dosyalara akar (sabit bellek)
+    images: bool = False                    # galeri görsellerini indir (içerik özetiyle tekilleştirilir)
+    images_dir: Optional[str] = None        # varsayılan: çıktı dosyalarının yanında images/
+    image_workers: int = DEFAULT_IMAGE_WORKERS
+    metrics_path: Optional[str] = None      # ölçüm dökümü: .json ya da Prometheus metni (.prom), iş sürerken yenilenir
+    profiles: bool = True                   # alan adı başına öğrenilen site profilleriyle sezgileri kısalt
+    profiles_path: Optional[str] = None     # varsayılan: OUTPUT_DIR/site_profiles.json
+    deadline: float = 0.0                   # işin toplam süresi (sn): dolunca yeni URL alınmaz, uçuştakiler biter; 0 = sınırsız
+    url_timeout: float = 0.0                # URL başına indirme süresi (yeniden denemeler dahil, sn); 0 = sınırsız
+    monitor: Optional[str] = None           # izleme: durum adı (OUTPUT_DIR/monitor/<isim>.sqlite) ya da yol; yalnızca değişiklikler yazılır
@@ -0,0 +1,107 @@
+"""HTML ayrıştırma yardımcıları (JSON-LD, meta, metin)."""
+
+import json
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from catcher.config import DEFAULT_PARSER, PARSER_PREFERENCE
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+
+@lru_cache(maxsize=None)
+def parser_available(name: str) -> bool:
+    module = {"html.parser": None, "lxml": "lxml", "selectolax": "selectolax.lexbor"}.get(name)
+    if module is None:
+        return name == "html.parser"
+    try:
+        __import__(module)
+    except ImportError:
+        return False
+    return True
+
+
+def resolve_parser(name: str = DEFAULT_PARSER) -> str:
+    """"auto" kurulu en hızlı arka ucu seçer; kurulu olmayan bir arka uç html.parser'a düşer."""
+    if name == "auto":
+        return next(p for p in PARSER_PREFERENCE if parser_available(p))
+    return name if parser_available(name) else "html.parser"
+
+
+META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset=["']?([A-Za-z0-9_\-]+)""", re.I)
+
+
+def decode_html(body: bytes, charset: Optional[str] = None) -> str:
+    """Ham yanıtı çözer: önce başlıktaki charset, yoksa <meta charset>, en son utf-8."""
+    if not charset:
+        m = META_CHARSET_RE.search(body[:4096])
+        charset = m.group(1).decode("ascii") if m else None
+    if charset:
+        try:
+            return body.decode(charset, errors="replace")
+        except LookupError:
+            pass
+    return body.decode("utf-8", errors="replace")
+
+
+HEAD_END_RE = re.compile(r"</head\s*>", re.I)
+
+
+def head_section(html: str) -> Optional[str]:
+    """`</head>`'e kadarki kısım; belge head'i kapatmıyorsa None."""
+    m = HEAD_END_RE.search(html)
+    return html[:m.end()] if m else None
+
+
+def make_soup(html: str, parser: str = DEFAULT_PARSER) -> "BeautifulSoup":
+    # bs4 yalnızca ilk ayrıştırmada yüklenir
+    from bs4 import BeautifulSoup
+    parser = resolve_parser(parser)
+    if parser == "selectolax":
+        # bs4 ağacı istenmişse lexbor kullanılamaz; en hızlı bs4 oluşturucusu
+        parser = "lxml" if parser_available("lxml") else "html.parser"
+    return BeautifulSoup(html, parser)
+
+
+def json_ld_product(txt: Optional[str]) -> Optional[Dict[str, Any]]:
+    try:
+        blob = json.loads(txt)
+    except Exception:
+        return None
+    candidates = blob if isinstance(blob, list) else [blob]
+    for item in candidates:
+        if not isinstance(item, dict):
+            continue
+        t = item.get("@type")
+        if t == "Product" or (isinstance(t, list) and "Product" in t):
+            return dict(item)
+    return None
+
+
+def parse_json_ld(soup: "BeautifulSoup") -> Dict[str, Any]:
+    for sc in soup.find_all("script", type=lambda t: t and "ld+json" in t):
+        item = json_ld_product(sc.string or sc.text)
+        if item is not None:
+            return item
+    return {}
+
+
+def text_or_none(x: Any) -> Optional[str]:
+    if x is None:
+        return None
+    if isinstance(x, (list, tuple)):
+        try:
+            return "; ".join([str(i) for i in x if i])
+        except Exception:
+            return str(x)
+    return str(x).strip() or None
+
+
+def find_meta(soup: "BeautifulSoup", names: List[str]) -> Optional[str]:
+    for n in names:
+        tag = soup.find("meta", attrs={"property": n}) or soup.find("meta", attrs={"name": n})
+        if tag and tag.get("content"):
+            return tag["content"].strip()
+    return None
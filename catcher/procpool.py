@@ -0,0 +1,98 @@
+"""Süreç havuzunda ayrıştırma aşaması.
+
+İndirme I/O işi, ayrıştırma + `infer_*` ise CPU işi; thread'lerde GIL yüzünden tek çekirdeğe
+sıkışır. Bu aşamada fetcher'lar ham gövdeyi (bytes) verir, sayfalar `batch_size`'lık gruplar
+halinde süreçlere gönderilir ve geriye `Product` kayıtları (ve sürecin aşama ölçümleri) döner. Grup başına tek pickle turu
+olduğu için IPC maliyeti sayfa başına bölünür. Uçuştaki grup sayısı sınırlıdır; ayrıştırma
+geride kalırsa `submit` bekler ve ham HTML bellekte birikmez.
+"""
+
+import signal
+import threading
+from concurrent.futures import Future
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from catcher.config import DEFAULT_PARSE_BATCH, DEFAULT_PARSER
+from catcher.extract import error_product, extract_product
+from catcher.metrics import Snapshot, get_metrics, reset_metrics, timer
+from catcher.models import Product
+from catcher.monitor import use_monitor
+from catcher.parsing import decode_html
+from catcher.profiles import use_profiles
+
+Batch = List[Tuple[str, bytes, Optional[str]]]
+
+
+def extract_batch(batch: Batch, parser: str, fast: Sequence[str] = ()) -> Tuple[List[Product], Snapshot]:
+    out: List[Product] = []
+    for url, body, charset in batch:
+        try:
+            with timer("decode"):
+                html = decode_html(body, charset)
+            out.append(extract_product(url, html, parser, fast))
+        except Exception as e:
+            out.append(error_product(url, e))
+    # bu süreçte biriken aşama süreleri ana sürece taşınır
+    return out, get_metrics().drain()
+
+
+def init_process() -> None:
+    # fork ile ana sürecin ölçümleri, profil deposu ve izleme durumu (sqlite bağlantısı, kilit) kopyalanır;
+    # süreç boş kayıtla, profilsiz ve izlemesiz başlasın: değişmeyen sayfa kararı ana süreçte verilir
+    # Ctrl+C tüm süreç grubuna gider; durdurmaya ana süreç karar verir, kuyruktaki gruplar ayrıştırılır
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    reset_metrics()
+    use_profiles(None)
+    use_monitor(None)
+
+
+class ProcessParseStage:
+    def __init__(self, processes: int, on_result: Callable[[Product], None],
+                 batch_size: int = DEFAULT_PARSE_BATCH, parser: str = DEFAULT_PARSER, fast: Sequence[str] = ()):
+        from concurrent.futures import ProcessPoolExecutor  # multiprocessing yalnızca gerekince yüklenir
+        self.pool = ProcessPoolExecutor(max_workers=processes, initializer=init_process)
+        self.on_result = on_result
+        self.batch_size = max(1, batch_size)
+        self.parser = parser
+        self.fast = tuple(fast)
+        self._slots = threading.BoundedSemaphore(processes * 2)
+        self._lock = threading.Lock()
+        self._pending: Batch = []
+
+    def submit(self, url: str, body: bytes, charset: Optional[str]) -> None:
+        with self._lock:
+            self._pending.append((url, body, charset))
+            if len(self._pending) < self.batch_size:
+                return
+            batch, self._pending = self._pending, []
+        self._dispatch(batch)
+
+    def _dispatch(self, batch: Batch) -> None:
+        self._slots.acquire()
+        try:
+            fut = self.pool.submit(extract_batch, batch, self.parser, self.fast)
+        except Exception as e:
+            # havuz çökmüş (BrokenProcessPool) ya da kapanmış: grup kaybolmasın, hata satırı olarak yazılır
+            self._slots.release()
+            for url, _, _ in batch:
+                self.on_result(error_product(url, e))
+            return
+        fut.add_done_callback(lambda f, b=batch: self._done(f, b))
+
+    def _done(self, fut: Future, batch: Batch) -> None:
+        self._slots.release()
+        try:
+            products, snap = fut.result()
+            get_metrics().merge(snap)
+        except Exception as e:
+            # süreç çöktüyse (BrokenProcessPool vb.) grup satırları hata notuyla yazılır
+            products = [error_product(url, e) for url, _, _ in batch]
+        for p in products:
+            self.on_result(p)
+
+    def close(self) -> None:
+        with self._lock:
+            batch, self._pending = self._pending, []
+        if batch:
+            self._dispatch(batch)
+        self.pool.shutdown(wait=True)
@@ -0,0 +1,204 @@
+"""Alan adı başına öğrenilen site profilleri.
+
+Sezgiler her sayfada tüm yedekleri baştan dener: bütün `CONTENT_SCOPES`, dört "sonraki" stratejisi,
+numaralı sayfalar ve `?page=N`, JSON-LD → meta → metin çıkarımı, galeri taraması. Profil her
+alan adında neyin kazandığını sayar (`observe`); aynı seçim art arda `PROFILE_MIN_STREAK` sayfada
+kazanınca öğrenilir ve sonraki sayfalar (ve sonraki çalışmalar) yalnızca onu çalıştırır:
+
+    scope     ürün linklerinin geldiği kapsam (CONTENT_SCOPES sırası)
+    pager     yeni ürün getiren sayfanın bulunduğu strateji (link_rel, a_rel, a_text, a_class,
+              numbered, bump); diğer adaylar hesaplanmaz ve boşuna indirilmez
+    title …   alan kaynakları (ld, meta, heading, text, gallery, page, none); hepsi <head>'de
+              bulunuyorsa ürün sayfası head'den sonra kesilir, metin gerekmiyorsa blok metni
+              toplanmaz, görseller JSON-LD'den geliyorsa galeri aranmaz
+
+Profil yolu tutmazsa (kapsam ürün vermedi, sayfalama bitti gibi görünürken tam sezgi aday buldu,
+tam çıkarım başka kaynak seçti) `miss` sayılır; art arda `PROFILE_MAX_MISSES` kez tutmayan seçim
+unutulur ve yeniden öğrenilir. Site yavaşça değişirse fark edilsin diye profilli sayfaların ~1/N'i
+(`PROFILE_AUDIT_EVERY`, URL'ye göre sabit) yine tam sezgilerle işlenir.
+
+Profiller `output/site_profiles.json`'da durur; iş sonunda `save_profiles` ile yazılır (başka
+süreçlerin öğrendiği alan adları korunur). Ayrıştırma süreçleri (--parse-processes) profil
+kullanmaz.
+"""
+
+import json
+import os
+import threading
+import zlib
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from catcher.config import (
+    OUTPUT_DIR, PROFILE_AUDIT_EVERY, PROFILE_FILENAME, PROFILE_MAX_MISSES, PROFILE_MIN_STREAK, ensure_dir,
+)
+from catcher.metrics import count
+from catcher.throttle import host_of
+
+FIELD_ASPECTS = ("title", "price", "currency", "colors", "sizes", "material", "images")
+TEXT_FIELDS = ("colors", "sizes", "material")
+# head'de (JSON-LD + meta) bulunabilen kaynaklar; hızlı yol `head_product` bunları doldurur. Metin
+# alanlarında "none" yetmez: başka bir sayfada gövde metni doldurabilir.
+HEAD_SOURCES = {
+    "title": ("ld",), "price": ("ld", "meta", "none"), "currency": ("ld", "meta", "none"),
+    "colors": ("ld",), "sizes": ("ld",), "material": ("ld",), "images": ("ld",),
+}
+SKIPPABLE = TEXT_FIELDS + ("images",)
+FIELD_NAMES = {"images": "image_urls"}
+
+_lock = threading.Lock()
+
+
+@dataclass
+class SiteProfile:
+    learned: Dict[str, str] = field(default_factory=dict)
+    streaks: Dict[str, List] = field(default_factory=dict)  # alan -> [seçim, art arda sayı]
+    misses: Dict[str, int] = field(default_factory=dict)
+    dirty: bool = field(default=False, compare=False)
+
+    def choice(self, aspect: str) -> Optional[str]:
+        return self.learned.get(aspect)
+
+    def observe(self, aspect: str, choice: str) -> None:
+        """Tam sezgilerle işlenen sayfada `aspect` için kazanan seçim."""
+        with _lock:
+            known = self.learned.get(aspect)
+            if known is not None:
+                if known == choice:
+                    if self.misses.pop(aspect, None):
+                        self.dirty = True
+                else:
+                    self._miss(aspect)
+                return
+            streak = self.streaks.get(aspect)
+            if streak and streak[0] == choice:
+                streak[1] += 1
+            else:
+                streak = self.streaks[aspect] = [choice, 1]
+            if streak[1] >= PROFILE_MIN_STREAK:
+                self.learned[aspect] = choice
+                del self.streaks[aspect]
+                count("profile_learned", aspect=aspect)
+            self.dirty = True
+
+    def miss(self, aspect: str) -> None:
+        """Profil yolu bu sayfada tutmadı (çağıran tam sezgilere döner)."""
+        with _lock:
+            self._miss(aspect)
+
+    def _miss(self, aspect: str) -> None:
+        count("profile_misses", aspect=aspect)
+        n = self.misses[aspect] = self.misses.get(aspect, 0) + 1
+        if n >= PROFILE_MAX_MISSES:
+            self.learned.pop(aspect, None)
+            self.misses.pop(aspect, None)
+            self.streaks.pop(aspect, None)
+        self.dirty = True
+
+    # ---- ürün sayfası kararları ---- #
+    def head_fields(self) -> Tuple[str, ...]:
+        """Alanların hepsi head'den geliyorsa hızlı yolda dolması beklenen alanlar; değilse ()."""
+        if self.learned.get("ld_head") != "yes":
+            return ()
+        out = []
+        for aspect in FIELD_ASPECTS:
+            src = self.learned.get(aspect)
+            if src not in HEAD_SOURCES[aspect]:
+                return ()
+            if src != "none":
+                out.append(FIELD_NAMES.get(aspect, aspect))
+        return tuple(out)
+
+    def needs_text(self) -> bool:
+        return any(self.learned.get(f) != "ld" for f in TEXT_FIELDS)
+
+    def needs_galleries(self) -> bool:
+        return self.learned.get("images") != "ld"
+
+    def contradicts(self, sources: Dict[str, str]) -> bool:
+        """Atlanan toplama bu sayfada gerekiyor mu: öğrenilen JSON-LD kaynağı boş çıktı."""
+        return any(self.learned.get(a) == "ld" and sources.get(a) != "ld" for a in SKIPPABLE)
+
+
+def audited(url: str) -> bool:
+    """Bu URL profil yerine tam sezgilerle mi işlensin (URL'ye göre sabit: tüm çağrılar aynı kararı verir)."""
+    return zlib.crc32(url.encode("utf-8", "replace")) % PROFILE_AUDIT_EVERY == 0
+
+
+class ProfileStore:
+    def __init__(self, path: str):
+        self.path = path
+        self.profiles: Dict[str, SiteProfile] = self._load()
+
+    def _load(self) -> Dict[str, SiteProfile]:
+        try:
+            with open(self.path, encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return {}
+        out = {}
+        for host, d in data.items():
+            try:
+                out[host] = SiteProfile(learned=dict(d.get("learned", {})), streaks=dict(d.get("streaks", {})),
+                                        misses=dict(d.get("misses", {})))
+            except (AttributeError, TypeError):
+                continue  # elle bozulmuş kayıt: o alan adı baştan öğrenilir
+        return out
+
+    def get(self, url: str) -> SiteProfile:
+        host = host_of(url)
+        with _lock:
+            prof = self.profiles.get(host)
+            if prof is None:
+                prof = self.profiles[host] = SiteProfile()
+            return prof
+
+    def save(self) -> None:
+        with _lock:
+            touched = {h: p for h, p in self.profiles.items() if p.dirty}
+            if not touched:
+                return
+            merged = self._load()  # başka süreçlerin yazdığı alan adları kalsın
+            merged.update(touched)
+            data = {h: {k: v for k, v in asdict(p).items() if k != "dirty"} for h, p in sorted(merged.items())}
+            ensure_dir(os.path.dirname(os.path.abspath(self.path)))
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump(data, fh, ensure_ascii=False, indent=1)
+            os.replace(tmp, self.path)
+            for p in touched.values():
+                p.dirty = False
+
+
+# ----------------------------- Süreç geneli depo ----------------------------- #
+_store: Optional[ProfileStore] = None
+
+
+def profiles_path(path: Optional[str] = None) -> str:
+    return path or os.path.join(OUTPUT_DIR, PROFILE_FILENAME)
+
+
+def use_profiles(path: Optional[str]) -> None:
+    """`path` None ise profiller kapanır; aynı yol yeniden verilirse bellekteki depo korunur."""
+    global _store
+    if path is None:
+        _store = None
+    elif _store is None or _store.path != path:
+        _store = ProfileStore(path)
+
+
+def save_profiles() -> None:
+    if _store is not None:
+        _store.save()
+
+
+def site_profile(url: str) -> Optional[SiteProfile]:
+    return _store.get(url) if _store is not None else None
+
+
+def learned_fast(url: str) -> Tuple[str, ...]:
+    """Profil ürün sayfasının head'de kesilebileceğini söylüyorsa hızlı yol alanları."""
+    prof = site_profile(url)
+    if prof is None or audited(url):
+        return ()
+    return prof.head_fields()
@@ -0,0 +1,167 @@
+"""Bir işin sonuç akışı.
+
+Motorlar (thread / async / süreç havuzu) bulduğu URL'yi `admit`, bitirdiği satırı `emit`
+ile buraya bildirir. Böylece günlük, akış halinde dışa aktarma ve görsel indirme gibi yan işler
+motorların içine dağılmaz. `keep=False` ise satırlar bellekte biriktirilmez (yalnızca sink'e yazılır).
+
+`seen` gezinti ve tarama aşamalarının ortak tekilleştirme indeksidir. `collapse=True` ise her
+yazılan ürün anahtarını (aynı sitedeki `rel=canonical` adresi, yoksa kendi adresi) `written`'a
+kaydeder; anahtarı zaten yazılmış ürün atlanır. Canonical adres `seen`'e de eklenir ve gezinti onu
+bir daha indirmez. Günlükten geri yüklenen satırlar da anahtarlarını kaydeder.
+
+`cancel` işin durdurma işaretidir (catcher.cancel): motorlar `stopped` iken yeni URL almaz, kuyrukta
+kalanları `drop` ile atar; uçuştakiler `emit` edilir.
+
+`monitor` verilirse (izleme modu) sink'e ürünler değil yalnızca son bilinen satıra göre
+değişiklikler (`catcher.monitor` delta satırları) yazılır.
+
+İlerleme (biten / hatalı / toplam) burada sayılır; `progress` verilirse en sık `interval`
+saniyede bir `Progress` anlık görüntüsüyle çağrılır (çağıran thread'de: GUI kendi kuyruğuna atar).
+"""
+
+import threading
+import time
+from typing import List, Optional
+
+from catcher.cancel import CancelToken
+from catcher.export import StreamingExport
+from catcher.config import PROGRESS_INTERVAL
+from catcher.journal import Journal
+from catcher.links import domain_from
+from catcher.media import ImageStage
+from catcher.metrics import Progress, ProgressFn, timer
+from catcher.models import Product, is_failed
+from catcher.monitor import MonitorState
+from catcher.store import ResultStore
+from catcher.urls import SeenIndex
+
+
+class JobRun:
+    def __init__(self, journal: Optional[Journal] = None, sink: Optional[StreamingExport] = None, keep: bool = True,
+                 collapse: bool = False, progress: Optional[ProgressFn] = None, interval: float = PROGRESS_INTERVAL,
+                 images: Optional[ImageStage] = None, monitor: Optional[MonitorState] = None,
+                 cancel: Optional[CancelToken] = None):
+        self.journal = journal
+        self.sink = sink
+        self.images = images
+        self.monitor = monitor
+        self.keep = keep
+        self.collapse = collapse
+        self.seen = SeenIndex()
+        self.written = SeenIndex()  # collapse: yazılan ürünlerin canonical anahtarları
+        self.duplicates = 0  # canonical adresi zaten görülen ürün
+        self.urls: List[str] = []
+        self.products = ResultStore()  # keep=True iken satırlar sütunlu depoda
+        self.skipped = 0  # önceki çalışmada tamamlandığı için atlanan URL
+        self.cancel = cancel if cancel is not None else CancelToken()
+        self.dropped = 0  # iş durduğu için taranmadan atılan URL
+        self.progress = progress
+        self.interval = interval
+        self.done = 0
+        self.failed = 0
+        self.discovering = True  # kaynak tükenene kadar toplam artabilir
+        self.started = time.monotonic()
+        self._last_report = 0.0
+        self._lock = threading.Lock()
+
+    def admit(self, url: str) -> bool:
+        """URL bulundu; taranması gerekiyorsa True."""
+        self.urls.append(url)
+        if self.journal is not None and not self.journal.admit(url):
+            self.skipped += 1
+            return False
+        return True
+
+    @property
+    def stopped(self) -> bool:
+        return self.cancel.stopped
+
+    def drop(self, url: str) -> None:
+        """Kabul edilmiş URL iş durduğu için taranmadı (günlükte `pending` kalır)."""
+        with self._lock:
+            self.dropped += 1
+
+    def emit(self, prod: Product) -> None:
+        with timer("write"):
+            self._store(prod)
+        with self._lock:
+            self.done += 1
+            if is_failed(prod):
+                self.failed += 1
+            now = time.monotonic()
+            due = self.progress is not None and now - self._last_report >= self.interval
+            if due:
+                self._last_report = now
+        if due:
+            self.progress(self.snapshot())
+
+    def _store(self, prod: Product) -> None:
+        # birden çok thread'den çağrılır: tekrar kararı ve sayaç kilit altında, depo / günlük kendi kilitli
+        if self.collapse and self._claim_duplicate(prod):
+            if self.journal is not None:
+                self.journal.skip(prod.url)
+            return
+        if self.keep:
+            self.products.append(prod)
+        if self.journal is not None:
+            self.journal.record(prod)
+        self._write(prod)
+        if self.images is not None:
+            self.images.submit(prod)
+
+    def _claim_duplicate(self, prod: Product) -> bool:
+        with self._lock:
+            if not self.is_duplicate(prod):
+                return False
+            self.duplicates += 1
+            return True
+
+    def _write(self, prod: Product) -> None:
+        if self.monitor is not None:
+            delta = self.monitor.record(prod)
+            if delta is not None and self.sink is not None:
+                self.sink.write_row(delta)
+        elif self.sink is not None:
+            self.sink.write(prod)
+
+    def removed(self) -> None:
+        """İzleme modu: bu çalışmada görülmeyen ürünleri `removed` olarak yazar (kaynak tam gezildiyse)."""
+        for delta in self.monitor.removed() if self.monitor is not None else ():
+            if self.sink is not None:
+                self.sink.write_row(delta)
+
+    def replay(self, prod: Product) -> None:
+        """Önceki çalışmada tamamlanmış satır: günlüğe yeniden yazılmadan çıktıya eklenir."""
+        if self.collapse:
+            with self._lock:
+                self.is_duplicate(prod)  # devam eden çalışma aynı tekilleştirme durumuyla başlasın
+        if self.keep:
+            self.products.append(prod)
+        self._write(prod)
+        if self.images is not None:
+            # çökmeden önce inmemiş görseller tamamlanır; inmiş olanlar manifestten atlanır
+            self.images.submit(prod)
+
+    def discovery_done(self) -> None:
+        self.discovering = False
+
+    def snapshot(self) -> Progress:
+        return Progress(done=self.done, failed=self.failed, total=len(self.urls) - self.skipped - self.dropped,
+                        elapsed=time.monotonic() - self.started, discovering=self.discovering)
+
+    def report(self) -> None:
+        """Son durumu aralığı beklemeden bildirir (iş sonu)."""
+        if self.progress is not None:
+            self.progress(self.snapshot())
+
+    def is_duplicate(self, prod: Product) -> bool:
+        """Ürünün anahtarı daha önce yazıldıysa True; değilse anahtarı kaydeder."""
+        if is_failed(prod):
+            return False  # alınamayan sayfa anahtarı tutmasın: aynı ürünün başka adresi yazılabilir
+        key = prod.url
+        canon = prod.canonical_url
+        # başka siteyi gösteren canonical'a güvenme
+        if canon and domain_from(canon) == domain_from(prod.url):
+            key = canon
+            self.seen.add(canon)  # gezinti canonical adresi ayrıca indirmesin
+        return not self.written.add(key)
@@ -0,0 +1,370 @@
+"""Çok siteli iş zamanlayıcısı.
+
+Birçok kategori / site haritası / URL listesi tek seferde, ortak bir worker havuzuyla taranır.
+Her işin bulduğu URL'ler (iş, host) başına bir şeride (`Lane`) girer; `FairQueue` sıradaki URL'yi
+önce en yüksek öncelikli işlerden, aynı öncelikte ağırlıklı round-robin ile seçer. İş başına
+uçuştaki ürün `budget`, host başına `per_host` ile sınırlıdır: yavaş bir mağaza en fazla kendi payı
+kadar worker tutar, diğerleri beklemeden ilerler. Böylece 40 mağazalık gece işi en yavaş mağaza
+kadar sürer, hepsinin toplamı kadar değil.
+
+Her işin kendi `JobRun`'ı ve çıktı dosyaları vardır; ilerleme, ölçümler ve durdurma işareti
+(`cancel`, `--deadline`) ortaktır: durunca tüm işlerin keşfi kesilir, şeritlerdeki URL'ler atılır.
+
+İş dosyası (satır başına bir iş; # yorum):
+
+    category https://a.example/kategori/elbise   priority=2 budget=4
+    sitemap  https://b.example                   since=2024-05-01 weight=2
+    urls     listeler/c.txt
+    url      https://d.example/urun/1             # tek URL'ler host başına bir işte toplanır
+"""
+
+import os
+import re
+import shlex
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field, replace
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+from catcher.cancel import CancelToken
+from catcher.config import DEFAULT_JOB_WEIGHT, DEFAULT_PER_HOST, LANE_BUFFER
+from catcher.engine import JobResult, StatusFn, _noop, image_dir, iter_links, prepare, stop_message
+from catcher.export import EXPORT_FORMATS, StreamingExport
+from catcher.extract import error_product, scrape_product
+from catcher.fetch import url_deadline
+from catcher.media import ImageStage
+from catcher.metrics import MetricsFile, Progress, ProgressFn, count, reset_metrics, timer
+from catcher.options import JobOptions
+from catcher.profiles import save_profiles
+from catcher.run import JobRun
+from catcher.sitemap import parse_lastmod
+from catcher.throttle import host_of
+
+JOB_KINDS = ("category", "sitemap", "urls", "url")
+
+
+class JobsFileError(ValueError):
+    pass
+
+
+@dataclass
+class SiteJob:
+    name: str
+    category_url: Optional[str] = None
+    sitemap_url: Optional[str] = None
+    urls: List[str] = field(default_factory=list)
+    since: Optional[float] = None
+    priority: int = 0                 # büyük olan önce
+    weight: int = DEFAULT_JOB_WEIGHT  # aynı öncelikteki işler arasında pay
+    budget: int = 0                   # işin aynı anda taranan en fazla ürünü (0: sınırsız)
+
+
+class Lane:
+    __slots__ = ("job", "host", "items", "credit", "run")
+
+    def __init__(self, job: SiteJob, host: str, run: JobRun):
+        self.job = job
+        self.host = host
+        self.run = run
+        self.items: Deque[str] = deque()
+        self.credit = max(1, job.weight)
+
+
+class FairQueue:
+    """Şeritli kuyruk: `get` en yüksek öncelikli, bütçesi ve host'u müsait şeritten URL verir."""
+
+    def __init__(self, per_host: int = DEFAULT_PER_HOST, lane_buffer: int = LANE_BUFFER):
+        self.per_host = max(1, per_host)
+        self.lane_buffer = max(1, lane_buffer)
+        self._cond = threading.Condition()
+        self._lanes: Dict[Tuple[str, str], Lane] = {}
+        self._order: Deque[Lane] = deque()  # round-robin sırası
+        self._job_inflight: Dict[str, int] = {}
+        self._host_inflight: Dict[str, int] = {}
+        self._producers = 0
+
+    def add_producer(self) -> None:
+        with self._cond:
+            self._producers += 1
+
+    def producer_done(self) -> None:
+        with self._cond:
+            self._producers -= 1
+            self._cond.notify_all()
+
+    def put(self, job: SiteJob, run: JobRun, url: str) -> None:
+        host = host_of(url)
+        with self._cond:
+            lane = self._lanes.get((job.name, host))
+            if lane is None:
+                lane = self._lanes[(job.name, host)] = Lane(job, host, run)
+                self._order.append(lane)
+            # şerit doluysa bu işin keşfi bekler (bellek sınırlı); diğer işler etkilenmez
+            while len(lane.items) >= self.lane_buffer:
+                self._cond.wait()
+            lane.items.append(url)
+            self._cond.notify_all()
+
+    def _eligible(self, lane: Lane) -> bool:
+        budget = lane.job.budget
+        return (bool(lane.items)
+                and not (budget and self._job_inflight.get(lane.job.name, 0) >= budget)
+                and self._host_inflight.get(lane.host, 0) < self.per_host)
+
+    def _pick(self) -> Optional[Lane]:
+        best = None
+        for lane in self._order:
+            if self._eligible(lane) and (best is None or lane.job.priority > best.job.priority):
+                best = lane
+        return best
+
+    def get(self) -> Optional[Tuple[Lane, str]]:
+        """Sıradaki (şerit, URL); tüm kaynaklar tükenip şeritler boşalınca None."""
+        with self._cond:
+            while True:
+                lane = self._pick()
+                if lane is not None:
+                    break
+                if not self._producers and not any(ln.items for ln in self._order):
+                    return None
+                self._cond.wait()
+            url = lane.items.popleft()
+            lane.credit -= 1
+            if lane.credit <= 0 or not lane.items:
+                # payını kullanan şerit sıranın sonuna
+                lane.credit = max(1, lane.job.weight)
+                self._order.remove(lane)
+                self._order.append(lane)
+            self._job_inflight[lane.job.name] = self._job_inflight.get(lane.job.name, 0) + 1
+            self._host_inflight[lane.host] = self._host_inflight.get(lane.host, 0) + 1
+            self._cond.notify_all()  # şeritte yer açıldı
+            return lane, url
+
+    def done(self, lane: Lane) -> None:
+        with self._cond:
+            self._job_inflight[lane.job.name] -= 1
+            self._host_inflight[lane.host] -= 1
+            self._cond.notify_all()
+
+
+# ----------------------------- İş dosyası ----------------------------- #
+def job_name(url: str) -> str:
+    slug = re.sub(r"[^a-z0-9]+", "-", url.lower().split("://", 1)[-1]).strip("-")
+    return slug[:60] or "is"
+
+
+def read_url_lines(path: str) -> List[str]:
+    with open(path, encoding="utf-8") as fh:
+        return [ln.strip() for ln in fh if ln.strip() and not ln.lstrip().startswith("#")]
+
+
+def parse_job_line(line: str, base_dir: str = "") -> Tuple[str, str, Dict[str, str]]:
+    parts = shlex.split(line, comments=True)
+    if len(parts) < 2 or parts[0] not in JOB_KINDS:
+        raise JobsFileError(f"anlaşılamadı (tür adres [anahtar=değer…]): {line}")
+    kind, target, opts = parts[0], parts[1], {}
+    for p in parts[2:]:
+        key, sep, value = p.partition("=")
+        if not sep or key not in ("name", "priority", "weight", "budget", "since"):
+            raise JobsFileError(f"bilinmeyen seçenek: {p}")
+        opts[key] = value
+    if kind == "urls" and not os.path.isabs(target):
+        target = os.path.join(base_dir, target)
+    return kind, target, opts
+
+
+def read_jobs_file(path: str) -> List[SiteJob]:
+    jobs: List[SiteJob] = []
+    loose: Dict[str, SiteJob] = {}  # tek `url` satırları: host başına bir iş
+    base_dir = os.path.dirname(os.path.abspath(path))
+    for line in read_url_lines(path):
+        kind, target, opts = parse_job_line(line, base_dir)
+        try:
+            job = SiteJob(name=opts.get("name") or job_name(target if kind != "url" else host_of(target)),
+                          priority=int(opts.get("priority", 0)), weight=max(1, int(opts.get("weight", DEFAULT_JOB_WEIGHT))),
+                          budget=max(0, int(opts.get("budget", 0))))
+        except ValueError:
+            raise JobsFileError(f"sayı bekleniyordu: {line}")
+        if "since" in opts:
+            job.since = parse_lastmod(opts["since"])
+            if job.since is None:
+                raise JobsFileError(f"tarih anlaşılamadı: {opts['since']}")
+        if kind == "url":
+            prev = loose.get(job.name)
+            if prev is None:
+                loose[job.name] = job
+                jobs.append(job)
+            else:
+                job = prev
+            job.urls.append(target)
+            continue
+        if kind == "category":
+            job.category_url = target
+        elif kind == "sitemap":
+            job.sitemap_url = target
+        else:
+            try:
+                job.urls = read_url_lines(target)
+            except OSError as e:
+                raise JobsFileError(f"URL listesi okunamadı: {e}")
+        jobs.append(job)
+    return unique_names(jobs)
+
+
+def jobs_from_urls(urls: Iterable[str]) -> List[SiteJob]:
+    """Düz URL listesini host başına bir işe böler (GUI liste modu)."""
+    by_host: Dict[str, SiteJob] = {}
+    for u in urls:
+        host = host_of(u)
+        job = by_host.get(host)
+        if job is None:
+            job = by_host[host] = SiteJob(name=job_name(host))
+        job.urls.append(u)
+    return unique_names(list(by_host.values()))
+
+
+def unique_names(jobs: List[SiteJob]) -> List[SiteJob]:
+    seen: Dict[str, int] = {}
+    for job in jobs:
+        n = seen.get(job.name, 0) + 1
+        seen[job.name] = n
+        if n > 1:
+            job.name = f"{job.name}-{n}"
+    return jobs
+
+
+# ----------------------------- Çalıştırma ----------------------------- #
+def job_options(base: JobOptions, job: SiteJob) -> JobOptions:
+    return replace(base, category_url=job.category_url, sitemap_url=job.sitemap_url, urls=list(job.urls),
+                   since=job.since if job.since is not None else base.since)
+
+
+def job_paths(base: JobOptions, job: SiteJob, ts: str) -> Dict[str, str]:
+    folder, formats = base.output_dir, base.formats
+    if base.output_path:
+        # resolve_paths gibi: bilinen uzantılı dosya yolu yalnızca o biçimi seçer ve klasörü kullanılır,
+        # aksi halde yol klasördür; her iş kendi adıyla yazar
+        ext = os.path.splitext(base.output_path)[1].lower().lstrip(".")
+        if ext in EXPORT_FORMATS:
+            folder, formats = os.path.dirname(base.output_path) or ".", [ext]
+        else:
+            folder = base.output_path
+    return {fmt: os.path.join(folder, f"{job.name}_{ts}.{fmt}") for fmt in formats}
+
+
+def run_jobs(jobs: List[SiteJob], opts: JobOptions, status: StatusFn = _noop,
+             progress: Optional[ProgressFn] = None, cancel: Optional[CancelToken] = None) -> Dict[str, JobResult]:
+    """İşleri ortak worker havuzuyla (opts.workers thread) adil sırayla tarar; iş adı -> sonuç."""
+    cancel = cancel if cancel is not None else CancelToken()
+    if opts.deadline > 0:
+        cancel.set_deadline(opts.deadline)
+    prepare(opts)
+    reset_metrics()
+    dump = MetricsFile(opts.metrics_path) if opts.metrics_path else None
+    ts = time.strftime("%Y%m%d_%H%M%S")
+    fq = FairQueue(opts.per_host)
+    images = None
+    if opts.images:
+        # tüm işler tek görsel klasörünü paylaşır: siteler arası aynı içerik bir kez iner
+        images = ImageStage(image_dir(opts, job_paths(opts, jobs[0], ts) if jobs else {}), opts.image_workers)
+    runs: Dict[str, Tuple[SiteJob, JobOptions, JobRun]] = {}
+
+    def total() -> Progress:
+        snaps = [r.snapshot() for _, _, r in runs.values()]
+        return Progress(done=sum(s.done for s in snaps), failed=sum(s.failed for s in snaps),
+                        total=sum(s.total for s in snaps), elapsed=max((s.elapsed for s in snaps), default=0.0),
+                        discovering=any(s.discovering for s in snaps))
+
+    def on_progress(_: Progress) -> None:
+        p = total()
+        if progress is not None:
+            progress(p)
+        if dump is not None:
+            dump.maybe_write(p)
+
+    for job in jobs:
+        jopts = job_options(opts, job)
+        sink = StreamingExport(job_paths(opts, job, ts))
+        runs[job.name] = (job, jopts, JobRun(None, sink, keep=opts.keep_products, collapse=opts.collapse_canonical,
+                                             progress=on_progress, images=images, cancel=cancel))
+
+    def producer(job: SiteJob, jopts: JobOptions, run: JobRun) -> None:
+        links = iter_links(jopts, run.seen)
+        try:
+            for url in links:
+                if cancel.stopped:
+                    break
+                if run.admit(url):
+                    fq.put(job, run, url)
+            close = getattr(links, "close", None)
+            if close is not None:
+                close()
+        except Exception as e:
+            status(f"[{job.name}] keşif hatası: {e}")
+        finally:
+            run.discovery_done()
+            fq.producer_done()
+
+    fast = tuple(opts.fast_fields)
+
+    def worker() -> None:
+        while (item := fq.get()) is not None:
+            lane, url = item
+            if cancel.stopped:
+                lane.run.drop(url)
+                fq.done(lane)
+                continue
+            try:
+                with url_deadline(opts.url_timeout):
+                    prod = scrape_product(url, opts.parser, fast)
+            except Exception as e:
+                prod = error_product(url, e)
+            try:
+                lane.run.emit(prod)
+            except Exception as e:
+                # yazma hatası (dosya / ölçüm) worker'ı öldürmesin: havuz küçülür, kalan URL'ler beklerdi
+                count("emit_errors", error=type(e).__name__)
+            finally:
+                fq.done(lane)
+
+    status(f"{len(jobs)} iş ortak {opts.workers} worker ile taranıyor…")
+    producers = []
+    for job, jopts, run in runs.values():
+        fq.add_producer()
+        producers.append(threading.Thread(target=producer, args=(job, jopts, run), daemon=True))
+    pool = [threading.Thread(target=worker, daemon=True) for _ in range(max(1, opts.workers))]
+    paths: Dict[str, Dict[str, str]] = {}
+    image_stats: Dict[str, int] = {}
+    try:
+        for t in producers + pool:
+            t.start()
+        for t in producers + pool:
+            t.join()
+        cancel.set_deadline(0)  # tarama bitti: sonradan dolan süre işleri yarıda kesilmiş saymasın
+    except BaseException:
+        cancel.cancel()  # Ctrl-C / hata: thread'ler yeni URL almasın, dosyalar aşağıda kapanır
+        raise
+    finally:
+        if cancel.stopped:
+            status(stop_message(cancel, sum(r.dropped for _, _, r in runs.values())))
+            if images is not None:
+                images.discard()
+        if images is not None:
+            image_stats = images.close()
+        save_profiles()
+        for name, (_, _, run) in runs.items():
+            with timer("export"):
+                paths[name] = run.sink.close()
+    results: Dict[str, JobResult] = {}
+    for name, (job, _, run) in runs.items():
+        results[name] = JobResult(urls=run.urls, products=run.products, paths=paths[name], errors=run.sink.errors,
+                                  rows=run.sink.rows, images=image_stats,
+                                  image_manifest=images.manifest_path if images is not None else None)
+        status(f"[{name}] {run.sink.rows} satır ({run.failed} hatalı)")
+    final = total()
+    if progress is not None:
+        progress(final)
+    if dump is not None:
+        dump.write(final)
+    return results
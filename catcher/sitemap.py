@@ -0,0 +1,198 @@
+"""Site haritası ile ürün keşfi.
+
+robots.txt'deki `Sitemap:` satırlarından (yoksa `/sitemap.xml`) başlanır; `<sitemapindex>` alt
+haritaları derinlik öncelikli izlenir. Gövde `stream_raw` ile parça parça gelir, gzip'liyse akışta
+açılır ve `XMLPullParser` ile ayrıştırılır; işlenen her `<url>` ağaçtan atıldığı için yüz binlerce
+URL'lik harita da sabit bellekte okunur. Liste sayfası ayrıştırması yoktur.
+
+Ürün URL'leri kategori gezintisiyle aynı `filter_links` kurallarından (alan adı, dahil/hariç,
+`looks_like_product_url`) geçer. `since` verilirse `<lastmod>`'u ondan eski URL'ler ve alt haritalar
+atlanır; `<lastmod>` yazmayanlar her zaman alınır.
+"""
+
+import zlib
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Set
+from urllib.parse import urljoin, urlsplit
+from xml.etree.ElementTree import ParseError, XMLPullParser
+
+from catcher.config import SITEMAP_BATCH, SITEMAP_MAX_DEPTH
+from catcher.fetch import fetch_html, stream_raw
+from catcher.links import domain_from, filter_links
+from catcher.throttle import robots_url
+from catcher.urls import SeenIndex, url_key
+
+URL, SITEMAP = "url", "sitemap"
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+class SitemapEntry(NamedTuple):
+    kind: str  # URL | SITEMAP
+    loc: str
+    lastmod: Optional[float]
+
+
+def parse_lastmod(text: Optional[str]) -> Optional[float]:
+    """W3C tarih/saat ("2024-05-01", "2024-05-01T10:00:00+03:00", "…Z") → epoch; saat dilimsizse UTC."""
+    if not text:
+        return None
+    try:
+        dt = datetime.fromisoformat(text.strip())
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def gunzip_stream(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Gövde gzip'liyse (.xml.gz, Content-Encoding'siz) akışta açar; değilse olduğu gibi verir."""
+    it = iter(chunks)
+    first = b""
+    for first in it:
+        if first:
+            break
+    if not first.startswith(GZIP_MAGIC):
+        if first:
+            yield first
+        yield from it
+        return
+    d = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    yield d.decompress(first)
+    for chunk in it:
+        yield d.decompress(chunk)
+    yield d.flush()
+
+
+def local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def iter_sitemap_xml(chunks: Iterable[bytes]) -> Iterator[SitemapEntry]:
+    """`<url>` ve `<sitemap>` girdilerini belge sırasıyla verir; bozuk XML'de o ana kadar okunanlar kalır."""
+    parser = XMLPullParser(events=("start", "end"))
+    root = None
+    try:
+        for chunk in gunzip_stream(chunks):
+            parser.feed(chunk)
+            for event, elem in parser.read_events():
+                if root is None:
+                    root = elem
+                if event != "end" or elem is root:
+                    continue
+                kind = local_name(elem.tag)
+                if kind not in (URL, SITEMAP):
+                    continue
+                loc = lastmod = None
+                for child in elem:
+                    name = local_name(child.tag)
+                    if name == "loc":
+                        loc = (child.text or "").strip()
+                    elif name == "lastmod":
+                        lastmod = parse_lastmod(child.text)
+                # işlenen girdi ağaçtan atılır; kök yalnızca bu parçada biten girdileri tutar
+                if len(root) and root[0] is elem:
+                    del root[0]
+                else:
+                    elem.clear()
+                if loc:
+                    yield SitemapEntry(kind, loc, lastmod)
+        parser.close()
+    except ParseError:
+        return
+
+
+def sitemaps_from_robots(text: str, base: str) -> List[str]:
+    out: List[str] = []
+    for line in text.splitlines():
+        key, _, value = line.partition(":")
+        if key.strip().lower() == "sitemap" and value.strip():
+            out.append(urljoin(base, value.strip()))
+    return list(dict.fromkeys(out))
+
+
+def is_sitemap_url(url: str) -> bool:
+    path = urlsplit(url).path.lower()
+    return path.endswith((".xml", ".xml.gz", ".gz")) or "sitemap" in path
+
+
+def discover_sitemaps(site_url: str) -> List[str]:
+    """Site haritası adresi verildiyse kendisi; aksi halde robots.txt'dekiler, o da yoksa /sitemap.xml."""
+    if is_sitemap_url(site_url):
+        return [site_url]
+    robots = robots_url(site_url)
+    text = fetch_html(robots)
+    found = sitemaps_from_robots(text, robots) if text else []
+    return found or [urljoin(robots, "/sitemap.xml")]
+
+
+class SitemapCrawl:
+    """Keşif kararları (hangi harita izlenir, hangi URL yeni); indirmeyi `iter_entries` yapar."""
+
+    def __init__(self, site_url: str, max_products: int, include_filter: str, exclude_filter: str,
+                 since: Optional[float] = None, seen: Optional[SeenIndex] = None):
+        self.site_url = site_url
+        self.max_products = max_products
+        self.include_filter = include_filter
+        self.exclude_filter = exclude_filter
+        self.since = since
+        self.dom = domain_from(site_url)
+        self.seen = seen if seen is not None else SeenIndex()  # tarama aşamasıyla paylaşılabilir
+        self.found = 0
+        self.maps = 0           # okunan harita dosyası
+        self.stale = 0          # lastmod'u `since`'ten eski olduğu için atlanan girdi
+        self.visited: Set[str] = set()
+
+    def fresh(self, entry: SitemapEntry) -> bool:
+        if self.since is None or entry.lastmod is None or entry.lastmod >= self.since:
+            return True
+        self.stale += 1
+        return False
+
+    def iter_entries(self, sitemap_url: str, depth: int = 0) -> Iterator[SitemapEntry]:
+        """Haritanın ürün adaylarını verir; indeks ise alt haritalara iner."""
+        key = url_key(sitemap_url, variants=False)
+        if key in self.visited or depth > SITEMAP_MAX_DEPTH:
+            return
+        self.visited.add(key)
+        self.maps += 1
+        for entry in iter_sitemap_xml(stream_raw(sitemap_url)):
+            if not self.fresh(entry):
+                continue
+            if entry.kind == SITEMAP:
+                yield from self.iter_entries(urljoin(sitemap_url, entry.loc), depth + 1)
+            else:
+                yield entry
+
+    def feed(self, locs: List[str]) -> List[str]:
+        """Bir grup adaydan filtreye uyan ve daha önce görülmemiş ürün URL'lerini döndürür."""
+        new: List[str] = []
+        for u in filter_links(locs, self.dom, self.include_filter, self.exclude_filter):
+            if self.found >= self.max_products:
+                break
+            if self.seen.add(u):
+                new.append(u)
+                self.found += 1
+        return new
+
+    def __iter__(self) -> Iterator[str]:
+        for sitemap_url in discover_sitemaps(self.site_url):
+            entries = (e.loc for e in self.iter_entries(sitemap_url))
+            while self.found < self.max_products:
+                batch = list(islice(entries, SITEMAP_BATCH))
+                if not batch:
+                    break
+                yield from self.feed(batch)
+            if self.found >= self.max_products:
+                return
+
+
+def iter_product_links_from_sitemap(site_url: str, max_products: int, include_filter: str, exclude_filter: str,
+                                    since: Optional[float] = None, seen: Optional[SeenIndex] = None) -> Iterator[str]:
+    return iter(SitemapCrawl(site_url, max_products, include_filter, exclude_filter, since, seen))
+
+
+def extract_product_links_from_sitemap(site_url: str, max_products: int, include_filter: str = "",
+                                       exclude_filter: str = "", since: Optional[float] = None) -> List[str]:
+    return list(iter_product_links_from_sitemap(site_url, max_products, include_filter, exclude_filter, since))
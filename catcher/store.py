@@ -0,0 +1,97 @@
+"""Sütunlu sonuç deposu (100 bin+ ürünlük işler için).
+
+Satırlar `Product` nesnesi olarak tutulmaz: her alan ayrı bir listededir, satır başına yalnızca
+alan sayısı kadar işaretçi kalır. Az sayıda farklı değer alan marka, para birimi ve malzeme depo
+başına tek kopyaya indirgenir (intern) ve pandas/Arrow'da kategori / sözlük sütunu olur. Dizin ya da döngüyle istenen satır o an `Product` olarak
+kurulur. Yazıcılar `rows()` ile değer demetlerini, pandas/Arrow sütunları doğrudan alır; orada
+görsel ve ölçü alanları `;` ile birleşik metin değil liste tiplidir.
+"""
+
+import threading
+from collections.abc import Sequence
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from catcher.models import COLUMNS, Product, row_values
+
+LIST_FIELDS = ("image_urls", "sizes")
+LIST_SEP = "; "
+# yalnızca düşük kardinaliteli alanlar: fiyat / not gibi çoğu farklı değerde sözlük bellek kazandırmaz
+INTERNED_FIELDS = frozenset(["brand", "currency", "material"])
+
+Row = Tuple[Optional[str], ...]
+
+
+def split_list(value: Optional[str]) -> Optional[List[str]]:
+    return [v for v in value.split(LIST_SEP) if v] if value else None
+
+
+class ResultStore(Sequence):
+    """`List[Product]` yerine geçer (len / dizin / döngü); `append` birden çok thread'den çağrılabilir."""
+
+    def __init__(self, products: Optional[Any] = None):
+        self._cols: List[List[Optional[str]]] = [[] for _ in COLUMNS]
+        self._interned = [c in INTERNED_FIELDS for c in COLUMNS]
+        self._pool: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        for prod in products or ():
+            self.append(prod)
+
+    def append(self, prod: Product) -> None:
+        self.append_row(row_values(prod))
+
+    def append_row(self, values: Row) -> None:
+        pool = self._pool
+        with self._lock:
+            for col, interned, v in zip(self._cols, self._interned, values):
+                if interned and v is not None:
+                    v = pool.setdefault(v, v)
+                col.append(v)
+
+    def __len__(self) -> int:
+        return len(self._cols[0])
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [Product(*vals) for vals in zip(*(col[index] for col in self._cols))]
+        return Product(*(col[index] for col in self._cols))
+
+    def __iter__(self) -> Iterator[Product]:
+        for vals in self.rows():
+            yield Product(*vals)
+
+    def rows(self) -> Iterator[Row]:
+        """Sütun sırasıyla değer demetleri (Product kurulmadan)."""
+        n = len(self)  # döngü sürerken eklenen satırlar bu turda verilmez
+        return zip(*(col[:n] if len(col) != n else col for col in self._cols))
+
+    def column(self, name: str) -> List[Any]:
+        """Bir alanın değerleri; görsel/ölçü alanları satır başına liste olarak."""
+        col = self._cols[COLUMNS.index(name)]
+        return [split_list(v) for v in col] if name in LIST_FIELDS else col
+
+    def to_arrow(self) -> Any:
+        """pyarrow.Table: marka / para birimi / malzeme sözlük kodlu, görsel/ölçü `list<string>`."""
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise RuntimeError("Arrow için pyarrow kurulu değil (pip install pyarrow)")
+        arrays, names = [], []
+        for name, col, interned in zip(COLUMNS, self._cols, self._interned):
+            if name in LIST_FIELDS:
+                arr = pa.array(self.column(name), pa.list_(pa.string()))
+            else:
+                arr = pa.array(col, pa.string())
+                if interned:
+                    arr = arr.dictionary_encode()
+            arrays.append(arr)
+            names.append(name)
+        return pa.Table.from_arrays(arrays, names=names)
+
+    def to_pandas(self) -> Any:
+        """pandas.DataFrame: marka / para birimi / malzeme `category`, görsel/ölçü liste sütunu."""
+        import pandas as pd
+        df = pd.DataFrame({name: self.column(name) for name in COLUMNS})
+        for name, interned in zip(COLUMNS, self._interned):
+            if interned:
+                df[name] = df[name].astype("category")
+        return df
@@ -0,0 +1,258 @@
+"""Host başına uyarlanır hız sınırı + yeniden deneme sınıflandırması.
+
+Her host'un bir token bucket'ı vardır. `reserve` bir istek hakkı ayırır ve beklenecek süreyi
+döndürür; thread'ler `acquire`, async motor `acquire_async` ile bekler. Host kısıtlandığında
+(429/503) o ana kadarki ayırmalar geçersiz olur: bekleyenler uyanınca yeni hızla yeniden sıraya
+girer, eski hızla planlanmış istekler host'a yığılmaz. Hız AIMD ile ayarlanır: sağlıklı yanıtta `HOST_RATE_STEP` kadar
+artar, 429/503'te `HOST_RATE_BACKOFF` ile çarpılır (aynı tıkanıklık için pencere başına bir kez). `Retry-After` host'u o süre boyunca
+bekletir. robots.txt'teki `Crawl-delay` / `Request-rate` hızın üst sınırı olur.
+
+Yanıtlar dört sınıfa ayrılır: OK, RETRY (5xx, zaman aşımı, bağlantı hatası, boş gövde),
+THROTTLE (429/503, yeniden denenir ve host yavaşlatılır), FATAL (404 gibi kalıcı 4xx, TLS/URL
+hataları). FATAL hemen döner, yeniden denenmez.
+"""
+
+import asyncio
+import email.utils
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from catcher.config import (
+    BACKOFF_BASE, BACKOFF_CAP, DEFAULT_HOST_RATE, HOST_RATE_BACKOFF, HOST_RATE_STEP, MAX_HOST_RATE, MAX_RETRY_AFTER,
+    MIN_HOST_RATE, USER_AGENT,
+)
+
+OK, RETRY, THROTTLE, FATAL = "ok", "retry", "throttle", "fatal"
+ROBOTS_WAIT = 10.0  # robots.txt okunurken diğer isteklerin en fazla bekleyeceği süre
+
+RETRY_STATUSES = frozenset([408, 425, 500, 502, 504, 520, 521, 522, 523, 524])
+THROTTLE_STATUSES = frozenset([429, 503])
+# Kalıcı istisnalar (sınıf adıyla; requests ve aiohttp'yi içe aktarmadan)
+FATAL_ERRORS = frozenset([
+    "SSLError", "ClientSSLError", "ClientConnectorSSLError", "ClientConnectorCertificateError",
+    "InvalidURL", "InvalidSchema", "MissingSchema", "InvalidHeader", "InvalidUrlClientError",
+    "NonHttpUrlClientError", "TooManyRedirects", "TooManyRedirectsError", "UnicodeError",
+])
+
+
+def classify(status: Optional[int], has_body: bool = True, exc: Optional[BaseException] = None,
+             conditional: bool = False) -> str:
+    if exc is not None:
+        names = {k.__name__ for k in type(exc).__mro__}
+        return FATAL if names & FATAL_ERRORS else RETRY
+    if status == 200:
+        return OK if has_body else RETRY
+    if status == 304 and conditional:
+        return OK
+    if status in THROTTLE_STATUSES:
+        return THROTTLE
+    if status in RETRY_STATUSES:
+        return RETRY
+    return FATAL
+
+
+def backoff_delay(attempt: int) -> float:
+    # "full jitter": eşzamanlı worker'lar aynı anda geri dönüp host'u yeniden boğmasın
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * (2 ** attempt)))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return min(float(value), MAX_RETRY_AFTER)
+    try:
+        when = email.utils.parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+    return min(max(0.0, when - time.time()), MAX_RETRY_AFTER)
+
+
+def robots_delay(text: str, user_agent: str = USER_AGENT) -> Optional[float]:
+    """robots.txt içeriğinden istekler arası saniye (Crawl-delay ya da Request-rate).
+
+    urllib.robotparser yalnızca tamsayı Crawl-delay kabul ettiği için ("0.5" yok sayılır) kendi
+    küçük ayrıştırıcımız: grup seçimi robotparser gibi (ürün adı eşleşmesi, yoksa "*").
+    """
+    token = user_agent.split("/")[0].lower()
+    groups: List[Tuple[List[str], Dict[str, str]]] = []
+    agents: List[str] = []
+    rules: Dict[str, str] = {}
+    for raw in text.splitlines():
+        line = raw.split("#", 1)[0].strip()
+        if ":" not in line:
+            continue
+        key, value = (x.strip() for x in line.split(":", 1))
+        key = key.lower()
+        if key == "user-agent":
+            if rules:
+                groups.append((agents, rules))
+                agents, rules = [], {}
+            agents.append(value.lower())
+        elif agents:
+            rules.setdefault(key, value)
+    if agents:
+        groups.append((agents, rules))
+
+    chosen = next((r for a, r in groups if any(x != "*" and x in token for x in a)), None)
+    if chosen is None:
+        chosen = next((r for a, r in groups if "*" in a), {})
+    try:
+        if "crawl-delay" in chosen:
+            return float(chosen["crawl-delay"]) or None
+        if "request-rate" in chosen:
+            n, secs = chosen["request-rate"].split("/")
+            return float(secs.strip().rstrip("s")) / float(n) if float(n) else None
+    except ValueError:
+        return None
+    return None
+
+
+def host_of(url: str) -> str:
+    return urlsplit(url).netloc.lower()
+
+
+def robots_url(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}/robots.txt"
+
+
+class HostBucket:
+    __slots__ = ("rate", "max_rate", "tokens", "burst", "updated", "blocked_until", "cut_at", "epoch")
+
+    def __init__(self, rate: float, max_rate: float, now: float):
+        self.rate = rate
+        self.max_rate = max_rate
+        self.burst = max(1.0, rate)
+        self.tokens = self.burst
+        self.updated = now
+        self.blocked_until = 0.0
+        self.cut_at = float("-inf")
+        self.epoch = 0  # her kısıtlamada artar; eski ayırmaları geçersiz kılar
+
+
+class RateLimiter:
+    def __init__(self, rate: float = DEFAULT_HOST_RATE, min_rate: float = MIN_HOST_RATE,
+                 max_rate: float = MAX_HOST_RATE, respect_robots: bool = True):
+        self.rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.max_rate = max(max_rate, rate)
+        self.respect_robots = respect_robots
+        self._hosts: Dict[str, HostBucket] = {}
+        self._robots: Dict[str, threading.Event] = {}  # host -> robots.txt okundu mu
+        self._lock = threading.Lock()
+
+    def _bucket(self, host: str, now: float) -> HostBucket:
+        b = self._hosts.get(host)
+        if b is None:
+            b = self._hosts[host] = HostBucket(self.rate, self.max_rate, now)
+        return b
+
+    def reserve(self, url: str) -> Tuple[float, int]:
+        """Bir istek hakkı ayırır; (beklenecek saniye, ayırmanın dönemi) döndürür."""
+        now = time.monotonic()
+        with self._lock:
+            b = self._bucket(host_of(url), now)
+            b.tokens = min(b.burst, b.tokens + (now - b.updated) * b.rate)
+            b.updated = now
+            b.tokens -= 1
+            wait = -b.tokens / b.rate if b.tokens < 0 else 0.0
+            return max(wait, b.blocked_until - now), b.epoch
+
+    def _valid(self, url: str, epoch: int) -> bool:
+        with self._lock:
+            b = self._hosts.get(host_of(url))
+            return b is None or b.epoch == epoch
+
+    def _robots_pending(self, url: str) -> Optional[threading.Event]:
+        ev = self._robots.get(host_of(url))
+        return ev if ev is not None and not ev.is_set() else None
+
+    def acquire(self, url: str, sleep: Callable[[float], None] = time.sleep) -> None:
+        ev = self._robots_pending(url)
+        if ev is not None:
+            ev.wait(ROBOTS_WAIT)
+        while True:
+            wait, epoch = self.reserve(url)
+            if wait > 0:
+                sleep(wait)
+            if self._valid(url, epoch):
+                return
+
+    async def acquire_async(self, url: str) -> None:
+        deadline = time.monotonic() + ROBOTS_WAIT
+        while self._robots_pending(url) is not None and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+        while True:
+            wait, epoch = self.reserve(url)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            if self._valid(url, epoch):
+                return
+
+    def feedback(self, url: str, verdict: str, retry_after: Optional[float] = None) -> None:
+        now = time.monotonic()
+        with self._lock:
+            b = self._bucket(host_of(url), now)
+            if verdict == OK:
+                # yanıt başına STEP/rate: hız, trafikten bağımsız olarak saniyede ~STEP artar
+                b.rate = min(b.max_rate, b.rate + HOST_RATE_STEP / b.rate)
+            elif verdict == THROTTLE:
+                # uçuştaki istekler aynı tıkanıklığı birlikte bildirir; bir pencerede tek kez yavaşla
+                if now - b.cut_at >= max(1.0, 1.0 / b.rate):
+                    b.cut_at = now
+                    b.rate = max(self.min_rate, b.rate * HOST_RATE_BACKOFF)
+                    b.burst = max(1.0, min(b.burst, b.rate))
+                if retry_after:
+                    b.blocked_until = max(b.blocked_until, now + retry_after)
+                # bekleyen ayırmalar yeniden sıraya girecek; kovayı boşalt
+                b.tokens = 0.0
+                b.updated = now
+                b.epoch += 1
+
+    def claim_robots(self, url: str) -> bool:
+        """Bu host'un robots.txt'sini okuma görevi ilk çağırana verilir; o bitene kadar diğerleri bekler.
+
+        True dönerse çağıran, sonuçtan bağımsız olarak `robots_done` çağırmalıdır.
+        """
+        if not self.respect_robots:
+            return False
+        host = host_of(url)
+        with self._lock:
+            if host in self._robots:
+                return False
+            self._robots[host] = threading.Event()
+            return True
+
+    def robots_done(self, url: str) -> None:
+        ev = self._robots.get(host_of(url))
+        if ev is not None:
+            ev.set()
+
+    def set_crawl_delay(self, url: str, delay: float) -> None:
+        if delay <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            b = self._bucket(host_of(url), now)
+            b.max_rate = min(b.max_rate, 1.0 / delay)
+            b.rate = min(b.rate, b.max_rate)
+            b.burst = 1.0
+            b.tokens = min(b.tokens, 1.0)
+
+    def host_rate(self, url: str) -> float:
+        with self._lock:
+            b = self._hosts.get(host_of(url))
+            return b.rate if b else self.rate
+
+
+def make_limiter(rate: float, respect_robots: bool = True) -> Optional[RateLimiter]:
+    return RateLimiter(rate, respect_robots=respect_robots) if rate > 0 else None
+
+
+def response_retry_after(headers: Any) -> Optional[float]:
+    return parse_retry_after(headers.get("Retry-After")) if headers is not None else None
@@ -0,0 +1,101 @@
+"""URL normalizasyonu ve tekilleştirme indeksi.
+
+`clean_url` indirilecek URL'yi üretir: fragment ile izleme (utm_*, gclid…) ve varyant (?renk=,
+?size=…) parametreleri atılır, yol olduğu gibi kalır. `url_key` yalnızca karşılaştırma içindir:
+ayrıca şema/host küçük harfe çevrilir, varsayılan port ve sondaki "/" atılır, sorgu sıralanır.
+Böylece aynı ürünün farklı yazımları tek anahtara düşer.
+
+`SeenIndex` anahtarların 64 bitlik özetlerini tutan, thread'ler arası paylaşılan kümedir; gezinti
+ve tarama aşamaları aynı indeksi kullanır, bir ürün iki kez indirilmez.
+"""
+
+import threading
+from hashlib import blake2b
+from typing import FrozenSet, Iterable, Iterator, List, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from catcher.config import TRACKING_PARAMS, VARIANT_PARAMS
+
+DEFAULT_PORTS = {"http": ":80", "https": ":443"}
+
+
+def param_matcher(names: Iterable[str]) -> Tuple[FrozenSet[str], Tuple[str, ...]]:
+    # ("utm_*", "gclid") -> ({"gclid"}, ("utm_",))
+    names = [n.lower() for n in names]
+    return frozenset(n for n in names if not n.endswith("*")), tuple(n[:-1] for n in names if n.endswith("*"))
+
+
+TRACKING = param_matcher(TRACKING_PARAMS)
+VARIANTS = param_matcher(VARIANT_PARAMS)
+
+
+def _dropped(name: str, variants: bool) -> bool:
+    low = name.lower()
+    for exact, prefixes in ((TRACKING, VARIANTS) if variants else (TRACKING,)):
+        if low in exact or low.startswith(prefixes):
+            return True
+    return False
+
+
+def strip_params(query: str, variants: bool = True) -> List[Tuple[str, str]]:
+    return [(k, v) for k, v in parse_qsl(query, keep_blank_values=True) if not _dropped(k, variants)]
+
+
+def clean_url(url: str, variants: bool = True) -> str:
+    """İndirilecek URL: fragment + izleme/varyant parametreleri atılır, geri kalan aynen kalır."""
+    parts = urlsplit(url)
+    query = parts.query
+    if query:
+        pairs = parse_qsl(query, keep_blank_values=True)
+        kept = [(k, v) for k, v in pairs if not _dropped(k, variants)]
+        if len(kept) != len(pairs):
+            query = urlencode(kept)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, query, ""))
+
+
+def url_key(url: str, variants: bool = True) -> str:
+    """Tekilleştirme anahtarı (yalnızca karşılaştırma için; indirmede kullanılmaz)."""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    if netloc.endswith(DEFAULT_PORTS.get(scheme, "\0")):
+        netloc = netloc.rsplit(":", 1)[0]
+    path = parts.path.rstrip("/") or "/"
+    query = urlencode(sorted(strip_params(parts.query, variants))) if parts.query else ""
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+def key_hash(key: str) -> int:
+    return int.from_bytes(blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class SeenIndex:
+    def __init__(self, variants: bool = True):
+        self.variants = variants
+        self._hashes: Set[int] = set()
+        self._lock = threading.Lock()
+
+    def add(self, url: str) -> bool:
+        """İlk kez görülüyorsa ekler ve True döner."""
+        return self.add_key(url_key(url, self.variants))
+
+    def add_key(self, key: str) -> bool:
+        h = key_hash(key)
+        with self._lock:
+            if h in self._hashes:
+                return False
+            self._hashes.add(h)
+            return True
+
+    def __contains__(self, url: str) -> bool:
+        return key_hash(url_key(url, self.variants)) in self._hashes
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def unique(self, urls: Iterable[str]) -> Iterator[str]:
+        """Temizlenmiş ve daha önce görülmemiş URL'ler, geliş sırasıyla."""
+        for u in urls:
+            u = clean_url(u, self.variants)
+            if self.add(u):
+                yield u
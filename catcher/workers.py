@@ -0,0 +1,73 @@
+"""Worker / Threading."""
+
+import queue
+import threading
+from typing import Callable, Optional, Sequence
+
+from catcher.cancel import CancelToken
+from catcher.config import DEFAULT_PARSER
+from catcher.extract import error_product, failed_product, head_check, scrape_product
+from catcher.fetch import fetch_raw, url_deadline
+from catcher.metrics import count
+from catcher.models import Product
+from catcher.monitor import monitoring, unchanged_product
+from catcher.parsing import decode_html
+from catcher.procpool import ProcessParseStage
+
+STOP = None  # kuyruk sonu işareti; her worker bir tane tüketip çıkar
+
+
+class ScrapeWorker(threading.Thread):
+    def __init__(self, in_q: queue.Queue, emit: Callable[[Product], None], parser: str = DEFAULT_PARSER,
+                 stage: Optional[ProcessParseStage] = None, fast: Sequence[str] = (),
+                 cancel: Optional[CancelToken] = None, drop: Optional[Callable[[str], None]] = None,
+                 url_timeout: float = 0.0):
+        super().__init__(daemon=True)
+        self.in_q = in_q
+        self.emit = emit
+        self.parser = parser
+        self.stage = stage  # verilirse worker yalnızca indirir, ayrıştırma süreç havuzunda
+        self.fast = tuple(fast)  # hızlı yolda dolması yeten alanlar (boş: kapalı)
+        self.cancel = cancel  # durunca kuyrukta kalan URL'ler indirilmeden `drop` edilir
+        self.drop = drop
+        self.url_timeout = url_timeout  # URL başına indirme süresi (yeniden denemeler dahil); 0 = sınırsız
+
+    def run(self):
+        while True:
+            url = self.in_q.get()
+            try:
+                if url is STOP:
+                    break
+                if self.cancel is not None and self.cancel.stopped:
+                    if self.drop is not None:
+                        self.drop(url)
+                    continue
+                with url_deadline(self.url_timeout):
+                    try:
+                        if self.stage is not None:
+                            self.fetch_to_stage(url)
+                            continue
+                        prod = scrape_product(url, self.parser, self.fast)
+                    except Exception as e:
+                        # worker ölürse kuyruk dolup üretici kilitlenir; hatayı satıra yaz, devam et
+                        prod = error_product(url, e)
+                try:
+                    self.emit(prod)
+                except Exception as e:
+                    # yazma hatası (günlük / izleme sqlite'ı, ölçüm dosyası) da worker'ı öldürmesin
+                    count("emit_errors", error=type(e).__name__)
+            finally:
+                self.in_q.task_done()
+
+    def fetch_to_stage(self, url: str) -> None:
+        raw = fetch_raw(url, head_check(url, self.parser, self.fast))
+        if raw is None:
+            self.emit(failed_product(url))
+            return
+        if monitoring():
+            # ayrıştırma süreçlerinde izleme durumu yok; parmak izi burada alınır, değişmeyen sayfa buradan döner
+            known = unchanged_product(url, decode_html(*raw))
+            if known is not None:
+                self.emit(known)
+                return
+        self.stage.submit(url, *raw)